@@ -12,7 +12,7 @@ from datetime import timedelta
 from homeassistant.components.tag import async_scan_tag
 import hashlib
 
-from aiohttp import ClientError, ClientResponseError, ClientSession, TCPConnector
+from aiohttp import ClientSession, TCPConnector
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady, PlatformNotReady
@@ -21,9 +21,9 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 
-from custom_components.dahua.thread import DahuaEventThread, DahuaVtoEventThread
+from custom_components.dahua.thread import DahuaVtoEventThread
 from . import dahua_utils
-from .client import DahuaClient
+from .client import DahuaClient, MAX_CONCURRENT_REQUESTS
 
 from .const import (
     CONF_EVENTS,
@@ -38,7 +38,8 @@ from .const import (
     STARTUP_MESSAGE,
     CONF_CHANNEL,
 )
-from .dahua_utils import parse_event
+from .capabilities import async_get_capabilities
+from .event_stream import async_get_event_stream
 from .vto import DahuaVTOClient
 
 SCAN_INTERVAL_SECONDS = timedelta(seconds=30)
@@ -96,8 +97,9 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, events: list, address: str, port: int, rtsp_port: int, username: str,
                  password: str, name: str, channel: int) -> None:
         """Initialize the coordinator."""
-        # Self signed certs are used over HTTPS so we'll disable SSL verification
-        connector = TCPConnector(enable_cleanup_closed=True, ssl=SSL_CONTEXT)
+        # Self signed certs are used over HTTPS so we'll disable SSL verification. The pool is bounded to the max
+        # concurrent API requests plus one long lived connection for the event stream
+        connector = TCPConnector(enable_cleanup_closed=True, ssl=SSL_CONTEXT, limit=MAX_CONCURRENT_REQUESTS + 1)
         self._session = ClientSession(connector=connector)
 
         # The client used to communicate with Dahua devices
@@ -137,8 +139,9 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
         # This is the name as reported from the camera itself
         self.machine_name = ""
 
-        # This thread is what connects to the cameras event stream and fires on_receive when there's an event
-        self.dahua_event_thread = DahuaEventThread(hass, self.client, self.on_receive, events, self._channel)
+        # Every channel of a device shares one event stream which calls on_receive with the events of this channel
+        self._event_stream = async_get_event_stream(hass, address, port)
+        self._event_stream_unsubscribe: CALLBACK_TYPE | None = None
 
         # This thread will connect to VTO devices (Dahua doorbells)
         self.dahua_vto_event_thread = DahuaVtoEventThread(hass, self.client, self.on_receive_vto_event, host=address,
@@ -158,8 +161,16 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_start_event_listener(self):
         """ Starts the event listeners for IP cameras (this does not work for doorbells (VTO)) """
-        if self.events is not None:
-            self.dahua_event_thread.start()
+        if self.events is not None and self._event_stream_unsubscribe is None:
+            self._event_stream_unsubscribe = self._event_stream.async_subscribe(
+                self.client, self._channel, self.events, self.on_receive
+            )
+
+    def async_stop_event_listener(self):
+        """ Stops the event listeners for IP cameras """
+        if self._event_stream_unsubscribe is not None:
+            self._event_stream_unsubscribe()
+            self._event_stream_unsubscribe = None
 
     async def async_start_vto_event_listener(self):
         """ Starts the event listeners for doorbells (VTO). This will not work for IP cameras"""
@@ -168,7 +179,7 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_stop(self, event: Any):
         """ Stop anything we need to stop """
-        self.dahua_event_thread.stop()
+        self.async_stop_event_listener()
         self.dahua_vto_event_thread.stop()
         await self._close_session()
 
@@ -188,13 +199,18 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
         # Do the one time initialization (do this when Home Assistant starts)
         if not self.initialized:
             try:
+                # The identity of the device, these are independent so fetch them concurrently
+                max_extra_streams, machine_name, sys_info, version = await asyncio.gather(
+                    self.client.get_max_extra_streams(),
+                    self.client.async_get_machine_name(),
+                    self.client.async_get_system_info(),
+                    self.client.get_software_version(),
+                )
+
                 # Find the max number of streams. 1 main stream + n number of sub-streams
-                self._max_streams = await self.client.get_max_extra_streams() + 1
+                self._max_streams = max_extra_streams + 1
                 _LOGGER.info("Using max streams %s", self._max_streams)
 
-                machine_name = await self.client.async_get_machine_name()
-                sys_info = await self.client.async_get_system_info()
-                version = await self.client.get_software_version()
                 data.update(machine_name)
                 data.update(sys_info)
                 data.update(version)
@@ -218,95 +234,56 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
                 self.machine_name = data.get("table.General.MachineName")
                 self._serial_number = data.get("serialNumber")
 
-                try:
-                    await self.client.async_get_snapshot(0)
-                    # If able to take a snapshot with index 0 then most likely this cams channel needs to be reset
-                    # but check if unit is not a doorbell first as channel 0 doesnt exist for VTOs
-                    if not self.is_doorbell():
-                        self._channel_number = self._channel
-                except ClientError:
-                    pass
+                is_doorbell = self.is_doorbell()
+                _LOGGER.info("Device is a doorbell=%s", is_doorbell)
+
+                # Probes what the device supports. Probes run concurrently, are shared with the other channels of
+                # the device and are cached per serial number and firmware version
+                capabilities = await async_get_capabilities(
+                    self.hass, self.client, self._serial_number, data.get("version"), is_doorbell, self._channel
+                )
+
+                # If able to take a snapshot with index 0 then most likely this cams channel needs to be reset
+                # but check if unit is not a doorbell first as channel 0 doesnt exist for VTOs
+                if capabilities["snapshot_index_0"] and not is_doorbell:
+                    self._channel_number = self._channel
                 _LOGGER.info("Using channel number %s", self._channel_number)
 
-                try:
-                    await self.client.async_get_coaxial_control_io_status()
-                    self._supports_coaxial_control = True
-                except ClientResponseError:
-                    self._supports_coaxial_control = False
+                self._supports_coaxial_control = capabilities["coaxial_control"]
                 _LOGGER.info("Device supports Coaxial Control=%s", self._supports_coaxial_control)
 
-                try:
-                    await self.client.async_get_disarming_linkage()
-                    self._supports_disarming_linkage = True
-                except ClientError:
-                    self._supports_disarming_linkage = False
+                self._supports_disarming_linkage = capabilities["disarming_linkage"]
                 _LOGGER.info("Device supports disarming linkage=%s", self._supports_disarming_linkage)
 
-                try:
-                    await self.client.async_get_event_notifications()
-                    self._supports_event_notifications = True
-                except ClientError:
-                    self._supports_event_notifications = False
+                self._supports_event_notifications = capabilities["event_notifications"]
                 _LOGGER.info("Device supports event notifications=%s", self._supports_event_notifications)
 
                 # PTZ
-                # The following lines are for Dahua devices
-                try:
-                    await self.client.async_get_ptz_position()
-                    self._supports_ptz_position = True
-                except ClientError:
-                    self._supports_ptz_position = False
+                self._supports_ptz_position = capabilities["ptz_position"]
                 _LOGGER.info("Device supports PTZ position=%s", self._supports_ptz_position)
 
                 # Smart motion detection is enabled/disabled/fetched differently on Dahua devices compared to Amcrest
-                # The following lines are for Dahua devices
-                try:
-                    await self.client.async_get_smart_motion_detection()
-                    self._supports_smart_motion_detection = True
-                except ClientError:
-                    self._supports_smart_motion_detection = False
+                # This is the Dahua one
+                self._supports_smart_motion_detection = capabilities["smart_motion_detection"]
                 _LOGGER.info("Device supports smart motion detection=%s", self._supports_smart_motion_detection)
 
-                is_doorbell = self.is_doorbell()
-                _LOGGER.info("Device is a doorbell=%s", is_doorbell)
-
                 is_flood_light = self.is_flood_light()
                 _LOGGER.info("Device is a floodlight=%s", is_flood_light)
 
                 self._supports_floodlightmode = self.supports_floodlightmode()
 
-                try:
-                    await self.client.async_get_config_lighting(self._channel, self._profile_mode)
-                    self._supports_lighting = True
-                except ClientError:
-                    self._supports_lighting = False
-                    pass
+                self._supports_lighting = capabilities["lighting"]
                 _LOGGER.info("Device supports infrared lighting=%s", self.supports_infrared_light())
 
-#Checking lighting_v2 support
-                try:
-                    await self.client.async_get_lighting_v2()
-                    self._supports_lighting_v2 = True
-                except ClientError:
-                    self._supports_lighting_v2 = False
-                    pass
+                self._supports_lighting_v2 = capabilities["lighting_v2"]
                 _LOGGER.info("Device supports Lighting_V2=%s", self._supports_lighting_v2)
 
-
                 if not is_doorbell:
                     # Start the event listeners for IP cameras
                     await self.async_start_event_listener()
 
-                    try:
-                        # Some cams don't support profile modes, check and see... use 2 to check
-                        conf = await self.client.async_get_config("Lighting[0][2]")
-                        # We'll get back an error like this if it doesn't work:
-                        # Error: Error -1 getting param in name=Lighting[0][1]
-                        # Otherwise we'll get multiple lines of config back
-                        self._supports_profile_mode = len(conf) > 1
-                    except ClientError:
-                        _LOGGER.info("Cam does not support profile mode. Will use mode 0")
-                        self._supports_profile_mode = False
+                    # Some cams don't support profile modes. If not we'll use mode 0
+                    self._supports_profile_mode = capabilities["profile_mode"]
                     _LOGGER.info("Device supports profile mode=%s", self._supports_profile_mode)
                 else:
                     # Start the event listeners for doorbells (VTO)
@@ -458,16 +435,12 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
                         self._dahua_event_timestamp[event_key] = 0
                 listener()
 
-    def on_receive(self, data_bytes: bytes, channel: int):
+    def on_receive(self, events: list):
         """
-        Takes in bytes from the Dahua event stream, converts to a string, parses to a dict and fires an event with the data on the HA event bus
+        Takes in the events for this channel parsed from the Dahua event stream (see DahuaEventStream) and fires an event with the data on the HA event bus
         Example input:
 
-        b'Code=VideoMotion;action=Start;index=0;data={\n'
-        b'   "Id" : [ 0 ],\n'
-        b'   "RegionName" : [ "Region1" ]\n'
-        b'}\n'
-        b'\r\n'
+        [{'Code': 'VideoMotion', 'action': 'Start', 'index': '0', 'data': {'Id': [0], 'RegionName': ['Region1']}}]
 
 
         Example events that are fired on the HA event bus:
@@ -477,27 +450,9 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
             'name': 'Cam8', 'Code': 'CrossLineDetection', 'action': 'Start', 'index': '0', 'data': {'Class': 'Normal', 'DetectLine': [[18, 4098], [8155, 5549]], 'Direction':      'RightToLeft', 'EventSeq': 40, 'FrameSequence': 549073, 'GroupID': 40, 'Mark': 0, 'Name': 'Rule1', 'Object': {'Action': 'Appear', 'BoundingBox': [4816, 4552, 5248, 5272], 'Center': [5032, 4912], 'Confidence': 0, 'FrameSequence': 0, 'ObjectID': 542, 'ObjectType': 'Unknown', 'RelativeID': 0, 'Source': 0.0, 'Speed': 0, 'SpeedTypeInternal': 0}, 'PTS': 42986015370.0, 'RuleId': 1, 'Source': 51190936.0, 'Track': None, 'UTC': 1620477656, 'UTCMS': 180}
         }
         """
-        data = data_bytes.decode("utf-8", errors="ignore")
-        events = parse_event(data)
-
-        if len(events) == 0:
-            return
-
-        _LOGGER.debug(f"Events received from {self.get_address()} on channel {channel}: {events}")
+        _LOGGER.debug(f"Events received from {self.get_address()} on channel {self._channel}: {events}")
 
         for event in events:
-            index = 0
-            if "index" in event:
-                try:
-                    index = int(event["index"])
-                except ValueError:
-                    index = 0
-
-            # This is a short term fix. Right now for NVRs this integration creates a thread per channel to listen to events. Every thread gets the same response. We need to
-            # discard events not for this channel. Longer term work should create only a single thread per channel.
-            if index != self._channel:
-                continue
-
             # Put the vent on the HA event bus
             event["name"] = self.get_device_name()
             event["DeviceName"] = self.get_device_name()
@@ -766,7 +721,7 @@ class DahuaDataUpdateCoordinator(DataUpdateCoordinator):
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    coordinator.dahua_event_thread.stop()
+    coordinator.async_stop_event_listener()
     coordinator.dahua_vto_event_thread.stop()
     unloaded = all(
         await asyncio.gather(
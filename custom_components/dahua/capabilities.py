@@ -0,0 +1,165 @@
+"""
+Capability discovery for Dahua devices. The probes run concurrently and the result is shared by all the channels of a
+device. Results are cached in Home Assistant storage per serial number and firmware version so a restart doesn't have
+to probe again, a firmware upgrade gets probed fresh.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from aiohttp import ClientError, ClientResponseError
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .client import DahuaClient
+from .const import DOMAIN
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+DATA_CAPABILITIES = f"{DOMAIN}_capabilities"
+STORAGE_KEY = f"{DOMAIN}.capabilities"
+STORAGE_VERSION = 1
+SAVE_DELAY_SECONDS = 10
+
+
+async def _async_probe(awaitable: Awaitable, unsupported=ClientError) -> Tuple[bool, bool]:
+    """
+    Returns (supported, definite). Only an HTTP error response is a definite "not supported", connection errors are
+    treated as not supported for now (like we always did) but must not end up in the cache
+    """
+    try:
+        await awaitable
+        return True, True
+    except unsupported as exception:
+        return False, isinstance(exception, ClientResponseError)
+
+
+async def _async_probe_profile_mode(client: DahuaClient) -> Tuple[bool, bool]:
+    try:
+        # Some cams don't support profile modes, check and see... use 2 to check
+        conf = await client.async_get_config("Lighting[0][2]")
+        # We'll get back an error like this if it doesn't work:
+        # Error: Error -1 getting param in name=Lighting[0][1]
+        # Otherwise we'll get multiple lines of config back
+        return len(conf) > 1, True
+    except ClientError as exception:
+        # Like _async_probe, only an HTTP error response is a definite answer worth caching
+        return False, isinstance(exception, ClientResponseError)
+
+
+async def _async_gather_probes(probes: Dict[str, Awaitable]) -> Tuple[Dict[str, bool], bool]:
+    results = await asyncio.gather(*probes.values(), return_exceptions=True)
+
+    capabilities = {}
+    cacheable = True
+    for name, result in zip(probes.keys(), results):
+        if isinstance(result, BaseException):
+            raise result
+        capabilities[name], definite = result
+        cacheable = cacheable and definite
+    return capabilities, cacheable
+
+
+async def async_probe_device(client: DahuaClient, is_doorbell: bool) -> Tuple[Dict[str, bool], bool]:
+    """ Probes the APIs that are the same for every channel of the device """
+    probes = {
+        "snapshot_index_0": _async_probe(client.async_get_snapshot(0)),
+        "coaxial_control": _async_probe(client.async_get_coaxial_control_io_status(), ClientResponseError),
+        "disarming_linkage": _async_probe(client.async_get_disarming_linkage()),
+        "event_notifications": _async_probe(client.async_get_event_notifications()),
+        "ptz_position": _async_probe(client.async_get_ptz_position()),
+        "smart_motion_detection": _async_probe(client.async_get_smart_motion_detection()),
+        "lighting_v2": _async_probe(client.async_get_lighting_v2()),
+    }
+    if not is_doorbell:
+        probes["profile_mode"] = _async_probe_profile_mode(client)
+
+    capabilities, cacheable = await _async_gather_probes(probes)
+    capabilities.setdefault("profile_mode", False)
+    return capabilities, cacheable
+
+
+async def async_probe_channel(client: DahuaClient, channel: int) -> Tuple[Dict[str, bool], bool]:
+    """ Probes the APIs that depend on the channel """
+    probes = {
+        "lighting": _async_probe(client.async_get_config_lighting(channel, "0")),
+    }
+    return await _async_gather_probes(probes)
+
+
+class DahuaCapabilityCache:
+    """
+    Caches probe results by key. Concurrent lookups of the same key (the channels of an NVR starting up together) wait
+    on a single probe instead of each probing the device.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: Optional[dict] = None
+        self._load_lock = asyncio.Lock()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def _async_load(self):
+        async with self._load_lock:
+            if self._data is None:
+                self._data = await self._store.async_load() or {}
+
+    async def async_get(self, key: str, probe: Callable[[], Awaitable[Tuple[dict, bool]]]) -> dict:
+        """ Returns the cached capabilities for key, calling probe when missing """
+        await self._async_load()
+
+        if key in self._data:
+            return self._data[key]
+
+        if key in self._pending:
+            return await asyncio.shield(self._pending[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            capabilities, cacheable = await probe()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exception:
+            future.set_exception(exception)
+            # Mark it as retrieved, nobody else may be waiting on it
+            future.exception()
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+        if cacheable:
+            self._data[key] = capabilities
+            self._store.async_delay_save(lambda: self._data, SAVE_DELAY_SECONDS)
+        else:
+            _LOGGER.debug("Not caching capabilities for %s, some probes failed to connect", key)
+
+        future.set_result(capabilities)
+        return capabilities
+
+
+async def async_get_capabilities(hass: HomeAssistant, client: DahuaClient, serial_number: str, firmware: str,
+                                 is_doorbell: bool, channel: int) -> dict:
+    """ Returns the device capabilities merged with the capabilities of the channel """
+    if not serial_number or not firmware:
+        # Without an identity the results could be shared with other devices, probe live and don't cache
+        _LOGGER.debug("Unknown serial number or firmware, not caching capabilities")
+        (device, _), (channel_capabilities, _) = await asyncio.gather(
+            async_probe_device(client, is_doorbell), async_probe_channel(client, channel)
+        )
+        return {**device, **channel_capabilities}
+
+    if DATA_CAPABILITIES not in hass.data:
+        hass.data[DATA_CAPABILITIES] = DahuaCapabilityCache(hass)
+    cache: DahuaCapabilityCache = hass.data[DATA_CAPABILITIES]
+
+    device_key = "{0}|{1}".format(serial_number, firmware)
+    device, channel_capabilities = await asyncio.gather(
+        cache.async_get(device_key, lambda: async_probe_device(client, is_doorbell)),
+        cache.async_get("{0}|{1}".format(device_key, channel), lambda: async_probe_channel(client, channel)),
+    )
+
+    capabilities = dict(device)
+    capabilities.update(channel_capabilities)
+    return capabilities
@@ -12,6 +12,10 @@ from urllib.parse import quote
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 TIMEOUT_SECONDS = 20
+# The max number of API requests (snapshots included) in flight to a device at the same time
+MAX_CONCURRENT_REQUESTS = 4
+# The event stream sends a heartbeat every 5 seconds, if nothing arrives for this long the connection is dead
+STREAM_READ_TIMEOUT_SECONDS = 30
 SECURITY_LIGHT_TYPE = 1
 SIREN_TYPE = 2
 
@@ -40,6 +44,10 @@ class DahuaClient:
         self._port = port
         self._rtsp_port = rtsp_port
 
+        # One digest session per device so requests reuse the challenge instead of paying for a 401 every time
+        self._auth = DigestAuth(self._username, self._password, self._session)
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
         protocol = "https" if int(port) == 443 else "http"
         self._base = "{0}://{1}:{2}".format(protocol, address, port)
 
@@ -762,8 +770,8 @@ class DahuaClient:
             response = None
 
             try:
-                auth = DigestAuth(self._username, self._password, self._session)
-                response = await auth.request("GET", url)
+                timeout = aiohttp.ClientTimeout(total=None, sock_read=STREAM_READ_TIMEOUT_SECONDS)
+                response = await self._auth.request("GET", url, timeout=timeout)
                 response.raise_for_status()
 
                 # https://docs.aiohttp.org/en/stable/streams.html
@@ -798,27 +806,26 @@ class DahuaClient:
 
     async def get_bytes(self, url: str) -> bytes:
         """Get information from the API. This will return the raw response and not process it"""
-        async with async_timeout.timeout(TIMEOUT_SECONDS):
+        async with async_timeout.timeout(TIMEOUT_SECONDS), self._request_semaphore:
             response = None
             try:
-                auth = DigestAuth(self._username, self._password, self._session)
-                response = await auth.request("GET", self._base + url)
+                response = await self._auth.request("GET", self._base + url)
                 response.raise_for_status()
 
                 return await response.read()
             finally:
                 if response is not None:
-                    response.close()
+                    # release (instead of close) so the keep-alive connection is reused
+                    response.release()
 
     async def get(self, url: str, verify_ok=False) -> dict:
         """Get information from the API."""
         url = self._base + url
         try:
-            async with async_timeout.timeout(TIMEOUT_SECONDS):
+            async with async_timeout.timeout(TIMEOUT_SECONDS), self._request_semaphore:
                 response = None
                 try:
-                    auth = DigestAuth(self._username, self._password, self._session)
-                    response = await auth.request("GET", url)
+                    response = await self._auth.request("GET", url)
                     response.raise_for_status()
                     data = await response.text()
                     if verify_ok:
@@ -827,7 +834,8 @@ class DahuaClient:
                     return await self.parse_dahua_api_response(data)
                 finally:
                     if response is not None:
-                        response.close()
+                        # release (instead of close) so the keep-alive connection is reused
+                        response.release()
         except asyncio.TimeoutError as exception:
             _LOGGER.warning("TimeoutError fetching information from %s", url)
             raise exception
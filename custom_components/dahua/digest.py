@@ -17,6 +17,9 @@ class DigestAuth:
     """HTTP digest authentication helper.
     The work here is based off of
     https://github.com/requests/requests/blob/v2.18.4/requests/auth.py.
+
+    A single instance is meant to be shared by all requests to a device. The challenge is cached and the nonce count
+    incremented so requests authenticate up front, a new challenge is only done when the nonce goes stale.
     """
 
     def __init__(self, username: str, password: str, session: aiohttp.ClientSession, previous=None):
@@ -28,26 +31,26 @@ class DigestAuth:
         self.last_nonce = previous.get("last_nonce", "")
         self.nonce_count = previous.get("nonce_count", 0)
         self.challenge = previous.get("challenge")
-        self.args = {}
         self.session = session
 
-    async def request(self, method, url, *, headers=None, **kwargs):
+    async def request(self, method, url, *, headers=None, retry=True, **kwargs):
         """Makes a request"""
         if headers is None:
             headers = {}
 
-        # Save the args so we can re-run the request
-        self.args = {"method": method, "url": url, "headers": headers, "kwargs": kwargs}
-
+        # Reading the nonce and numbering the request don't await, so concurrent requests can't interleave there.
+        # Requests are sent concurrently, a device rejecting a nonce count arriving out of order answers with a 401
+        # which is retried below.
+        sent_nonce = None
         if self.challenge:
-            authorization = self._build_digest_header(method.upper(), url)
-            headers["AUTHORIZATION"] = authorization
+            sent_nonce = self.challenge["nonce"]
+            headers["AUTHORIZATION"] = self._build_digest_header(method.upper(), url)
 
         response = await self.session.request(method, url, headers=headers, **kwargs)
 
         # Only try performing digest authentication if the response status is from 401
-        if response.status == 401:
-            return await self._handle_401(response)
+        if response.status == 401 and retry:
+            return await self._handle_401(response, sent_nonce, method, url, headers, kwargs)
 
         return response
 
@@ -134,26 +137,34 @@ class DigestAuth:
 
         return "Digest %s" % base
 
-    async def _handle_401(self, response: ClientResponse):
+    async def _handle_401(self, response: ClientResponse, sent_nonce, method, url, headers, kwargs):
         """
-        Takes the given response and tries digest-auth, if needed.
+        Takes the given response and tries digest-auth, if needed. sent_nonce is the nonce the rejected request was
+        authenticated with, None if it was sent without authorization.
         :rtype: ClientResponse
         """
         auth_header = response.headers.get("www-authenticate", "")
 
         parts = auth_header.split(" ", 1)
         if "digest" == parts[0].lower() and len(parts) > 1:
-            # Close the initial response since we are going making another request and return that response
-            response.close()
+            challenge = parse_key_value_list(parts[1])
+
+            # When the device rejects a request and challenges with the nonce it was sent with the credentials are wrong,
+            # retrying won't help. Concurrent requests rejected with another nonce retry with the new challenge.
+            if (
+                    sent_nonce is not None
+                    and challenge.get("nonce") == sent_nonce
+                    and challenge.get("stale", "").lower() != "true"
+            ):
+                return response
+
+            # Drain the initial response so the connection goes back to the pool, then retry once
+            await response.read()
+            response.release()
 
-            self.challenge = parse_key_value_list(parts[1])
+            self.challenge = challenge
 
-            return await self.request(
-                self.args["method"],
-                self.args["url"],
-                headers=self.args["headers"],
-                **self.args["kwargs"],
-            )
+            return await self.request(method, url, headers=headers, retry=False, **kwargs)
 
         return response
 
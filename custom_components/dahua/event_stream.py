@@ -0,0 +1,224 @@
+""" Dahua event stream shared by every channel of a device """
+
+import asyncio
+import logging
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .client import DahuaClient
+from .const import DOMAIN
+from .dahua_utils import parse_event
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+DATA_EVENT_STREAMS = f"{DOMAIN}_event_streams"
+
+# Reconnect delays when the stream fails fast. Doubles on every quick failure
+BACKOFF_MIN_SECONDS = 5
+BACKOFF_MAX_SECONDS = 60
+# A stream that stayed up at least this long is considered healthy and resets the backoff
+HEALTHY_STREAM_SECONDS = 10
+
+BOUNDARY = b"--myboundary"
+CONTENT_LENGTH = re.compile(rb"content-length:\s*(\d+)", re.IGNORECASE)
+# Protects against a device that never sends a boundary
+MAX_BUFFER_BYTES = 1024 * 1024
+
+
+class DahuaEventFramer:
+    """
+    Splits the multipart event stream into complete parts. aiohttp hands us chunks as they arrive on the socket so a
+    single event can span chunks (long IVS data) or a chunk can hold several events. Each part looks like this:
+
+    --myboundary
+    Content-Type: text/plain
+    Content-Length: 39
+
+    Code=VideoMotion;action=Start;index=0
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[str]:
+        """ Adds data to the buffer and returns the parts that are complete """
+        self._buffer += data
+        parts = []
+
+        while True:
+            start = self._buffer.find(BOUNDARY)
+            if start < 0:
+                # Keep a tail in case the boundary itself is split across chunks
+                del self._buffer[:max(0, len(self._buffer) - len(BOUNDARY))]
+                break
+
+            # Drop whatever is in front of the boundary (trailing CRLFs of the previous part)
+            del self._buffer[:start]
+
+            header_end, separator = self._find_header_end()
+            if header_end < 0:
+                break
+
+            body_start = header_end + len(separator)
+            match = CONTENT_LENGTH.search(self._buffer, 0, header_end)
+            if match is not None:
+                end = body_start + int(match.group(1))
+                if len(self._buffer) < end:
+                    break
+            else:
+                # No length, the part ends at the next boundary
+                end = self._buffer.find(BOUNDARY, body_start)
+                if end < 0:
+                    break
+
+            parts.append(self._buffer[:end].decode("utf-8", errors="ignore"))
+            del self._buffer[:end]
+
+        if len(self._buffer) > MAX_BUFFER_BYTES:
+            _LOGGER.warning("Discarding %s bytes of unframed event stream data", len(self._buffer))
+            self._buffer.clear()
+
+        return parts
+
+    def _find_header_end(self) -> Tuple[int, bytes]:
+        """ Returns the position of the blank line ending the part headers and the separator used """
+        crlf = self._buffer.find(b"\r\n\r\n")
+        lf = self._buffer.find(b"\n\n")
+        if crlf >= 0 and (lf < 0 or crlf < lf):
+            return crlf, b"\r\n\r\n"
+        return lf, b"\n\n"
+
+
+class _Subscription:
+    def __init__(self, client: DahuaClient, channel: int, events: list, on_events: Callable[[list], None]):
+        self.client = client
+        self.channel = channel
+        self.codes = set(events or [])
+        self.on_events = on_events
+
+    def wants(self, code: str) -> bool:
+        return "All" in self.codes or code in self.codes
+
+
+class DahuaEventStream:
+    """
+    A single eventManager.cgi attach stream per physical device. NVRs used to get one stream per channel and every
+    stream carried the events of all channels. Now the stream subscribes to the union of the codes of all channels and
+    events are handed to the channel by their index.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: tuple):
+        self.hass = hass
+        self._key = key
+        self._subscriptions: List[_Subscription] = []
+        self._codes: List[str] = []
+        self._stream_client: Optional[DahuaClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @callback
+    def async_subscribe(self, client: DahuaClient, channel: int, events: list,
+                        on_events: Callable[[list], None]) -> CALLBACK_TYPE:
+        """ Registers on_events for the events of channel (the channel index). Returns a callable to unsubscribe """
+        subscription = _Subscription(client, channel, events, on_events)
+        self._subscriptions.append(subscription)
+        self._async_restart_if_needed()
+
+        @callback
+        def unsubscribe():
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            if not self._subscriptions:
+                self._async_stop()
+                self.hass.data.get(DATA_EVENT_STREAMS, {}).pop(self._key, None)
+            else:
+                # The session of the client we stream with is about to be closed, move to another subscriber's
+                self._async_restart_if_needed(force=subscription.client is self._stream_client)
+
+        return unsubscribe
+
+    @callback
+    def _async_restart_if_needed(self, force: bool = False):
+        codes = set()
+        for subscription in self._subscriptions:
+            codes |= subscription.codes
+        codes = ["All"] if "All" in codes else sorted(codes)
+
+        if not force and self._task is not None and codes == self._codes:
+            return
+
+        self._async_stop()
+        self._codes = codes
+        if codes:
+            # The oldest subscriber's client (and its session) is used for the stream
+            self._stream_client = self._subscriptions[0].client
+            self._task = self.hass.async_create_background_task(
+                self._async_run(self._stream_client, codes), f"{DOMAIN} event stream {self._key[0]}"
+            )
+
+    @callback
+    def _async_stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._stream_client = None
+
+    async def _async_run(self, client: DahuaClient, codes: list):
+        """ Keeps the stream connected, reconnecting with backoff when it fails fast """
+        loop = asyncio.get_running_loop()
+        delay = BACKOFF_MIN_SECONDS
+
+        while True:
+            framer = DahuaEventFramer()
+            start_time = loop.time()
+
+            def on_receive(data: bytes, _channel):
+                for part in framer.feed(data):
+                    self._dispatch(part)
+
+            await client.stream_events(on_receive, codes, None)
+
+            if loop.time() - start_time < HEALTHY_STREAM_SECONDS:
+                # We are failing fast when trying to connect to the camera. Let's retry slowly
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BACKOFF_MAX_SECONDS)
+            else:
+                delay = BACKOFF_MIN_SECONDS
+
+            _LOGGER.debug("reconnecting to %s event stream...", self._key[0])
+
+    def _dispatch(self, part: str):
+        try:
+            events = parse_event(part)
+        except ValueError:
+            _LOGGER.debug("Could not parse event %s", part)
+            return
+
+        by_channel: Dict[int, list] = {}
+        for event in events:
+            index = 0
+            if "index" in event:
+                try:
+                    index = int(event["index"])
+                except ValueError:
+                    index = 0
+            by_channel.setdefault(index, []).append(event)
+
+        for subscription in list(self._subscriptions):
+            channel_events = [
+                dict(event) for event in by_channel.get(subscription.channel, [])
+                if subscription.wants(event.get("Code", ""))
+            ]
+            if channel_events:
+                subscription.on_events(channel_events)
+
+
+@callback
+def async_get_event_stream(hass: HomeAssistant, address: str, port: int) -> DahuaEventStream:
+    """ Returns the event stream for the device, creating it if needed """
+    streams = hass.data.setdefault(DATA_EVENT_STREAMS, {})
+    key = (address, port)
+    if key not in streams:
+        streams[key] = DahuaEventStream(hass, key)
+    return streams[key]
@@ -20,12 +20,6 @@ import voluptuous as vol
 
 from custom_components.frigate.config_flow import get_config_entry_title
 from homeassistant.components.mqtt.models import ReceiveMessage
-from homeassistant.components.mqtt.subscription import (
-    EntitySubscription,
-    async_prepare_subscribe_topics,
-    async_subscribe_topics,
-    async_unsubscribe_topics,
-)
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -57,6 +51,9 @@ from .const import (
     ATTR_CONFIG,
     ATTR_COORDINATOR,
     ATTR_END_TIME,
+    ATTR_EVENT_SUMMARY_CACHE,
+    ATTR_MQTT_ROUTER,
+    ATTR_SNAPSHOT_CACHE,
     ATTR_START_TIME,
     ATTR_WS_EVENT_PROXY,
     CONF_CAMERA_STATIC_IMAGE_HEIGHT,
@@ -72,6 +69,9 @@ from .const import (
     STATUS_RUNNING,
     STATUS_STARTING,
 )
+from .event_cache import EventSummaryCache
+from .mqtt_router import FrigateMQTTRouter
+from .snapshot_cache import SnapshotCache
 from .views import async_setup as views_async_setup
 from .ws_api import async_setup as ws_api_async_setup
 from .ws_event_proxy import WSEventProxy
@@ -315,15 +315,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     model = f"{(await async_get_integration(hass, DOMAIN)).version}/{server_version}"
 
-    ws_event_proxy = WSEventProxy(hass, config["mqtt"]["topic_prefix"])
+    mqtt_router = FrigateMQTTRouter(hass)
+    entry.async_on_unload(mqtt_router.async_unsubscribe_all)
+
+    ws_event_proxy = WSEventProxy(mqtt_router, config["mqtt"]["topic_prefix"])
     entry.async_on_unload(lambda: ws_event_proxy.unsubscribe_all(hass))
 
+    event_summary_cache = EventSummaryCache(mqtt_router, config["mqtt"]["topic_prefix"])
+    entry.async_on_unload(event_summary_cache.unsubscribe_all)
+
     hass.data[DOMAIN][entry.entry_id] = {
         ATTR_COORDINATOR: coordinator,
         ATTR_CLIENT: client,
         ATTR_CONFIG: config,
         ATTR_MODEL: model,
+        ATTR_MQTT_ROUTER: mqtt_router,
         ATTR_WS_EVENT_PROXY: ws_event_proxy,
+        ATTR_SNAPSHOT_CACHE: SnapshotCache(hass),
+        ATTR_EVENT_SUMMARY_CACHE: event_summary_cache,
     }
 
     # Remove old devices associated with cameras that have since been removed
@@ -614,8 +623,11 @@ class FrigateMQTTEntity(FrigateEntity):
         """Construct a FrigateMQTTEntity."""
         super().__init__(config_entry)
         self._frigate_config = frigate_config
-        self._sub_state: dict[str, EntitySubscription] | None = None
+        self._router: FrigateMQTTRouter | None = None
+        self._unsubscribe_callbacks: list[Callable[[], None]] = []
         self._available = False
+        # Topics with a "route_key" get the decoded JSON payloads for that
+        # (camera, object, zone) key instead of the messages.
         self._topic_map = topic_map
 
     async def async_added_to_hass(self) -> None:
@@ -626,21 +638,36 @@ class FrigateMQTTEntity(FrigateEntity):
             "qos": 0,
         }
 
-        self._sub_state = async_prepare_subscribe_topics(
-            self.hass,
-            self._sub_state,
-            self._topic_map,
-        )
-        await async_subscribe_topics(self.hass, self._sub_state)
+        self._router = self.hass.data[DOMAIN][self._config_entry.entry_id][
+            ATTR_MQTT_ROUTER
+        ]
+        for topic in self._topic_map.values():
+            self._unsubscribe_callbacks.append(
+                await self._router.async_subscribe(
+                    topic["topic"], topic["msg_callback"], topic.get("route_key")
+                )
+            )
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
         """Cleanup prior to hass removal."""
-        self._sub_state = async_unsubscribe_topics(self.hass, self._sub_state)
+        for unsubscribe in self._unsubscribe_callbacks:
+            unsubscribe()
+        self._unsubscribe_callbacks = []
+        if self._router is not None:
+            self._router.async_cancel_write(self)
         await super().async_will_remove_from_hass()
 
+    @callback
+    def async_schedule_write_ha_state(self) -> None:
+        """Write the state once the current burst of MQTT messages is handled."""
+        if self._router is None:
+            self.async_write_ha_state()
+        else:
+            self._router.async_schedule_write(self)
+
     @callback
     def _availability_message_received(self, msg: ReceiveMessage) -> None:
         """Handle a new received MQTT availability message."""
         self._available = decode_if_necessary(msg.payload) == "online"
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
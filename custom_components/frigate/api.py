@@ -89,7 +89,7 @@ class FrigateApiClient:
         sub_labels: list[str] | None = None,
         zones: list[str] | None = None,
         after: int | None = None,
-        before: int | None = None,
+        before: float | None = None,
         limit: int | None = None,
         has_clip: bool | None = None,
         has_snapshot: bool | None = None,
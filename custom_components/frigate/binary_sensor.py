@@ -107,7 +107,7 @@ class FrigateObjectOccupancySensor(FrigateMQTTEntity, BinarySensorEntity):
             self._is_on = int(msg.payload) > 0
         except ValueError:
             self._is_on = False
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
@@ -188,7 +188,7 @@ class FrigateAudioSensor(FrigateMQTTEntity, BinarySensorEntity):
     def _state_message_received(self, msg: ReceiveMessage) -> None:
         """Handle a new received MQTT state message."""
         self._is_on = decode_if_necessary(msg.payload) == "ON"
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
@@ -269,7 +269,7 @@ class FrigateMotionSensor(FrigateMQTTEntity, BinarySensorEntity):
     def _state_message_received(self, msg: ReceiveMessage) -> None:
         """Handle a new received MQTT state message."""
         self._is_on = decode_if_necessary(msg.payload) == "ON"
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
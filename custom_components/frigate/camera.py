@@ -54,6 +54,7 @@ from .const import (
     ATTR_PLAYBACK_FACTOR,
     ATTR_PTZ_ACTION,
     ATTR_PTZ_ARGUMENT,
+    ATTR_SNAPSHOT_CACHE,
     ATTR_START_TIME,
     ATTR_SUB_LABEL,
     CONF_ENABLE_WEBRTC,
@@ -67,6 +68,7 @@ from .const import (
     SERVICE_FAVORITE_EVENT,
     SERVICE_PTZ,
 )
+from .snapshot_cache import SnapshotCache
 from .views import get_frigate_instance_id_for_config_entry
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -81,6 +83,7 @@ async def async_setup_entry(
     frigate_client = hass.data[DOMAIN][entry.entry_id][ATTR_CLIENT]
     client_id = get_frigate_instance_id_for_config_entry(hass, entry)
     coordinator = hass.data[DOMAIN][entry.entry_id][ATTR_COORDINATOR]
+    snapshot_cache = hass.data[DOMAIN][entry.entry_id][ATTR_SNAPSHOT_CACHE]
 
     frigate_webrtc = entry.options.get(CONF_ENABLE_WEBRTC, False)
     camera_type = FrigateCameraWebRTC if frigate_webrtc else FrigateCamera
@@ -96,11 +99,12 @@ async def async_setup_entry(
                 coordinator,
                 frigate_config,
                 camera_config,
+                snapshot_cache,
             )
             for cam_name, camera_config in frigate_config["cameras"].items()
         ]
         + (
-            [birdseye_type(entry, frigate_client)]
+            [birdseye_type(entry, frigate_client, snapshot_cache)]
             if frigate_config.get("birdseye", {}).get("restream", False)
             else []
         )
@@ -155,6 +159,28 @@ async def async_setup_entry(
     )
 
 
+async def async_fetch_latest_image(
+    hass: HomeAssistant,
+    client: FrigateApiClient,
+    url: str,
+    cam_name: str,
+    height: int | None,
+) -> bytes | None:
+    """Fetch the latest image of a camera from Frigate."""
+    websession = async_get_clientsession(hass, verify_ssl=client.validate_ssl)
+
+    image_url = str(
+        URL(url)
+        / f"api/{cam_name}/latest.jpg"
+        % ({"h": height} if height is not None and height > 0 else {})
+    )
+
+    headers = await client.get_auth_headers()
+    async with async_timeout.timeout(10):
+        response = await websession.get(image_url, headers=headers)
+        return await response.read()
+
+
 class FrigateCamera(
     FrigateMQTTEntity, CoordinatorEntity[FrigateDataUpdateCoordinator], Camera
 ):
@@ -172,9 +198,11 @@ class FrigateCamera(
         coordinator: FrigateDataUpdateCoordinator,
         frigate_config: dict[str, Any],
         camera_config: dict[str, Any],
+        snapshot_cache: SnapshotCache,
     ) -> None:
         """Initialize a Frigate camera."""
         self._client = frigate_client
+        self._snapshot_cache = snapshot_cache
         self._client_id = frigate_client_id
         self._frigate_config = frigate_config
         self._camera_config = camera_config
@@ -201,6 +229,15 @@ class FrigateCamera(
                     ),
                     "encoding": None,
                 },
+                "motion_detected_topic": {
+                    "msg_callback": self._motion_detected_message_received,
+                    "qos": 0,
+                    "topic": (
+                        f"{self._frigate_config['mqtt']['topic_prefix']}"
+                        f"/{self._cam_name}/motion"
+                    ),
+                    "encoding": None,
+                },
                 "enabled_topic": {
                     "msg_callback": self._enabled_message_received,
                     "qos": 0,
@@ -261,18 +298,27 @@ class FrigateCamera(
     def _state_message_received(self, msg: ReceiveMessage) -> None:
         """Handle a new received MQTT state message."""
         self._attr_is_recording = decode_if_necessary(msg.payload) == "ON"
-        self.async_write_ha_state()
+        self._snapshot_cache.invalidate(self._cam_name)
+        self.async_schedule_write_ha_state()
 
     @callback
     def _motion_message_received(self, msg: ReceiveMessage) -> None:
         """Handle a new received MQTT extra message."""
         self._attr_motion_detection_enabled = decode_if_necessary(msg.payload) == "ON"
-        self.async_write_ha_state()
+        self._snapshot_cache.invalidate(self._cam_name)
+        self.async_schedule_write_ha_state()
+
+    @callback
+    def _motion_detected_message_received(self, msg: ReceiveMessage) -> None:
+        """Handle a new received MQTT motion message."""
+        # The camera state doesn't change, but the next image must be fresh.
+        self._snapshot_cache.invalidate(self._cam_name)
 
     @callback
     def _enabled_message_received(self, msg: ReceiveMessage) -> None:
         """Handle a new received MQTT extra message."""
         self._attr_is_on = decode_if_necessary(msg.payload) == "ON"
+        self._snapshot_cache.invalidate(self._cam_name)
 
         if self._attr_is_on:
             self._attr_is_streaming = (
@@ -286,7 +332,7 @@ class FrigateCamera(
             self._attr_is_streaming = False
             self._attr_is_recording = False
 
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -348,21 +394,15 @@ class FrigateCamera(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return bytes of camera image."""
-        websession = async_get_clientsession(
-            self.hass, verify_ssl=self._client.validate_ssl
-        )
-
-        image_url = str(
-            URL(self._url)
-            / f"api/{self._cam_name}/latest.jpg"
-            % ({"h": height} if height is not None and height > 0 else {})
+        return await self._snapshot_cache.async_get(
+            self._cam_name,
+            width,
+            height,
+            lambda: async_fetch_latest_image(
+                self.hass, self._client, self._url, self._cam_name, height
+            ),
         )
 
-        headers = await self._client.get_auth_headers()
-        async with async_timeout.timeout(10):
-            response = await websession.get(image_url, headers=headers)
-            return await response.read()
-
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
         return self._stream_source
@@ -478,9 +518,11 @@ class BirdseyeCamera(FrigateEntity, Camera):
         self,
         config_entry: ConfigEntry,
         frigate_client: FrigateApiClient,
+        snapshot_cache: SnapshotCache,
     ) -> None:
         """Initialize the birdseye camera."""
         self._client = frigate_client
+        self._snapshot_cache = snapshot_cache
         self._cam_name = "birdseye"
         FrigateEntity.__init__(self, config_entry)
         Camera.__init__(self)
@@ -539,21 +581,15 @@ class BirdseyeCamera(FrigateEntity, Camera):
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return bytes of camera image."""
-        websession = async_get_clientsession(
-            self.hass, verify_ssl=self._client.validate_ssl
-        )
-
-        image_url = str(
-            URL(self._url)
-            / f"api/{self._cam_name}/latest.jpg"
-            % ({"h": height} if height is not None and height > 0 else {})
+        return await self._snapshot_cache.async_get(
+            self._cam_name,
+            width,
+            height,
+            lambda: async_fetch_latest_image(
+                self.hass, self._client, self._url, self._cam_name, height
+            ),
         )
 
-        headers = await self._client.get_auth_headers()
-        async with async_timeout.timeout(10):
-            response = await websession.get(image_url, headers=headers)
-            return await response.read()
-
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
         return self._stream_source
@@ -34,11 +34,14 @@ ATTR_CONFIG = "config"
 ATTR_COORDINATOR = "coordinator"
 ATTR_END_TIME = "end_time"
 ATTR_EVENT_ID = "event_id"
+ATTR_EVENT_SUMMARY_CACHE = "event_summary_cache"
 ATTR_FAVORITE = "favorite"
 ATTR_MQTT = "mqtt"
+ATTR_MQTT_ROUTER = "mqtt_router"
 ATTR_PLAYBACK_FACTOR = "playback_factor"
 ATTR_PTZ_ACTION = "action"
 ATTR_PTZ_ARGUMENT = "argument"
+ATTR_SNAPSHOT_CACHE = "snapshot_cache"
 ATTR_START_TIME = "start_time"
 ATTR_WS_EVENT_PROXY = "ws_event_proxy"
 ATTR_LABEL = "label"
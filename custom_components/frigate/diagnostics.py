@@ -8,7 +8,15 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import ATTR_CLIENT, ATTR_CONFIG, CONF_PASSWORD, CONF_PATH, DOMAIN
+from .const import (
+    ATTR_CLIENT,
+    ATTR_CONFIG,
+    ATTR_MQTT_ROUTER,
+    ATTR_SNAPSHOT_CACHE,
+    CONF_PASSWORD,
+    CONF_PATH,
+    DOMAIN,
+)
 
 REDACT_CONFIG = {CONF_PASSWORD, CONF_PATH}
 
@@ -33,5 +41,9 @@ async def async_get_config_entry_diagnostics(
     data = {
         "frigate_config": redacted_config,
         "frigate_stats": redacted_stats,
+        "snapshot_cache": hass.data[DOMAIN][entry.entry_id][
+            ATTR_SNAPSHOT_CACHE
+        ].diagnostics,
+        "mqtt_router": hass.data[DOMAIN][entry.entry_id][ATTR_MQTT_ROUTER].diagnostics,
     }
     return data
@@ -0,0 +1,92 @@
+"""Cache of Frigate event summaries."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .mqtt_router import FrigateMQTTRouter
+
+# Summaries are refetched after this many seconds even without MQTT events,
+# e.g. when Frigate deleted expired events.
+EVENT_SUMMARY_CACHE_TTL = 120.0
+
+# Event attributes that change the summary when an event is updated.
+SUMMARY_EVENT_KEYS = ("camera", "label", "zones", "has_clip", "has_snapshot")
+
+
+class EventSummaryCache:
+    """Cache of the event summaries of a Frigate instance.
+
+    Every level of the media browser needs the event summary, which covers
+    all retained events. Summaries are cached per key (timezone and media
+    type) and dropped when the events MQTT topic reports a new or ended
+    event, or an update that changes the summary. The topic is only
+    subscribed once something was cached.
+    """
+
+    def __init__(
+        self,
+        router: FrigateMQTTRouter,
+        topic_prefix: str,
+        ttl: float = EVENT_SUMMARY_CACHE_TTL,
+    ) -> None:
+        """Initialize the cache."""
+        self._router = router
+        self._topic = f"{topic_prefix}/events"
+        self._ttl = ttl
+        self._summaries: dict[Any, tuple[float, Any]] = {}
+        # Bumped on every invalidation, fetches started before aren't stored.
+        self._generation = 0
+        self._unsubscribe_topic: CALLBACK_TYPE | None = None
+
+    async def async_get(self, key: Any, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the summary for key, calling fetch when not cached."""
+        cached = self._summaries.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        if self._unsubscribe_topic is None:
+            self._unsubscribe_topic = await self._router.async_subscribe(
+                self._topic, self._receive_event, (None, None, None)
+            )
+
+        generation = self._generation
+        summary = await fetch()
+        if generation == self._generation:
+            self._summaries[key] = (time.monotonic() + self._ttl, summary)
+        return summary
+
+    @callback
+    def invalidate(self) -> None:
+        """Drop all cached summaries."""
+        self._generation += 1
+        self._summaries.clear()
+
+    def unsubscribe_all(self) -> None:
+        """Unsubscribe from the events topic."""
+        if self._unsubscribe_topic is not None:
+            self._unsubscribe_topic()
+            self._unsubscribe_topic = None
+        self.invalidate()
+
+    @callback
+    def _receive_event(self, data: dict[str, Any]) -> None:
+        """Handle a new received event."""
+        if not self._summaries:
+            return
+
+        if data.get("type") == "update":
+            before = data.get("before")
+            after = data.get("after")
+            if (
+                isinstance(before, dict)
+                and isinstance(after, dict)
+                and all(before.get(key) == after.get(key) for key in SUMMARY_EVENT_KEYS)
+            ):
+                return
+
+        self.invalidate()
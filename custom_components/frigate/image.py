@@ -83,7 +83,7 @@ class FrigateMqttSnapshots(FrigateMQTTEntity, ImageEntity):
         if isinstance(msg.payload, bytes):
             self._last_image_timestamp = datetime.datetime.now()
             self._last_image = msg.payload
-            self.async_write_ha_state()
+            self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import datetime as dt
 import enum
 import logging
-from typing import Any, cast
+from typing import Any, Optional, cast
 
 import attr
 from dateutil.relativedelta import relativedelta
@@ -25,7 +25,14 @@ from homeassistant.util.dt import DEFAULT_TIME_ZONE, async_get_time_zone
 
 from . import get_friendly_name
 from .api import FrigateApiClient, FrigateApiClientError
-from .const import CONF_MEDIA_BROWSER_ENABLE, DEFAULT_VOD_EVENT_PADDING, DOMAIN, NAME
+from .const import (
+    ATTR_EVENT_SUMMARY_CACHE,
+    CONF_MEDIA_BROWSER_ENABLE,
+    DEFAULT_VOD_EVENT_PADDING,
+    DOMAIN,
+    NAME,
+)
+from .event_cache import EventSummaryCache
 from .views import (
     get_client_for_frigate_instance_id,
     get_config_entry_for_frigate_instance_id,
@@ -36,6 +43,8 @@ from .views import (
 _LOGGER = logging.getLogger(__name__)
 
 ITEM_LIMIT = 50
+# Number of events per page of an "all" listing.
+PAGE_LIMIT = 250
 SECONDS_IN_DAY = 60 * 60 * 24
 SECONDS_IN_MONTH = SECONDS_IN_DAY * 31
 
@@ -256,6 +265,11 @@ def _to_int_or_none(data: str | int) -> int | None:
     return int(data) if data is not None else None
 
 
+def _to_float_or_none(data: str | float) -> float | None:
+    """Convert to a float or None."""
+    return float(data) if data is not None and data != "" else None
+
+
 @attr.s(frozen=True)
 class EventSearchIdentifier(Identifier):
     """Event Search Identifier."""
@@ -286,6 +300,13 @@ class EventSearchIdentifier(Identifier):
     zone: str | None = attr.ib(
         default=None, validator=[attr.validators.instance_of((str, type(None)))]
     )
+    # Start time of the last event of the previous page, pages of an "all"
+    # listing continue with the events that started before it.
+    cursor: float | None = attr.ib(
+        default=None,
+        converter=_to_float_or_none,
+        validator=[attr.validators.instance_of((float, type(None)))],
+    )
 
     @classmethod
     def from_str(
@@ -309,6 +330,7 @@ class EventSearchIdentifier(Identifier):
                 camera=cls._get_index(parts, 6),
                 label=cls._get_index(parts, 7),
                 zone=cls._get_index(parts, 8),
+                cursor=cls._get_index(parts, 9),
             )
         except ValueError:
             return None
@@ -330,6 +352,9 @@ class EventSearchIdentifier(Identifier):
                     self.zone,
                 )
             ]
+            # Only pages of an "all" listing have a cursor, leave it out
+            # otherwise to keep the identifiers as they were.
+            + ([repr(self.cursor)] if self.cursor is not None else [])
         )
 
     def is_root(self) -> bool:
@@ -706,12 +731,18 @@ class FrigateMediaSource(MediaSource):
             try:
                 events = await self._get_client(identifier).async_get_events(
                     after=identifier.after,
-                    before=identifier.before,
+                    before=(
+                        identifier.cursor
+                        if identifier.cursor is not None
+                        else identifier.before
+                    ),
                     cameras=[identifier.camera] if identifier.camera else None,
                     labels=[identifier.label] if identifier.label else None,
                     sub_labels=None,
                     zones=[identifier.zone] if identifier.zone else None,
-                    limit=10000 if identifier.name.endswith(".all") else ITEM_LIMIT,
+                    limit=(
+                        PAGE_LIMIT if identifier.name.endswith(".all") else ITEM_LIMIT
+                    ),
                     **media_kwargs,
                 )
             except FrigateApiClientError as exc:
@@ -749,28 +780,59 @@ class FrigateMediaSource(MediaSource):
     ) -> EventSummaryData:
         """Get event summary data."""
 
-        try:
-            info = await system_info.async_get_system_info(self.hass)
+        info = await system_info.async_get_system_info(self.hass)
+        timezone = info.get("timezone", "utc")
+        client = self._get_client(identifier)
 
+        async def fetch() -> EventSummaryData:
             if identifier.frigate_media_type == FrigateMediaType.CLIPS:
                 kwargs = {"has_clip": True}
             else:
                 kwargs = {"has_snapshot": True}
-            summary_data = await self._get_client(identifier).async_get_event_summary(
-                timezone=info.get("timezone", "utc"), **kwargs
+            summary_data = await client.async_get_event_summary(
+                timezone=timezone, **kwargs
+            )
+
+            # Add timestamps to raw data, rows of the same day share them.
+            timestamps: dict[str, int] = {}
+            for data in summary_data:
+                day = data["day"]
+                if (timestamp := timestamps.get(day)) is None:
+                    timestamp = timestamps[day] = int(
+                        dt.datetime.strptime(day, "%Y-%m-%d")
+                        .astimezone(DEFAULT_TIME_ZONE)
+                        .timestamp()
+                    )
+                data["timestamp"] = timestamp
+
+            return EventSummaryData.from_raw_data(summary_data)
+
+        try:
+            cache = self._get_event_summary_cache(identifier)
+            if cache is None:
+                return await fetch()
+            return cast(
+                EventSummaryData,
+                await cache.async_get((timezone, identifier.frigate_media_type), fetch),
             )
         except FrigateApiClientError as exc:
             raise MediaSourceError from exc
 
-        # Add timestamps to raw data.
-        for data in summary_data:
-            data["timestamp"] = int(
-                dt.datetime.strptime(data["day"], "%Y-%m-%d")
-                .astimezone(DEFAULT_TIME_ZONE)
-                .timestamp()
+    def _get_event_summary_cache(
+        self, identifier: Identifier
+    ) -> EventSummaryCache | None:
+        """Get the event summary cache for a given identifier."""
+        config_entry = get_config_entry_for_frigate_instance_id(
+            self.hass, identifier.frigate_instance_id
+        )
+        if config_entry:
+            return cast(
+                Optional[EventSummaryCache],
+                self.hass.data[DOMAIN]
+                .get(config_entry.entry_id, {})
+                .get(ATTR_EVENT_SUMMARY_CACHE),
             )
-
-        return EventSummaryData.from_raw_data(summary_data)
+        return None
 
     def _browse_events(
         self,
@@ -828,8 +890,13 @@ class FrigateMediaSource(MediaSource):
             )
 
         # only show the drill down options if there are more than 10 events
-        # and there is more than 1 drilldown or when you aren't showing any events
-        if len(events) > 10 and (len(drilldown_sources) > 1 or len(base.children) == 0):
+        # and there is more than 1 drilldown or when you aren't showing any events,
+        # following pages of an all source only continue the listing
+        if (
+            identifier.cursor is None
+            and len(events) > 10
+            and (len(drilldown_sources) > 1 or len(base.children) == 0)
+        ):
             base.children.extend(drilldown_sources)
 
         # add an all source if there are no drilldowns available and you are at the item limit
@@ -854,6 +921,30 @@ class FrigateMediaSource(MediaSource):
                 )
             )
 
+        # continue a full page of an all source with the events before it
+        if identifier.name.endswith(".all") and len(events) == PAGE_LIMIT:
+            start_times = [
+                event["start_time"]
+                for event in events
+                if event.get("start_time") is not None
+            ]
+            if start_times:
+                base.children.append(
+                    BrowseMediaSource(
+                        domain=DOMAIN,
+                        identifier=str(
+                            attr.evolve(identifier, cursor=min(start_times))
+                        ),
+                        media_class=MediaClass.DIRECTORY,
+                        children_media_class=MediaClass.DIRECTORY,
+                        media_content_type=identifier.media_type,
+                        title="Older",
+                        can_play=False,
+                        can_expand=True,
+                        thumbnail=None,
+                    )
+                )
+
         return base
 
     @classmethod
@@ -0,0 +1,260 @@
+"""MQTT message router for a Frigate instance."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import logging
+from typing import Any
+
+from homeassistant.components.mqtt import async_subscribe
+from homeassistant.components.mqtt.models import ReceiveMessage
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# (camera, object, zone) a decoded message handler is interested in, None
+# matches any value.
+RouteKey = tuple[str | None, str | None, str | None]
+
+
+class _TopicRoute:
+    """Handlers of a subscribed topic."""
+
+    __slots__ = ("handlers", "decoded_handlers", "unsubscribe", "retained")
+
+    def __init__(self) -> None:
+        """Initialize the route."""
+        self.handlers: list[Callable[[ReceiveMessage], None]] = []
+        self.decoded_handlers: dict[RouteKey, list[Callable[[dict], None]]] = {}
+        self.unsubscribe: CALLBACK_TYPE | None = None
+        # The broker only sends retained messages for new subscriptions, they
+        # are replayed to handlers joining an existing subscription.
+        self.retained: ReceiveMessage | None = None
+
+    def __bool__(self) -> bool:
+        """Return True if the route has handlers."""
+        return bool(self.handlers or self.decoded_handlers)
+
+
+def _payload_route(data: dict[str, Any]) -> tuple[Any, Any, list[str]]:
+    """Return the camera, object and zones of a decoded payload.
+
+    Events and reviews describe the object in "after", with the label as
+    object. Tracked object updates are flat, with their type (face, lpr,
+    classification) as object.
+    """
+    after = data.get("after")
+    if isinstance(after, dict):
+        return (
+            after.get("camera"),
+            after.get("label"),
+            after.get("current_zones") or [],
+        )
+    return data.get("camera"), data.get("type"), []
+
+
+def _route_keys(data: dict[str, Any]) -> dict[RouteKey, None]:
+    """Return the route keys matching a decoded payload, most specific first."""
+    camera, obj, zones = _payload_route(data)
+    return dict.fromkeys(
+        (camera_key, obj_key, zone_key)
+        for camera_key in (camera, None)
+        for obj_key in (obj, None)
+        for zone_key in (*zones, None)
+    )
+
+
+class FrigateMQTTRouter:
+    """Routes the MQTT messages of a Frigate instance to its entities.
+
+    Every topic is subscribed once, however many entities are interested.
+    JSON payloads are decoded once and only passed to the handlers of the
+    (camera, object, zone) they are about. Entities schedule their state
+    writes here, so an entity receiving several messages in one burst is
+    written once after the burst was handled.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the router."""
+        self._hass = hass
+        self._routes: dict[str, _TopicRoute] = {}
+        self._pending_writes: dict[Entity, None] = {}
+        self._flush_handle: Any = None
+
+        self._messages = 0
+        self._decoded = 0
+        self._dispatched = 0
+        self._write_requests = 0
+        self._writes = 0
+
+    async def async_subscribe(
+        self,
+        topic: str,
+        msg_callback: Callable[[Any], None],
+        route_key: RouteKey | None = None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a callback to a topic, returning a callable to remove it.
+
+        Without route_key the callback gets the ReceiveMessage. With a
+        route_key it gets the decoded JSON payload of the messages matching
+        the key.
+        """
+        route = self._routes.get(topic)
+        created = route is None
+        if route is None:
+            route = self._routes[topic] = _TopicRoute()
+
+        if route_key is None:
+            route.handlers.append(msg_callback)
+        else:
+            route.decoded_handlers.setdefault(route_key, []).append(msg_callback)
+
+        @callback
+        def remove() -> None:
+            if route_key is None:
+                route.handlers.remove(msg_callback)
+            else:
+                handlers = route.decoded_handlers[route_key]
+                handlers.remove(msg_callback)
+                if not handlers:
+                    del route.decoded_handlers[route_key]
+            if not route and self._routes.get(topic) is route:
+                del self._routes[topic]
+                if route.unsubscribe is not None:
+                    route.unsubscribe()
+                    route.unsubscribe = None
+
+        if not created:
+            if route.retained is not None:
+                self._hass.loop.call_soon(
+                    self._replay_retained, route, msg_callback, route_key
+                )
+        else:
+
+            @callback
+            def receive(msg: ReceiveMessage) -> None:
+                self._receive_message(route, msg)
+
+            unsubscribe = await async_subscribe(
+                self._hass, topic, receive, qos=0, encoding=None
+            )
+            if self._routes.get(topic) is route:
+                route.unsubscribe = unsubscribe
+            else:
+                # All handlers were removed while subscribing.
+                unsubscribe()
+
+        return remove
+
+    @callback
+    def _receive_message(self, route: _TopicRoute, msg: ReceiveMessage) -> None:
+        """Handle a new received MQTT message."""
+        self._messages += 1
+        if msg.retain:
+            # An empty retained message clears the retained message.
+            route.retained = msg if msg.payload else None
+
+        for handler in tuple(route.handlers):
+            self._call(handler, msg)
+        if not route.decoded_handlers:
+            return
+
+        if (data := self._decode(msg)) is None:
+            return
+        for key in _route_keys(data):
+            for handler in tuple(route.decoded_handlers.get(key, ())):
+                self._dispatched += 1
+                self._call(handler, data)
+
+    @callback
+    def _replay_retained(
+        self,
+        route: _TopicRoute,
+        msg_callback: Callable[[Any], None],
+        route_key: RouteKey | None,
+    ) -> None:
+        """Pass the retained message of a topic to a new handler."""
+        if (msg := route.retained) is None:
+            return
+        if route_key is None:
+            if msg_callback in route.handlers:
+                self._call(msg_callback, msg)
+            return
+        if msg_callback not in route.decoded_handlers.get(route_key, ()):
+            return
+        if (data := self._decode(msg)) is not None and route_key in _route_keys(data):
+            self._dispatched += 1
+            self._call(msg_callback, data)
+
+    def _decode(self, msg: ReceiveMessage) -> dict[str, Any] | None:
+        """Decode a JSON payload, None if it isn't a JSON object."""
+        try:
+            data = json.loads(msg.payload)
+        except (ValueError, TypeError):
+            data = None
+        if not isinstance(data, dict):
+            _LOGGER.debug("Unable to decode message on %s: %s", msg.topic, msg.payload)
+            return None
+        self._decoded += 1
+        return data
+
+    @staticmethod
+    def _call(handler: Callable[[Any], None], arg: Any) -> None:
+        """Call a handler, a failing handler must not affect the others."""
+        try:
+            handler(arg)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error handling Frigate MQTT message")
+
+    @callback
+    def async_schedule_write(self, entity: Entity) -> None:
+        """Write the state of an entity once the current burst was handled."""
+        self._write_requests += 1
+        self._pending_writes[entity] = None
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_soon(self._flush_writes)
+
+    @callback
+    def async_cancel_write(self, entity: Entity) -> None:
+        """Drop a scheduled write of an entity, e.g. when it is removed."""
+        self._pending_writes.pop(entity, None)
+
+    @callback
+    def _flush_writes(self) -> None:
+        self._flush_handle = None
+        entities, self._pending_writes = self._pending_writes, {}
+        for entity in entities:
+            self._writes += 1
+            entity.async_write_ha_state()
+
+    @callback
+    def async_unsubscribe_all(self) -> None:
+        """Unsubscribe all topics and drop scheduled writes."""
+        for route in self._routes.values():
+            if route.unsubscribe is not None:
+                route.unsubscribe()
+                route.unsubscribe = None
+        self._routes = {}
+        self._pending_writes = {}
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Return routing statistics."""
+        return {
+            "topics": len(self._routes),
+            "handlers": sum(
+                len(route.handlers)
+                + sum(len(handlers) for handlers in route.decoded_handlers.values())
+                for route in self._routes.values()
+            ),
+            "messages": self._messages,
+            "decoded_messages": self._decoded,
+            "decoded_dispatches": self._dispatched,
+            "write_requests": self._write_requests,
+            "writes": self._writes,
+        }
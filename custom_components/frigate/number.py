@@ -110,7 +110,7 @@ class FrigateMotionContourArea(FrigateMQTTEntity, NumberEntity):
         except (TypeError, ValueError):
             pass
 
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
@@ -203,7 +203,7 @@ class FrigateMotionThreshold(FrigateMQTTEntity, NumberEntity):
         except (TypeError, ValueError):
             pass
 
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from collections.abc import Callable
 import datetime
-import json
 import logging
 from typing import Any
 
@@ -754,7 +753,7 @@ class FrigateObjectCountSensor(FrigateMQTTEntity, SensorEntity):
         """Handle a new received MQTT state message."""
         try:
             self._state = int(msg.payload)
-            self.async_write_ha_state()
+            self.async_schedule_write_ha_state()
         except ValueError:
             pass
 
@@ -843,7 +842,7 @@ class FrigateActiveObjectCountSensor(FrigateMQTTEntity, SensorEntity):
         """Handle a new received MQTT state message."""
         try:
             self._state = int(msg.payload)
-            self.async_write_ha_state()
+            self.async_schedule_write_ha_state()
         except ValueError:
             pass
 
@@ -1070,36 +1069,24 @@ class FrigateRecognizedFaceSensor(FrigateMQTTEntity, SensorEntity):
                         f"{self._frigate_config['mqtt']['topic_prefix']}"
                         "/tracked_object_update"
                     ),
-                    "encoding": None,
+                    "route_key": (self._cam_name, "face", None),
                 },
             },
         )
 
     @callback
-    def _state_message_received(self, msg: ReceiveMessage) -> None:
-        """Handle a new received MQTT state message."""
-        try:
-            data: dict[str, Any] = json.loads(msg.payload)
+    def _state_message_received(self, data: dict[str, Any]) -> None:
+        """Handle a new received face recognition of the camera."""
+        self._state = data["name"]
+        self.async_schedule_write_ha_state()
 
-            if data.get("type") != "face":
-                return
+        if self._clear_state_callable:
+            self._clear_state_callable()
+            self._clear_state_callable = None
 
-            if data.get("camera") != self._cam_name:
-                return
-
-            self._state = data["name"]
-            self.async_write_ha_state()
-
-            if self._clear_state_callable:
-                self._clear_state_callable()
-                self._clear_state_callable = None
-
-            self._clear_state_callable = async_call_later(
-                self.hass, datetime.timedelta(seconds=60), self.clear_recognized_face
-            )
-
-        except ValueError:
-            pass
+        self._clear_state_callable = async_call_later(
+            self.hass, datetime.timedelta(seconds=60), self.clear_recognized_face
+        )
 
     @callback
     def clear_recognized_face(self, _now: datetime.datetime) -> None:
@@ -1173,39 +1160,28 @@ class FrigateRecognizedPlateSensor(FrigateMQTTEntity, SensorEntity):
                         f"{self._frigate_config['mqtt']['topic_prefix']}"
                         "/tracked_object_update"
                     ),
-                    "encoding": None,
+                    "route_key": (self._cam_name, "lpr", None),
                 },
             },
         )
 
     @callback
-    def _state_message_received(self, msg: ReceiveMessage) -> None:
-        """Handle a new received MQTT state message."""
-        try:
-            data: dict[str, Any] = json.loads(msg.payload)
-
-            if data.get("type") != "lpr":
-                return
-
-            if data.get("camera") != self._cam_name:
-                return
-
-            if data.get("name"):
-                self._state = str(data["name"]).title()
-            else:
-                self._state = str(data["plate"])
+    def _state_message_received(self, data: dict[str, Any]) -> None:
+        """Handle a new received license plate recognition of the camera."""
+        if data.get("name"):
+            self._state = str(data["name"]).title()
+        else:
+            self._state = str(data["plate"])
 
-            self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
-            if self._clear_state_callable:
-                self._clear_state_callable()
-                self._clear_state_callable = None
+        if self._clear_state_callable:
+            self._clear_state_callable()
+            self._clear_state_callable = None
 
-            self._clear_state_callable = async_call_later(
-                self.hass, datetime.timedelta(seconds=60), self.clear_recognized_plate
-            )
-        except ValueError:
-            pass
+        self._clear_state_callable = async_call_later(
+            self.hass, datetime.timedelta(seconds=60), self.clear_recognized_plate
+        )
 
     @callback
     def clear_recognized_plate(self, _now: datetime.datetime) -> None:
@@ -1308,7 +1284,7 @@ class FrigateClassificationSensor(FrigateMQTTEntity, RestoreSensor):
 
         if payload:
             self._state = payload
-            self.async_write_ha_state()
+            self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
@@ -1377,23 +1353,15 @@ class FrigateObjectClassificationSensor(FrigateMQTTEntity, SensorEntity):
                         f"{self._frigate_config['mqtt']['topic_prefix']}"
                         "/tracked_object_update"
                     ),
-                    "encoding": None,
+                    "route_key": (self._cam_name, "classification", None),
                 },
             },
         )
 
     @callback
-    def _state_message_received(self, msg: ReceiveMessage) -> None:
-        """Handle a new received MQTT state message."""
+    def _state_message_received(self, data: dict[str, Any]) -> None:
+        """Handle a new received classification of the camera."""
         try:
-            data: dict[str, Any] = json.loads(msg.payload)
-
-            if data.get("type") != "classification":
-                return
-
-            if data.get("camera") != self._cam_name:
-                return
-
             if data.get("model") != self._model_key:
                 return
 
@@ -1405,7 +1373,7 @@ class FrigateObjectClassificationSensor(FrigateMQTTEntity, SensorEntity):
             else:
                 return
 
-            self.async_write_ha_state()
+            self.async_schedule_write_ha_state()
 
             if self._clear_state_callable:
                 self._clear_state_callable()
@@ -1506,7 +1474,7 @@ class FrigateReviewStatusSensor(FrigateMQTTEntity, SensorEntity):
         )
 
         self._state = payload
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
@@ -1572,27 +1540,22 @@ class FrigateGlobalFaceSensor(FrigateMQTTEntity, SensorEntity):
                         f"{self._frigate_config['mqtt']['topic_prefix']}"
                         "/tracked_object_update"
                     ),
-                    "encoding": None,
+                    "route_key": (None, "face", None),
                 },
             },
         )
 
     @callback
-    def _state_message_received(self, msg: ReceiveMessage) -> None:
-        """Handle a new received MQTT state message."""
+    def _state_message_received(self, data: dict[str, Any]) -> None:
+        """Handle a new received face recognition."""
         try:
-            data: dict[str, Any] = json.loads(msg.payload)
-
-            if data.get("type") != "face":
-                return
-
             if data.get("name") != self._face_name:
                 return
 
             camera = data.get("camera")
             if camera:
                 self._state = get_friendly_name(camera)
-                self.async_write_ha_state()
+                self.async_schedule_write_ha_state()
 
         except (ValueError, KeyError):
             pass
@@ -1658,20 +1621,15 @@ class FrigateGlobalPlateSensor(FrigateMQTTEntity, SensorEntity):
                         f"{self._frigate_config['mqtt']['topic_prefix']}"
                         "/tracked_object_update"
                     ),
-                    "encoding": None,
+                    "route_key": (None, "lpr", None),
                 },
             },
         )
 
     @callback
-    def _state_message_received(self, msg: ReceiveMessage) -> None:
-        """Handle a new received MQTT state message."""
+    def _state_message_received(self, data: dict[str, Any]) -> None:
+        """Handle a new received license plate recognition."""
         try:
-            data: dict[str, Any] = json.loads(msg.payload)
-
-            if data.get("type") != "lpr":
-                return
-
             # Only check name - plate number only appears when not recognized
             plate_name = data.get("name")
             if not plate_name or plate_name != self._plate_name:
@@ -1680,7 +1638,7 @@ class FrigateGlobalPlateSensor(FrigateMQTTEntity, SensorEntity):
             camera = data.get("camera")
             if camera:
                 self._state = get_friendly_name(camera)
-                self.async_write_ha_state()
+                self.async_schedule_write_ha_state()
 
         except (ValueError, KeyError):
             pass
@@ -1748,20 +1706,15 @@ class FrigateGlobalObjectClassificationSensor(FrigateMQTTEntity, SensorEntity):
                         f"{self._frigate_config['mqtt']['topic_prefix']}"
                         "/tracked_object_update"
                     ),
-                    "encoding": None,
+                    "route_key": (None, "classification", None),
                 },
             },
         )
 
     @callback
-    def _state_message_received(self, msg: ReceiveMessage) -> None:
-        """Handle a new received MQTT state message."""
+    def _state_message_received(self, data: dict[str, Any]) -> None:
+        """Handle a new received classification."""
         try:
-            data: dict[str, Any] = json.loads(msg.payload)
-
-            if data.get("type") != "classification":
-                return
-
             if data.get("model") != self._model_key:
                 return
 
@@ -1778,7 +1731,7 @@ class FrigateGlobalObjectClassificationSensor(FrigateMQTTEntity, SensorEntity):
             camera = data.get("camera")
             if camera:
                 self._state = get_friendly_name(camera)
-                self.async_write_ha_state()
+                self.async_schedule_write_ha_state()
 
         except (ValueError, KeyError):
             pass
@@ -0,0 +1,126 @@
+"""Shared cache of Frigate camera snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+# Snapshots are reused for at most this many seconds.
+SNAPSHOT_CACHE_TTL = 2.0
+
+
+class SnapshotCache:
+    """Cache of the latest.jpg snapshots of the cameras of a Frigate instance.
+
+    Every dashboard, the HomeKit bridge and notifications request the camera
+    image separately. Images are cached per camera and requested size for
+    SNAPSHOT_CACHE_TTL seconds, and concurrent requests for the same image
+    share a single fetch. The fetch runs in its own task, so a cancelled
+    request doesn't cancel it for the others. The cache of a camera is
+    invalidated when its MQTT state changes, so a new frame is fetched right
+    away.
+    """
+
+    def __init__(self, hass: HomeAssistant, ttl: float = SNAPSHOT_CACHE_TTL) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._ttl = ttl
+        # camera -> (width, height) -> (expiry, image)
+        self._images: dict[str, dict[tuple[int | None, int | None], Any]] = {}
+        self._pending: dict[
+            tuple[str, int | None, int | None], asyncio.Task[bytes | None]
+        ] = {}
+        # Bumped on every invalidation, fetches started before aren't stored.
+        self._generations: dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._shared = 0
+        self._invalidations = 0
+
+    async def async_get(
+        self,
+        camera: str,
+        width: int | None,
+        height: int | None,
+        fetch: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes | None:
+        """Return the image of a camera, calling fetch when not cached."""
+        size = (width, height)
+        cached = self._images.get(camera, {}).get(size)
+        if cached is not None and cached[0] > time.monotonic():
+            self._hits += 1
+            return cached[1]
+
+        key = (camera, width, height)
+        if (task := self._pending.get(key)) is not None:
+            self._shared += 1
+        else:
+            self._misses += 1
+            task = self._hass.async_create_task(
+                self._async_fetch(camera, size, fetch),
+                f"frigate snapshot {camera}",
+            )
+            if not task.done():
+                self._pending[key] = task
+                task.add_done_callback(partial(self._fetch_done, key))
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self,
+        camera: str,
+        size: tuple[int | None, int | None],
+        fetch: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes | None:
+        generation = self._generations.get(camera, 0)
+        image = await fetch()
+        if image is not None and self._generations.get(camera, 0) == generation:
+            self._store(camera, size, image)
+        return image
+
+    def _fetch_done(
+        self,
+        key: tuple[str, int | None, int | None],
+        task: asyncio.Task[bytes | None],
+    ) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        # Mark a failure as retrieved, all requests may have been cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def _store(
+        self, camera: str, size: tuple[int | None, int | None], image: bytes
+    ) -> None:
+        now = time.monotonic()
+        images = self._images.setdefault(camera, {})
+        for stale in [key for key, (expiry, _) in images.items() if expiry <= now]:
+            del images[stale]
+        images[size] = (now + self._ttl, image)
+
+    def invalidate(self, camera: str) -> None:
+        """Drop the cached images of a camera."""
+        self._generations[camera] = self._generations.get(camera, 0) + 1
+        if self._images.pop(camera, None):
+            self._invalidations += 1
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        requests = self._hits + self._shared + self._misses
+        return {
+            "ttl": self._ttl,
+            "cached_images": sum(len(images) for images in self._images.values()),
+            "requests": requests,
+            "hits": self._hits,
+            "shared_fetches": self._shared,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "hit_ratio": (
+                round((self._hits + self._shared) / requests, 3) if requests else None
+            ),
+        }
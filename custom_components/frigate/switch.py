@@ -160,7 +160,7 @@ class FrigateSwitch(FrigateMQTTEntity, SwitchEntity):
     def _state_message_received(self, msg: ReceiveMessage) -> None:
         """Handle a new received MQTT state message."""
         self._is_on = decode_if_necessary(msg.payload) == "ON"
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     @property
     def unique_id(self) -> str:
@@ -6,14 +6,10 @@ import logging
 
 from homeassistant.components import websocket_api
 from homeassistant.components.mqtt.models import ReceiveMessage
-from homeassistant.components.mqtt.subscription import (
-    EntitySubscription,
-    async_prepare_subscribe_topics,
-    async_subscribe_topics,
-    async_unsubscribe_topics,
-)
 from homeassistant.components.websocket_api import messages
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .mqtt_router import FrigateMQTTRouter
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -27,16 +23,11 @@ class WSEventProxy:
     within HA.
     """
 
-    def __init__(self, hass: HomeAssistant, topic_prefix: str) -> None:
+    def __init__(self, router: FrigateMQTTRouter, topic_prefix: str) -> None:
         self._subscriptions: dict[int, websocket_api.ActiveConnection] = {}
-        self._topics = {
-            "events": {
-                "topic": f"{topic_prefix}/events",
-                "msg_callback": lambda msg: self._receive_message(hass, msg),
-                "qos": 0,
-            }
-        }
-        self._sub_state: dict[str, EntitySubscription] | None = None
+        self._router = router
+        self._topic = f"{topic_prefix}/events"
+        self._unsubscribe_topic: CALLBACK_TYPE | None = None
 
     async def subscribe(
         self,
@@ -46,11 +37,10 @@ class WSEventProxy:
     ) -> int:
         """Subscribe to events."""
 
-        if self._sub_state is None:
-            self._sub_state = async_prepare_subscribe_topics(
-                hass, self._sub_state, self._topics
+        if self._unsubscribe_topic is None:
+            self._unsubscribe_topic = await self._router.async_subscribe(
+                self._topic, self._receive_message
             )
-            await async_subscribe_topics(hass, self._sub_state)
 
         # Add a callback to the websocket to unsubscribe if closed.
         connection.subscriptions[subscription_id] = lambda: self._unsubscribe_internal(
@@ -81,9 +71,9 @@ class WSEventProxy:
             return False
         self._subscriptions.pop(subscription_id)
 
-        if not self._subscriptions:
-            async_unsubscribe_topics(hass, self._sub_state)
-            self._sub_state = None
+        if not self._subscriptions and self._unsubscribe_topic is not None:
+            self._unsubscribe_topic()
+            self._unsubscribe_topic = None
         return True
 
     def unsubscribe_all(self, hass: HomeAssistant) -> None:
@@ -91,13 +81,14 @@ class WSEventProxy:
         for subscription_id in list(self._subscriptions.keys()):
             self.unsubscribe(hass, subscription_id)
 
-    def _receive_message(self, hass: HomeAssistant, msg: ReceiveMessage) -> None:
+    @callback
+    def _receive_message(self, msg: ReceiveMessage) -> None:
         """Handle a new received MQTT message."""
-
-        async def proxy() -> None:
-            for id, connection in self._subscriptions.items():
-                connection.send_message(messages.event_message(id, msg.payload))
-
-        # Must proxy in the executor pool to ensure threadsafety. Otherwise:
-        # `RuntimeError: Non-thread-safe operation invoked on an event loop other than the current one``
-        hass.create_task(proxy())
+        # The router calls back in the event loop, so the messages can be sent
+        # right away instead of from a task per message. The router subscribes
+        # without encoding, the payload is decoded here as it is sent as JSON.
+        payload = msg.payload
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+        for id, connection in self._subscriptions.items():
+            connection.send_message(messages.event_message(id, payload))
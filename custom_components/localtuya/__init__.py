@@ -38,10 +38,12 @@ from .const import (
     CONF_USER_ID,
     DATA_CLOUD,
     DATA_DISCOVERY,
+    DATA_SCHEDULER,
     DOMAIN,
     TUYA_DEVICES,
 )
 from .discovery import TuyaDiscovery
+from .scheduler import DeviceScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +70,7 @@ async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the LocalTuya integration component."""
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][TUYA_DEVICES] = {}
+    hass.data[DOMAIN][DATA_SCHEDULER] = DeviceScheduler(hass)
 
     device_cache = {}
 
@@ -3,7 +3,6 @@ import asyncio
 import json.decoder
 import logging
 import time
-from datetime import timedelta
 
 from homeassistant.const import (
     CONF_DEVICE_ID,
@@ -21,7 +20,6 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import pytuya
@@ -37,12 +35,16 @@ from .const import (
     CONF_RESET_DPIDS,
     CONF_RESTORE_ON_RECONNECT,
     DATA_CLOUD,
+    DATA_SCHEDULER,
     DOMAIN,
     TUYA_DEVICES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# DPs set within this many seconds of each other are sent in a single command
+WRITE_COALESCE_DELAY = 0.02
+
 
 def prepare_setup_entities(hass, config_entry, platform):
     """Prepare ro setup entities for a platform."""
@@ -92,13 +94,18 @@ async def async_setup_entry(
                     if dp_conf in entity_config:
                         tuyainterface.dps_to_request[entity_config[dp_conf]] = None
 
-                entities.append(
-                    entity_class(
-                        tuyainterface,
-                        dev_entry,
-                        entity_config[CONF_ID],
-                    )
+                entity = entity_class(
+                    tuyainterface,
+                    dev_entry,
+                    entity_config[CONF_ID],
+                )
+                # Only changes of the DPs the entity is configured with update it
+                entity.watch_dps(
+                    entity_config[dp_conf]
+                    for dp_conf in dps_config_fields
+                    if dp_conf in entity_config
                 )
+                entities.append(entity)
     # Once the entities have been created, add to the TuyaDevice instance
     tuyainterface.add_entities(entities)
     async_add_entities(entities)
@@ -147,7 +154,23 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
         self._connect_task = None
         self._disconnect_task = None
         self._unsub_interval = None
+        self._unsub_heartbeat = None
+        self._heartbeat_skipped = False
+        self._heartbeat_stats = {
+            "sent": 0,
+            "skipped": 0,
+            "missed": 0,
+            "last_rtt": None,
+            "max_rtt": 0.0,
+            "total_rtt": 0.0,
+        }
         self._entities = []
+        # DP id -> handlers called with the status when that DP changes
+        self._dp_listeners = {}
+        # Set when all entities need the next status, e.g. after a reconnect
+        self._resync = True
+        self._pending_dps = {}
+        self._pending_write = None
         self._local_key = self._dev_config_entry[CONF_LOCAL_KEY]
         self._default_reset_dpids = None
         if CONF_RESET_DPIDS in self._dev_config_entry:
@@ -167,6 +190,22 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
         """Set the entities associated with this device."""
         self._entities.extend(entities)
 
+    @callback
+    def async_subscribe_dps(self, dp_ids, handler):
+        """Call handler with the device status when one of dp_ids changes."""
+        dp_ids = [str(dp_id) for dp_id in dp_ids]
+        for dp_id in dp_ids:
+            self._dp_listeners.setdefault(dp_id, []).append(handler)
+
+        @callback
+        def unsubscribe():
+            for dp_id in dp_ids:
+                handlers = self._dp_listeners.get(dp_id)
+                if handlers and handler in handlers:
+                    handlers.remove(handler)
+
+        return unsubscribe
+
     @property
     def is_connecting(self):
         """Return whether device is currently connecting."""
@@ -213,7 +252,7 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
                     if status is None:
                         raise Exception("Failed to retrieve status")
 
-                    self._interface.start_heartbeat()
+                    self._async_start_heartbeat()
                     self.status_updated(status)
 
                 except Exception as ex:
@@ -232,7 +271,7 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
                         if status is None or not status:
                             raise Exception("Failed to retrieve status") from ex
 
-                        self._interface.start_heartbeat()
+                        self._async_start_heartbeat()
                         self.status_updated(status)
                     else:
                         self.error("Initial state update failed, giving up: %r", ex)
@@ -271,10 +310,12 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
                 CONF_SCAN_INTERVAL in self._dev_config_entry
                 and int(self._dev_config_entry[CONF_SCAN_INTERVAL]) > 0
             ):
-                self._unsub_interval = async_track_time_interval(
-                    self._hass,
+                self._unsub_interval = self._hass.data[DOMAIN][
+                    DATA_SCHEDULER
+                ].async_add_job(
+                    f"DP refresh of {self._dev_config_entry[CONF_HOST]}",
+                    int(self._dev_config_entry[CONF_SCAN_INTERVAL]),
                     self._async_refresh,
-                    timedelta(seconds=int(self._dev_config_entry[CONF_SCAN_INTERVAL])),
                 )
 
             self.info(f"Successfully connected to {self._dev_config_entry[CONF_HOST]}")
@@ -297,16 +338,91 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
             )
             self.info("local_key updated for device %s.", dev_id)
 
-    async def _async_refresh(self, _now):
+    async def _async_refresh(self):
         if self._interface is not None:
             await self._interface.update_dps()
 
+    @callback
+    def _async_start_heartbeat(self):
+        """Add the heartbeats of the connection to the shared scheduler."""
+        if self._unsub_heartbeat is None:
+            self._heartbeat_skipped = False
+            self._unsub_heartbeat = self._hass.data[DOMAIN][
+                DATA_SCHEDULER
+            ].async_add_job(
+                f"heartbeat of {self._dev_config_entry[CONF_HOST]}",
+                pytuya.HEARTBEAT_INTERVAL,
+                self._async_heartbeat,
+            )
+
+    @callback
+    def _async_stop_timers(self):
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+            self._unsub_heartbeat = None
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+
+    async def _async_heartbeat(self):
+        """Send a heartbeat unless the device pushed a status recently.
+
+        The device must hear from us as well, so no two heartbeats in a row
+        are skipped.
+        """
+        interface = self._interface
+        if interface is None:
+            return
+
+        loop = self._hass.loop
+        stats = self._heartbeat_stats
+        if (
+            not self._heartbeat_skipped
+            and interface.last_pushed is not None
+            and loop.time() - interface.last_pushed < pytuya.HEARTBEAT_INTERVAL
+        ):
+            self._heartbeat_skipped = True
+            stats["skipped"] += 1
+            return
+        self._heartbeat_skipped = False
+
+        start = loop.time()
+        stats["sent"] += 1
+        if not await interface.send_heartbeat():
+            stats["missed"] += 1
+            return
+
+        rtt = loop.time() - start
+        stats["last_rtt"] = rtt
+        stats["max_rtt"] = max(stats["max_rtt"], rtt)
+        stats["total_rtt"] += rtt
+
+    @property
+    def heartbeat_diagnostics(self):
+        """Return heartbeat counters and round trip times."""
+        stats = self._heartbeat_stats
+        answered = stats["sent"] - stats["missed"]
+        return {
+            "connected": self.connected,
+            "heartbeats_sent": stats["sent"],
+            "heartbeats_skipped": stats["skipped"],
+            "heartbeats_missed": stats["missed"],
+            "last_rtt_ms": round(stats["last_rtt"] * 1000, 1)
+            if stats["last_rtt"] is not None
+            else None,
+            "max_rtt_ms": round(stats["max_rtt"] * 1000, 1),
+            "avg_rtt_ms": round(stats["total_rtt"] / answered * 1000, 1)
+            if answered
+            else None,
+        }
+
     async def close(self):
         """Close connection and stop re-connect loop."""
         self._is_closing = True
         if self._connect_task is not None:
             self._connect_task.cancel()
             await self._connect_task
+        self._async_stop_timers()
         if self._interface is not None:
             await self._interface.close()
         if self._disconnect_task is not None:
@@ -318,33 +434,77 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
 
     async def set_dp(self, state, dp_index):
         """Change value of a DP of the Tuya device."""
-        if self._interface is not None:
-            try:
-                await self._interface.set_dp(state, dp_index)
-            except Exception:  # pylint: disable=broad-except
-                self.exception("Failed to set DP %d to %s", dp_index, str(state))
-        else:
+        await self._async_queue_dps({str(dp_index): state})
+
+    async def set_dps(self, states):
+        """Change value of a DPs of the Tuya device."""
+        await self._async_queue_dps(
+            {str(dp_index): state for dp_index, state in states.items()}
+        )
+
+    async def _async_queue_dps(self, states):
+        """Queue DP values and wait until they were sent.
+
+        Values queued within WRITE_COALESCE_DELAY, e.g. by several entities of
+        the device changed by one scene, are sent as a single command.
+        """
+        if self._interface is None:
             self.error(
                 "Not connected to device %s", self._dev_config_entry[CONF_FRIENDLY_NAME]
             )
+            return
+
+        self._pending_dps.update(states)
+        if self._pending_write is None:
+            self._pending_write = self._hass.async_create_task(
+                self._async_write_pending_dps()
+            )
+        await asyncio.shield(self._pending_write)
 
-    async def set_dps(self, states):
-        """Change value of a DPs of the Tuya device."""
-        if self._interface is not None:
-            try:
-                await self._interface.set_dps(states)
-            except Exception:  # pylint: disable=broad-except
-                self.exception("Failed to set DPs %r", states)
-        else:
+    async def _async_write_pending_dps(self):
+        await asyncio.sleep(WRITE_COALESCE_DELAY)
+        states = self._pending_dps
+        self._pending_dps = {}
+        self._pending_write = None
+
+        if self._interface is None:
             self.error(
                 "Not connected to device %s", self._dev_config_entry[CONF_FRIENDLY_NAME]
             )
+            return
+        try:
+            await self._interface.set_dps(states)
+        except Exception:  # pylint: disable=broad-except
+            self.exception("Failed to set DPs %r", states)
 
     @callback
     def status_updated(self, status):
-        """Device updated status."""
+        """Device updated status.
+
+        Only the entities using a DP that changed are notified, unless all of
+        them need the status again.
+        """
+        if self._resync:
+            self._resync = False
+            self._status.update(status)
+            self._dispatch_status()
+            return
+
+        changed = [
+            dp_id
+            for dp_id, value in status.items()
+            if dp_id not in self._status or self._status[dp_id] != value
+        ]
+        if not changed:
+            return
         self._status.update(status)
-        self._dispatch_status()
+
+        handlers = {}
+        for dp_id in changed:
+            for handler in self._dp_listeners.get(dp_id, ()):
+                handlers[handler] = None
+        for handler in handlers:
+            handler(self._status)
 
     def _dispatch_status(self):
         signal = f"localtuya_{self._dev_config_entry[CONF_DEVICE_ID]}"
@@ -355,9 +515,8 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
         """Device disconnected."""
         signal = f"localtuya_{self._dev_config_entry[CONF_DEVICE_ID]}"
         async_dispatcher_send(self._hass, signal, None)
-        if self._unsub_interval is not None:
-            self._unsub_interval()
-            self._unsub_interval = None
+        self._resync = True
+        self._async_stop_timers()
         self._interface = None
 
         if self._connect_task is not None:
@@ -376,6 +535,7 @@ class LocalTuyaEntity(RestoreEntity, pytuya.ContextualLogger):
         self._dev_config_entry = config_entry
         self._config = get_entity_config(config_entry, dp_id)
         self._dp_id = dp_id
+        self._watched_dps = {str(dp_id)}
         self._status = {}
         self._state = None
         self._last_state = None
@@ -420,10 +580,17 @@ class LocalTuyaEntity(RestoreEntity, pytuya.ContextualLogger):
         self.async_on_remove(
             async_dispatcher_connect(self.hass, signal, _update_handler)
         )
+        self.async_on_remove(
+            self._device.async_subscribe_dps(self._watched_dps, _update_handler)
+        )
 
         signal = f"localtuya_entity_{self._dev_config_entry[CONF_DEVICE_ID]}"
         async_dispatcher_send(self.hass, signal, self.entity_id)
 
+    def watch_dps(self, dp_ids):
+        """Add DPs whose changes update the state of the entity."""
+        self._watched_dps.update(str(dp_id) for dp_id in dp_ids)
+
     @property
     def extra_state_attributes(self):
         """Return entity specific state attributes to be saved.
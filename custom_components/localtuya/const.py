@@ -4,6 +4,7 @@ DOMAIN = "localtuya"
 
 DATA_DISCOVERY = "discovery"
 DATA_CLOUD = "cloud_data"
+DATA_SCHEDULER = "scheduler"
 
 # Platforms in this list must support config flows
 PLATFORMS = [
@@ -10,11 +10,20 @@ from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_DEVICES
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from .const import CONF_LOCAL_KEY, CONF_USER_ID, DATA_CLOUD, DOMAIN
+from .const import (
+    CONF_LOCAL_KEY,
+    CONF_USER_ID,
+    DATA_CLOUD,
+    DATA_SCHEDULER,
+    DOMAIN,
+    TUYA_DEVICES,
+)
 
 CLOUD_DEVICES = "cloud_devices"
 DEVICE_CONFIG = "device_config"
 DEVICE_CLOUD_INFO = "device_cloud_info"
+DEVICE_HEARTBEAT = "device_heartbeat"
+SCHEDULER = "scheduler"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +48,7 @@ async def async_get_config_entry_diagnostics(
         local_key = data[CLOUD_DEVICES][dev_id][CONF_LOCAL_KEY]
         local_key_obfuscated = f"{local_key[0:3]}...{local_key[-3:]}"
         data[CLOUD_DEVICES][dev_id][CONF_LOCAL_KEY] = local_key_obfuscated
+    data[SCHEDULER] = hass.data[DOMAIN][DATA_SCHEDULER].diagnostics
     return data
 
 
@@ -61,5 +71,9 @@ async def async_get_device_diagnostics(
         # local_key_obfuscated = "{local_key[0:3]}...{local_key[-3:]}"
         # data[DEVICE_CLOUD_INFO][CONF_LOCAL_KEY] = local_key_obfuscated
 
+    if dev_id in hass.data[DOMAIN][TUYA_DEVICES]:
+        device = hass.data[DOMAIN][TUYA_DEVICES][dev_id]
+        data[DEVICE_HEARTBEAT] = device.heartbeat_diagnostics
+
     # data["log"] = hass.data[DOMAIN][CONF_DEVICES][dev_id].logger.retrieve_log()
     return data
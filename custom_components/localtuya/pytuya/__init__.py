@@ -147,6 +147,11 @@ MESSAGE_RECV_HEADER_FMT = ">5I"  # 4*uint32: prefix, seqno, cmd, length, retcode
 MESSAGE_RETCODE_FMT = ">I"  # retcode for received messages
 MESSAGE_END_FMT = ">2I"  # 2*uint32: crc, suffix
 MESSAGE_END_FMT_HMAC = ">32sI"  # 32s:hmac, uint32:suffix
+MESSAGE_HEADER = struct.Struct(MESSAGE_HEADER_FMT)
+MESSAGE_RECV_HEADER = struct.Struct(MESSAGE_RECV_HEADER_FMT)
+MESSAGE_RETCODE = struct.Struct(MESSAGE_RETCODE_FMT)
+MESSAGE_END = struct.Struct(MESSAGE_END_FMT)
+MESSAGE_END_HMAC = struct.Struct(MESSAGE_END_FMT_HMAC)
 PREFIX_VALUE = 0x000055AA
 PREFIX_BIN = b"\x00\x00U\xaa"
 SUFFIX_VALUE = 0x0000AA55
@@ -287,12 +292,17 @@ def pack_message(msg, hmac_key=None):
 
 
 def unpack_message(data, hmac_key=None, header=None, no_retcode=False, logger=None):
-    """Unpack bytes into a TuyaMessage."""
-    end_fmt = MESSAGE_END_FMT_HMAC if hmac_key else MESSAGE_END_FMT
+    """Unpack bytes into a TuyaMessage.
+
+    data may be any bytes-like object, e.g. a memoryview of a receive buffer.
+    The checksum is verified over a view of it, so the payload is the only
+    part that gets copied.
+    """
+    end = MESSAGE_END_HMAC if hmac_key else MESSAGE_END
     # 4-word header plus return code
-    header_len = struct.calcsize(MESSAGE_HEADER_FMT)
-    retcode_len = 0 if no_retcode else struct.calcsize(MESSAGE_RETCODE_FMT)
-    end_len = struct.calcsize(end_fmt)
+    header_len = MESSAGE_HEADER.size
+    retcode_len = 0 if no_retcode else MESSAGE_RETCODE.size
+    end_len = end.size
     headret_len = header_len + retcode_len
 
     if len(data) < headret_len + end_len:
@@ -314,23 +324,17 @@ def unpack_message(data, hmac_key=None, header=None, no_retcode=False, logger=No
         )
         raise DecodeError("Not enough data to unpack payload")
 
-    retcode = (
-        0
-        if no_retcode
-        else struct.unpack(MESSAGE_RETCODE_FMT, data[header_len:headret_len])[0]
-    )
     # the retcode is technically part of the payload, but strip it as we do not want it here
-    payload = data[header_len + retcode_len : header_len + header.length]
-    crc, suffix = struct.unpack(end_fmt, payload[-end_len:])
+    retcode = 0 if no_retcode else MESSAGE_RETCODE.unpack_from(data, header_len)[0]
+    end_start = header_len + header.length - end_len
+    crc, suffix = end.unpack_from(data, end_start)
 
-    if hmac_key:
-        have_crc = hmac.new(
-            hmac_key, data[: (header_len + header.length) - end_len], sha256
-        ).digest()
-    else:
-        have_crc = (
-            binascii.crc32(data[: (header_len + header.length) - end_len]) & 0xFFFFFFFF
-        )
+    with memoryview(data) as view:
+        if hmac_key:
+            have_crc = hmac.digest(hmac_key, view[:end_start], "sha256")
+        else:
+            have_crc = binascii.crc32(view[:end_start]) & 0xFFFFFFFF
+        payload = bytes(view[headret_len:end_start])
 
     if suffix != SUFFIX_VALUE:
         logger.debug("Suffix prefix wrong! %08X != %08X", suffix, SUFFIX_VALUE)
@@ -345,21 +349,15 @@ def unpack_message(data, hmac_key=None, header=None, no_retcode=False, logger=No
         else:
             logger.debug("CRC wrong! %08X != %08X", have_crc, crc)
 
-    return TuyaMessage(
-        header.seqno, header.cmd, retcode, payload[:-end_len], crc, crc == have_crc
-    )
-
+    return TuyaMessage(header.seqno, header.cmd, retcode, payload, crc, crc == have_crc)
 
-def parse_header(data):
-    """Unpack bytes into a TuyaHeader."""
-    header_len = struct.calcsize(MESSAGE_HEADER_FMT)
 
-    if len(data) < header_len:
+def parse_header(data, offset=0):
+    """Unpack bytes (at offset) into a TuyaHeader."""
+    if len(data) - offset < MESSAGE_HEADER.size:
         raise DecodeError("Not enough data to unpack header")
 
-    prefix, seqno, cmd, payload_len = struct.unpack(
-        MESSAGE_HEADER_FMT, data[:header_len]
-    )
+    prefix, seqno, cmd, payload_len = MESSAGE_HEADER.unpack_from(data, offset)
 
     if prefix != PREFIX_VALUE:
         # self.debug('Header prefix wrong! %08X != %08X', prefix, PREFIX_VALUE)
@@ -422,7 +420,7 @@ class MessageDispatcher(ContextualLogger):
     def __init__(self, dev_id, listener, protocol_version, local_key, enable_debug):
         """Initialize a new MessageBuffer."""
         super().__init__()
-        self.buffer = b""
+        self.buffer = bytearray()
         self.listeners = {}
         self.listener = listener
         self.version = protocol_version
@@ -458,21 +456,49 @@ class MessageDispatcher(ContextualLogger):
         return self.listeners.pop(seqno)
 
     def add_data(self, data):
-        """Add new data to the buffer and try to parse messages."""
-        self.buffer += data
-        header_len = struct.calcsize(MESSAGE_RECV_HEADER_FMT)
-
-        while self.buffer:
-            # Check if enough data for measage header
-            if len(self.buffer) < header_len:
-                break
-
-            header = parse_header(self.buffer)
-            hmac_key = self.local_key if self.version == 3.4 else None
-            msg = unpack_message(
-                self.buffer, header=header, hmac_key=hmac_key, logger=self
-            )
-            self.buffer = self.buffer[header_len - 4 + header.length :]
+        """Add new data to the buffer and try to parse messages.
+
+        Messages are framed in place: headers are read and checksums verified
+        over a view of the received data, and only a trailing partial message
+        is kept in the buffer until the rest of it arrives.
+        """
+        if self.buffer:
+            self.buffer += data
+            data = self.buffer
+        hmac_key = self.local_key if self.version == 3.4 else None
+        messages = []
+        offset = 0
+        size = len(data)
+
+        with memoryview(data) as view:
+            while size - offset >= MESSAGE_RECV_HEADER.size:
+                try:
+                    header = parse_header(view, offset)
+                except DecodeError as ex:
+                    # Skip to the next message prefix
+                    resync = data.find(PREFIX_BIN, offset + 1)
+                    self.debug("Discarding unframed data (%s)", ex)
+                    offset = resync if resync >= 0 else size - len(PREFIX_BIN) + 1
+                    continue
+
+                end = offset + MESSAGE_HEADER.size + header.length
+                if end > size:
+                    # Wait for the rest of the message
+                    break
+
+                messages.append(
+                    unpack_message(
+                        view[offset:end], header=header, hmac_key=hmac_key, logger=self
+                    )
+                )
+                offset = end
+
+        if data is self.buffer:
+            del self.buffer[:offset]
+        elif offset < size:
+            self.buffer += data[offset:]
+
+        for msg in messages:
             self._dispatch(msg)
 
     def _dispatch(self, msg):
@@ -587,6 +613,8 @@ class TuyaProtocol(asyncio.Protocol, ContextualLogger):
         self.dispatcher = self._setup_dispatcher(enable_debug)
         self.on_connected = on_connected
         self.heartbeater = None
+        # Loop time of the last status the device pushed unsolicited
+        self.last_pushed = None
         self.dps_cache = {}
         self.local_nonce = b"0123456789abcdef"  # not-so-random random key
         self.remote_nonce = b""
@@ -617,6 +645,9 @@ class TuyaProtocol(asyncio.Protocol, ContextualLogger):
 
     def _setup_dispatcher(self, enable_debug):
         def _status_update(msg):
+            # Only unsolicited STATUS messages are dispatched here, replies to
+            # our own requests (heartbeats included) go to their listeners
+            self.last_pushed = self.loop.time()
             if msg.seqno > 0:
                 self.seqno = msg.seqno + 1
             decoded_message = self._decode_payload(msg.payload)
@@ -642,26 +673,34 @@ class TuyaProtocol(asyncio.Protocol, ContextualLogger):
         async def heartbeat_loop():
             """Continuously send heart beat updates."""
             self.debug("Started heartbeat loop")
-            while True:
-                try:
-                    await self.heartbeat()
+            try:
+                while await self.send_heartbeat():
                     await asyncio.sleep(HEARTBEAT_INTERVAL)
-                except asyncio.CancelledError:
-                    self.debug("Stopped heartbeat loop")
-                    raise
-                except asyncio.TimeoutError:
-                    self.debug("Heartbeat failed due to timeout, disconnecting")
-                    break
-                except Exception as ex:  # pylint: disable=broad-except
-                    self.exception("Heartbeat failed (%s), disconnecting", ex)
-                    break
-
-            transport = self.transport
-            self.transport = None
-            transport.close()
+            except asyncio.CancelledError:
+                self.debug("Stopped heartbeat loop")
+                raise
 
         self.heartbeater = self.loop.create_task(heartbeat_loop())
 
+    async def send_heartbeat(self):
+        """Send a single heartbeat, disconnecting if it fails.
+
+        Returns False if the connection was closed.
+        """
+        try:
+            await self.heartbeat()
+            return True
+        except asyncio.TimeoutError:
+            self.debug("Heartbeat failed due to timeout, disconnecting")
+        except Exception as ex:  # pylint: disable=broad-except
+            self.exception("Heartbeat failed (%s), disconnecting", ex)
+
+        transport = self.transport
+        self.transport = None
+        if transport is not None:
+            transport.close()
+        return False
+
     def data_received(self, data):
         """Received data from device."""
         # self.debug("received data=%r", binascii.hexlify(data))
@@ -0,0 +1,89 @@
+"""Shared scheduler for periodic device work (heartbeats and DP refreshes)."""
+import logging
+import random
+
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every run is moved by up to this fraction of its interval
+JITTER = 0.1
+
+
+class _Job:
+    """Periodic job of the scheduler."""
+
+    __slots__ = ("name", "interval", "action", "handle", "running")
+
+    def __init__(self, name, interval, action):
+        """Initialize the job."""
+        self.name = name
+        self.interval = interval
+        self.action = action
+        self.handle = None
+        self.running = False
+
+
+class DeviceScheduler:
+    """Runs the periodic jobs of all devices from one place.
+
+    With a timer per device, devices connected together fire together on
+    every interval. Here the first run of a job is at a random point of its
+    interval and every following run is jittered, which spreads the load.
+    The next run is only scheduled once the previous one finished, so a slow
+    device never has overlapping runs.
+    """
+
+    def __init__(self, hass):
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._jobs = set()
+
+    @callback
+    def async_add_job(self, name, interval, action):
+        """Call the coroutine function action every interval seconds.
+
+        Returns a callable removing the job. A run in progress is not
+        cancelled, but won't be followed by another one.
+        """
+        job = _Job(name, interval, action)
+        self._jobs.add(job)
+        self._schedule(job, random.uniform(0, interval))
+
+        @callback
+        def remove():
+            self._jobs.discard(job)
+            if job.handle is not None:
+                job.handle.cancel()
+                job.handle = None
+
+        return remove
+
+    def _schedule(self, job, delay):
+        job.handle = self._hass.loop.call_later(delay, self._run, job)
+
+    @callback
+    def _run(self, job):
+        job.handle = None
+        job.running = True
+        self._hass.async_create_task(self._async_run(job))
+
+    async def _async_run(self, job):
+        try:
+            await job.action()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Scheduled %s failed", job.name)
+        finally:
+            job.running = False
+            if job in self._jobs:
+                self._schedule(
+                    job, job.interval * random.uniform(1 - JITTER, 1 + JITTER)
+                )
+
+    @property
+    def diagnostics(self):
+        """Return the number of scheduled and running jobs."""
+        return {
+            "jobs": len(self._jobs),
+            "running": sum(1 for job in self._jobs if job.running),
+        }
@@ -50,7 +50,12 @@ from .const import (
     PLATFORMS,
     VERSION,
 )
-from .helpers import default_image_path, hash_file, process_emails
+from .helpers import (
+    default_image_path,
+    hash_file,
+    message_cache_store,
+    process_emails,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -80,7 +85,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     config = config_entry.data
 
     # Setup the data coordinator
-    coordinator = MailDataUpdateCoordinator(hass, config)
+    coordinator = MailDataUpdateCoordinator(hass, config, config_entry.entry_id)
 
     # Fetch initial data so we have data when entities subscribe
     await coordinator.async_refresh()
@@ -130,6 +135,11 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the message cache of a removed entry."""
+    await message_cache_store(hass, config_entry.entry_id).async_remove()
+
+
 async def async_migrate_entry(hass, config_entry):  # noqa: C901
     """Migrate an old config entry."""
     version = config_entry.version
@@ -245,7 +255,7 @@ async def async_migrate_entry(hass, config_entry):  # noqa: C901
 class MailDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching mail data."""
 
-    def __init__(self, hass, config):
+    def __init__(self, hass, config, entry_id):
         """Initialize."""
         self.interval = timedelta(minutes=config.get(CONF_SCAN_INTERVAL))
         self.name = f"Mail and Packages ({config.get(CONF_HOST)})"
@@ -255,6 +265,8 @@ class MailDataUpdateCoordinator(DataUpdateCoordinator):
         self._data = {}
         self._file_mtime_cache = {}
         self._hash_cache = {}
+        self._message_cache_store = message_cache_store(hass, entry_id)
+        self._message_cache = None
 
         _LOGGER.debug("Data will be update every %s", self.interval)
 
@@ -279,12 +291,24 @@ class MailDataUpdateCoordinator(DataUpdateCoordinator):
         else:
             return file_hash
 
+    def _save_message_cache(self, cache):
+        """Save the message cache, called from the executor."""
+        self._message_cache = cache
+        self.hass.add_job(self._message_cache_store.async_save, cache)
+
     async def _async_update_data(self):
         """Fetch data."""
+        if self._message_cache is None:
+            self._message_cache = await self._message_cache_store.async_load() or {}
+
         async with asyncio.timeout(self.timeout):
             try:
                 data = await self.hass.async_add_executor_job(
-                    process_emails, self.hass, self.config
+                    process_emails,
+                    self.hass,
+                    self.config,
+                    self._message_cache,
+                    self._save_message_cache,
                 )
             except Exception as error:
                 _LOGGER.error("Problem updating sensors: %s", error)
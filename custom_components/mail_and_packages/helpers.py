@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import base64
+import copy
 import datetime
 import email
 import hashlib
 import imaplib
+import json
 import logging
 import os
 import quopri
@@ -15,6 +17,7 @@ import shutil
 import subprocess  # nosec
 import uuid
 from email.header import decode_header
+from collections.abc import Callable
 from pathlib import Path
 from shutil import copyfile, copytree, which
 from typing import Any
@@ -32,6 +35,7 @@ from homeassistant.const import (
     CONF_USERNAME,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.util import ssl
 from PIL import Image, ImageOps
 from voluptuous import Email, MultipleInvalid, Schema
@@ -112,6 +116,7 @@ from .const import (
     DEFAULT_FEDEX_CUSTOM_IMG_FILE,
     DEFAULT_UPS_CUSTOM_IMG_FILE,
     DEFAULT_WALMART_CUSTOM_IMG_FILE,
+    DOMAIN,
     OVERLAY,
     SENSOR_DATA,
     SENSOR_TYPES,
@@ -201,9 +206,17 @@ def default_image_path(
     return "custom_components/mail_and_packages/images/"
 
 
-def process_emails(hass: HomeAssistant, config: ConfigEntry) -> dict:  # noqa: C901
+def process_emails(  # noqa: C901
+    hass: HomeAssistant,
+    config: ConfigEntry,
+    message_cache: dict | None = None,
+    save_message_cache: Callable[[dict], None] | None = None,
+) -> dict:
     """Process emails and return value.
 
+    message_cache is the stored message cache, save_message_cache is called
+    with the updated cache when it changed.
+
     Returns dict containing sensor data
     """
     _LOGGER.debug("Starting process_emails function")
@@ -231,6 +244,9 @@ def process_emails(hass: HomeAssistant, config: ConfigEntry) -> dict:  # noqa: C
         # Bail out on error
         return data
 
+    # Share searches, message downloads and parse results between all sensors
+    account = CachedMailbox(account, message_cache, save_message_cache)
+
     # Create image file name dict container
     _image = {}
 
@@ -304,6 +320,8 @@ def process_emails(hass: HomeAssistant, config: ConfigEntry) -> dict:  # noqa: C
         except (OSError, ValueError) as err:
             _LOGGER.error("Error updating sensor: %s reason: %s", sensor, err)
 
+    account.save()
+
     # Copy image file to www directory if enabled
     if config.get(CONF_ALLOW_EXTERNAL):
         copy_images(hass, config)
@@ -311,6 +329,13 @@ def process_emails(hass: HomeAssistant, config: ConfigEntry) -> dict:  # noqa: C
     return data
 
 
+def message_cache_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store of the message cache of a config entry."""
+    return Store(
+        hass, CachedMailbox.CACHE_VERSION, f"{DOMAIN}.message_cache.{entry_id}"
+    )
+
+
 def copy_images(hass: HomeAssistant, config: ConfigEntry) -> None:
     """Copy images to www directory if enabled."""
     paths = []
@@ -814,6 +839,11 @@ def email_search(
 
     Returns a tuple
     """
+    if isinstance(account, CachedMailbox):
+        value = account.search_index(address, date, subject)
+        if value is not None:
+            return value
+
     utf8_flag, search = build_search(address, date, subject)
     value = ("", [""])
 
@@ -893,6 +923,254 @@ def email_fetch(
     return value
 
 
+class CachedMailbox:
+    """Wrap an IMAP account to share searches and downloads between sensors.
+
+    All message ids handed out by the wrapper are UIDs. Every distinct search
+    date is resolved with a single UID SEARCH; headers are only downloaded for
+    UIDs that are not in the message cache yet and sensor searches are matched
+    locally. Message bodies are downloaded at most once per update and
+    per-message parse results are kept in the message cache (keyed by
+    UIDVALIDITY and UID) until the day rolls over.
+    """
+
+    HEADER_PARTS = "(UID BODY.PEEK[HEADER.FIELDS (FROM SUBJECT)])"
+    CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        account: type[imaplib.IMAP4_SSL],
+        stored_cache: dict | None = None,
+        save_cache: Callable[[dict], None] | None = None,
+    ) -> None:
+        """Initialize the wrapper.
+
+        stored_cache is the message cache of the previous update, save_cache
+        is called with the message cache when it changed. Without save_cache
+        the cache only lives for this update.
+        """
+        object.__setattr__(self, "_account", account)
+        object.__setattr__(self, "_save_cache", save_cache)
+        object.__setattr__(self, "_indexes", {})
+        object.__setattr__(self, "_bodies", {})
+        object.__setattr__(self, "_seen", set())
+        object.__setattr__(self, "_dirty", False)
+        object.__setattr__(self, "_cache", self._load_cache(stored_cache))
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward everything else to the wrapped account."""
+        return getattr(self._account, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Forward attribute writes (e.g. literal) to the wrapped account."""
+        setattr(self._account, name, value)
+
+    def search(self, charset: str | None, *criteria: str) -> tuple:
+        """Search on the server, returning UIDs."""
+        if charset:
+            return self._account.uid("SEARCH", "CHARSET", charset, *criteria)
+        return self._account.uid("SEARCH", *criteria)
+
+    def fetch(self, message_set: str, parts: str) -> tuple:
+        """Fetch by UID, reusing already downloaded message bodies."""
+        if parts not in ("(RFC822)", "BODY[]"):
+            return self._account.uid("FETCH", message_set, parts)
+        key = (message_set, parts)
+        if key not in self._bodies:
+            value = self._account.uid("FETCH", message_set, parts)
+            if value[0] != "OK":
+                return value
+            self._bodies[key] = value
+        return self._bodies[key]
+
+    def parse_result(self, num: Any, key: str, parser: Any) -> Any:
+        """Return the cached parse result of a message, running parser if needed.
+
+        Results must be JSON serializable.
+        """
+        uid = num.decode() if isinstance(num, bytes) else str(num)
+        entry = self._cache["messages"].get(uid)
+        if entry is None:
+            return parser()
+        results = entry.setdefault("results", {})
+        if key not in results:
+            results[key] = parser()
+            object.__setattr__(self, "_dirty", True)
+        return results[key]
+
+    def search_index(
+        self, address: list, date: str, subject: str | None = ""
+    ) -> tuple | None:
+        """Search the local index for the given date.
+
+        Returns None if the index could not be built.
+        """
+        if date not in self._indexes:
+            self._indexes[date] = self._build_index(date)
+        index = self._indexes[date]
+        if index is None:
+            return None
+
+        addresses = [addr.lower() for addr in address]
+        subject = subject.lower() if subject is not None else None
+        found = [
+            uid
+            for uid, (sender, email_subject) in index.items()
+            if any(addr in sender for addr in addresses)
+            and (subject is None or subject in email_subject)
+        ]
+        _LOGGER.debug(
+            "Indexed search for (%s) with subject (%s) results: %s",
+            address,
+            subject,
+            found,
+        )
+        return ("OK", [b" ".join(found)])
+
+    def save(self) -> None:
+        """Save the message cache, dropping messages no longer found."""
+        if self._save_cache is None or self._cache["uidvalidity"] is None:
+            return
+        messages = self._cache["messages"]
+        if self._indexes and any(index is not None for index in self._indexes.values()):
+            for uid in [uid for uid in messages if uid not in self._seen]:
+                del messages[uid]
+                object.__setattr__(self, "_dirty", True)
+        if not self._dirty:
+            return
+        # The copy is serialized on the event loop while this one may change
+        self._save_cache(copy.deepcopy(self._cache))
+        object.__setattr__(self, "_dirty", False)
+
+    def _load_cache(self, stored: dict | None) -> dict:
+        """Load the message cache, discarding it on day or UIDVALIDITY change."""
+        cache = {
+            "version": self.CACHE_VERSION,
+            "uidvalidity": self._uidvalidity(),
+            "day": get_today().isoformat(),
+            "high_water_mark": 0,
+            "messages": {},
+        }
+        if stored is None or cache["uidvalidity"] is None:
+            return cache
+        if not isinstance(stored, dict) or any(
+            stored.get(key) != cache[key] for key in ("version", "uidvalidity", "day")
+        ):
+            _LOGGER.debug("Message cache expired, starting over")
+            object.__setattr__(self, "_dirty", True)
+            return cache
+        return stored
+
+    def _uidvalidity(self) -> str | None:
+        """Return UIDVALIDITY of the selected folder if the server sent it."""
+        try:
+            (_, value) = self._account.response("UIDVALIDITY")
+        except (AttributeError, OSError) as err:
+            _LOGGER.debug("Problem reading UIDVALIDITY: %s", err)
+            return None
+        if not value or value[0] is None:
+            return None
+        return value[-1].decode() if isinstance(value[-1], bytes) else str(value[-1])
+
+    def _build_index(self, date: str) -> dict[bytes, tuple[str, str]] | None:
+        """Return sender and subject of every message since date, keyed by UID."""
+        try:
+            (check, value) = self.search(None, f"(SINCE {date})")
+        except OSError as err:
+            _LOGGER.debug("Error building search index: %s", err)
+            return None
+        if check != "OK" or not isinstance(value, list):
+            return None
+
+        uids = b" ".join(item for item in value if item).split()
+        messages = self._cache["messages"]
+        high_water_mark = self._cache["high_water_mark"]
+        missing = [
+            uid
+            for uid in uids
+            if int(uid) > high_water_mark or uid.decode() not in messages
+        ]
+        if missing:
+            try:
+                (check, value) = self._account.uid(
+                    "FETCH", _message_set(missing), self.HEADER_PARTS
+                )
+            except OSError as err:
+                _LOGGER.debug("Error fetching headers for search index: %s", err)
+                return None
+            if check != "OK":
+                return None
+            self._add_headers(value)
+
+        self._seen.update(uid.decode() for uid in uids)
+        _LOGGER.debug(
+            "Indexed %s emails since %s (%s new)", len(uids), date, len(missing)
+        )
+        return {
+            uid: (messages[uid.decode()]["from"], messages[uid.decode()]["subject"])
+            for uid in uids
+            if uid.decode() in messages
+        }
+
+    def _add_headers(self, value: list) -> None:
+        """Add the headers of a UID FETCH response to the message cache."""
+        messages = self._cache["messages"]
+        for pos, response_part in enumerate(value):
+            if not isinstance(response_part, tuple):
+                continue
+            # Servers may return the UID before or after the header literal
+            found = re.search(rb"UID (\d+)", response_part[0])
+            if found is None and pos + 1 < len(value):
+                found = re.search(rb"UID (\d+)", bytes(value[pos + 1]))
+            if found is None:
+                continue
+            uid = int(found.group(1))
+            msg = email.message_from_bytes(response_part[1])
+            messages[str(uid)] = {
+                "from": _decode_header_value(msg["from"]).lower(),
+                "subject": _decode_header_value(msg["subject"]).lower(),
+                "results": {},
+            }
+            self._cache["high_water_mark"] = max(self._cache["high_water_mark"], uid)
+            object.__setattr__(self, "_dirty", True)
+
+
+def _cached_parse(account: Any, num: Any, key: str, parser: Any) -> Any:
+    """Return a per-message parse result, cached when the account supports it."""
+    if isinstance(account, CachedMailbox):
+        return account.parse_result(num, key, parser)
+    return parser()
+
+
+def _message_set(nums: list[bytes]) -> str:
+    """Build a compact IMAP message set (e.g. 1:4,7) from message ids."""
+    ids = sorted({int(num) for num in nums})
+    ranges = []
+    start = prev = ids[0]
+    for num in ids[1:]:
+        if num != prev + 1:
+            ranges.append(f"{start}:{prev}" if start != prev else str(start))
+            start = num
+        prev = num
+    ranges.append(f"{start}:{prev}" if start != prev else str(start))
+    return ",".join(ranges)
+
+
+def _decode_header_value(value: Any) -> str:
+    """Decode a possibly RFC 2047 encoded header to text."""
+    if value is None:
+        return ""
+    decoded = []
+    for part, charset in decode_header(str(value)):
+        if isinstance(part, bytes):
+            try:
+                part = part.decode(charset or "utf-8", "ignore")
+            except LookupError:
+                part = part.decode("utf-8", "ignore")
+        decoded.append(part)
+    return "".join(decoded)
+
+
 def get_mails(  # noqa: C901
     account: type[imaplib.IMAP4_SSL],
     image_output_path: str,
@@ -1668,64 +1946,83 @@ def get_tracking(  # noqa: C901
     _LOGGER.debug("Searching for tracking numbers in %s messages...", len(mail_list))
 
     for i in mail_list:
-        data = email_fetch(account, i, "(RFC822)")[1]
-        for response_part in data:
-            if isinstance(response_part, tuple):
-                msg = email.message_from_bytes(response_part[1])
-                _LOGGER.debug("Checking message subject...")
+        found_numbers = _cached_parse(
+            account,
+            i,
+            f"tracking:{the_format}",
+            lambda num=i: _find_tracking_numbers(account, num, pattern, the_format),
+        )
+        for number in found_numbers:
+            if number not in tracking:
+                tracking.append(number)
 
-                # Search subject for a tracking number
-                email_subject = msg["subject"]
-                if email_subject:
-                    email_subject = str(email_subject)
-                    if (found := pattern.findall(email_subject)) and len(found) > 0:
-                        _LOGGER.debug(
-                            "Found tracking number in email subject: %s", found[0]
-                        )
-                        if found[0] not in tracking:
-                            tracking.append(found[0])
-                        continue
+    if len(tracking) == 0:
+        _LOGGER.debug("No tracking numbers found")
 
-                # Search in email body for tracking number
-                _LOGGER.debug("Checking message body using %s ...", the_format)
+    return tracking
 
-                # Special handling for UPS tracking - use simplified approach
-                if the_format == "1Z?[0-9A-Z]{16}":
-                    try:
-                        # Get the raw email content
-                        email_content = str(response_part[1], "utf-8", errors="ignore")
 
-                        # Search for tracking number in the entire email content
-                        if (found := pattern.findall(email_content)) and len(found) > 0:
-                            _LOGGER.debug(
-                                "Found tracking number in email: %s", found[0]
-                            )
-                            if found[0] not in tracking:
-                                tracking.append(found[0])
-                    except (TypeError, UnicodeError) as err:
-                        _LOGGER.debug("Error processing email content: %s", err)
-                else:
-                    # Original logic for all other tracking types
-                    for part in msg.walk():
-                        _LOGGER.debug("Content type: %s", part.get_content_type())
-                        if part.get_content_type() not in ["text/html", "text/plain"]:
-                            continue
-                        email_msg = part.get_payload(decode=True)
-                        email_msg = email_msg.decode("utf-8", "ignore")
-                        if (found := pattern.findall(email_msg)) and len(found) > 0:
-                            # DHL is special
-                            if " " in the_format:
-                                found[0] = found[0].split(" ")[1]
+def _find_tracking_numbers(
+    account: type[imaplib.IMAP4_SSL], num: Any, pattern: re.Pattern, the_format: str
+) -> list:
+    """Parse tracking numbers from a single email.
 
-                            _LOGGER.debug(
-                                "Found tracking number in email body: %s", found[0]
-                            )
-                            if found[0] not in tracking:
-                                tracking.append(found[0])
-                            continue
+    Returns list of tracking numbers
+    """
+    tracking = []
+    data = email_fetch(account, num, "(RFC822)")[1]
+    for response_part in data:
+        if isinstance(response_part, tuple):
+            msg = email.message_from_bytes(response_part[1])
+            _LOGGER.debug("Checking message subject...")
 
-    if len(tracking) == 0:
-        _LOGGER.debug("No tracking numbers found")
+            # Search subject for a tracking number
+            email_subject = msg["subject"]
+            if email_subject:
+                email_subject = str(email_subject)
+                if (found := pattern.findall(email_subject)) and len(found) > 0:
+                    _LOGGER.debug(
+                        "Found tracking number in email subject: %s", found[0]
+                    )
+                    if found[0] not in tracking:
+                        tracking.append(found[0])
+                    continue
+
+            # Search in email body for tracking number
+            _LOGGER.debug("Checking message body using %s ...", the_format)
+
+            # Special handling for UPS tracking - use simplified approach
+            if the_format == "1Z?[0-9A-Z]{16}":
+                try:
+                    # Get the raw email content
+                    email_content = str(response_part[1], "utf-8", errors="ignore")
+
+                    # Search for tracking number in the entire email content
+                    if (found := pattern.findall(email_content)) and len(found) > 0:
+                        _LOGGER.debug("Found tracking number in email: %s", found[0])
+                        if found[0] not in tracking:
+                            tracking.append(found[0])
+                except (TypeError, UnicodeError) as err:
+                    _LOGGER.debug("Error processing email content: %s", err)
+            else:
+                # Original logic for all other tracking types
+                for part in msg.walk():
+                    _LOGGER.debug("Content type: %s", part.get_content_type())
+                    if part.get_content_type() not in ["text/html", "text/plain"]:
+                        continue
+                    email_msg = part.get_payload(decode=True)
+                    email_msg = email_msg.decode("utf-8", "ignore")
+                    if (found := pattern.findall(email_msg)) and len(found) > 0:
+                        # DHL is special
+                        if " " in the_format:
+                            found[0] = found[0].split(" ")[1]
+
+                        _LOGGER.debug(
+                            "Found tracking number in email body: %s", found[0]
+                        )
+                        if found[0] not in tracking:
+                            tracking.append(found[0])
+                        continue
 
     return tracking
 
@@ -1813,8 +2110,17 @@ def find_text(
     # Pre-compile regex patterns once
     patterns = [re.compile(rf"{term}") for term in search_terms]
 
+    key = f"text:{body_count}:{json.dumps([pattern.pattern for pattern in patterns])}"
+
     for i in mail_list:
-        matches, value = _scan_email_for_text(account, i, patterns, body_count)
+        matches, value = _cached_parse(
+            account,
+            i,
+            key,
+            lambda num=i: list(
+                _scan_email_for_text(account, num, patterns, body_count)
+            ),
+        )
 
         if body_count:
             # If extracting a value, "last found value wins" (updates count)
@@ -2580,80 +2886,46 @@ def get_items(  # noqa: C901
     for email_id in unique_emails:
         # Convert bytes to string for fetch if necessary
         fetch_id = email_id.decode() if isinstance(email_id, bytes) else email_id
-        data = email_fetch(account, fetch_id, "(RFC822)")[1]
-
-        for response_part in data:
-            if not isinstance(response_part, tuple):
-                continue
-
-            msg = email.message_from_bytes(response_part[1])
-
-            # Parse Date
-            email_date_str = msg.get("Date")
-            email_date = None
-            if email_date_str:
-                parsed_date = dateparser.parse(email_date_str)
-                if parsed_date:
-                    email_date = parsed_date.date()
+        items = _cached_parse(
+            account,
+            fetch_id,
+            "amazon_items",
+            lambda num=fetch_id: _amazon_item_info(account, num, order_pattern),
+        )
 
+        for item in items:
             # Param check: skip old "arriving" emails
-            if param and param.lower() == "arriving" and email_date != today_date:
+            if (
+                param
+                and param.lower() == "arriving"
+                and item["date"] != today_date.isoformat()
+            ):
                 continue
 
-            # Parse Subject
-            header_val = msg["subject"]
-            encoding = decode_header(header_val)[0][1]
-            subject_bytes = decode_header(header_val)[0][0]
-            if encoding:
-                email_subject = subject_bytes.decode(encoding, "ignore")
-            elif isinstance(subject_bytes, bytes):
-                email_subject = subject_bytes.decode("utf-8", "ignore")
-            else:
-                email_subject = str(subject_bytes)
-
             # Skip "Ordered" emails
-            if any(s.lower() in email_subject.lower() for s in AMAZON_ORDERED_SUBJECT):
+            if item["type"] == "ordered":
                 continue
 
-            email_msg = _get_email_body(msg)
-
             # --- Handle Delivered Emails ---
-            if any(
-                s.lower() in email_subject.lower() for s in AMAZON_DELIVERED_SUBJECT
-            ):
-                orders = _extract_order_numbers(email_subject, order_pattern)
-                if not orders and email_msg:
-                    orders = _extract_order_numbers(email_msg, order_pattern)
-
-                for o in orders:
+            if item["type"] == "delivered":
+                for o in item["orders"]:
                     delivered_packages[o] = delivered_packages.get(o, 0) + 1
                     if o not in amazon_delivered:
                         amazon_delivered.append(o)
                 continue
 
             # --- Handle Shipped/Arriving Emails ---
-            order_id = None
-            orders = _extract_order_numbers(email_subject, order_pattern)
-            if orders:
-                order_id = orders[0]
-            elif email_msg:
-                orders = _extract_order_numbers(email_msg, order_pattern)
-                if orders:
-                    order_id = orders[0]
-
+            order_id = item["order_id"]
             if order_id:
                 all_shipped_orders.add(order_id)
 
-            if email_msg:
-                parsed_arrival = _parse_amazon_arrival_date(email_msg, email_date)
-
-                if parsed_arrival == today_date:
-                    if order_id:
-                        packages_arriving_today[order_id] = (
-                            packages_arriving_today.get(order_id, 0) + 1
-                        )
-                    else:
-                        deliveries_today.append("Amazon Order")
+            if item["arrival"] == today_date.isoformat():
+                if order_id:
+                    packages_arriving_today[order_id] = (
+                        packages_arriving_today.get(order_id, 0) + 1
+                    )
+                else:
+                    deliveries_today.append("Amazon Order")
 
     # Final Calculation
     deliveries_today = [
@@ -2673,6 +2945,75 @@ def get_items(  # noqa: C901
     return list(all_shipped_orders)
 
 
+def _amazon_item_info(
+    account: type[imaplib.IMAP4_SSL], num: str, order_pattern: re.Pattern
+) -> list[dict]:
+    """Parse an Amazon email for its type, order numbers and arrival date.
+
+    Returns a list with one JSON serializable dict per message part.
+    """
+    items = []
+    data = email_fetch(account, num, "(RFC822)")[1]
+
+    for response_part in data:
+        if not isinstance(response_part, tuple):
+            continue
+
+        msg = email.message_from_bytes(response_part[1])
+
+        # Parse Date
+        email_date_str = msg.get("Date")
+        email_date = None
+        if email_date_str:
+            parsed_date = dateparser.parse(email_date_str)
+            if parsed_date:
+                email_date = parsed_date.date()
+        item = {
+            "date": email_date.isoformat() if email_date else None,
+            "orders": [],
+            "order_id": None,
+            "arrival": None,
+        }
+
+        # Parse Subject
+        header_val = msg["subject"]
+        encoding = decode_header(header_val)[0][1]
+        subject_bytes = decode_header(header_val)[0][0]
+        if encoding:
+            email_subject = subject_bytes.decode(encoding, "ignore")
+        elif isinstance(subject_bytes, bytes):
+            email_subject = subject_bytes.decode("utf-8", "ignore")
+        else:
+            email_subject = str(subject_bytes)
+
+        if any(s.lower() in email_subject.lower() for s in AMAZON_ORDERED_SUBJECT):
+            items.append({**item, "type": "ordered"})
+            continue
+
+        email_msg = _get_email_body(msg)
+
+        if any(s.lower() in email_subject.lower() for s in AMAZON_DELIVERED_SUBJECT):
+            orders = _extract_order_numbers(email_subject, order_pattern)
+            if not orders and email_msg:
+                orders = _extract_order_numbers(email_msg, order_pattern)
+            items.append({**item, "type": "delivered", "orders": orders})
+            continue
+
+        orders = _extract_order_numbers(email_subject, order_pattern)
+        if not orders and email_msg:
+            orders = _extract_order_numbers(email_msg, order_pattern)
+        if orders:
+            item["order_id"] = orders[0]
+
+        if email_msg:
+            parsed_arrival = _parse_amazon_arrival_date(email_msg, email_date)
+            if parsed_arrival is not None:
+                item["arrival"] = parsed_arrival.isoformat()
+        items.append({**item, "type": "shipped"})
+
+    return items
+
+
 def generate_delivery_gif(delivery_images: list, gif_path: str) -> bool:
     """Generate an animated GIF from delivery images.
 
@@ -2,6 +2,7 @@
 
 import asyncio
 import concurrent
+import inspect
 import logging
 import os
 from datetime import datetime, timezone
@@ -66,6 +67,15 @@ from .const import (
 
 VERSION = "1.19"
 
+# Maximum time to wait for the first sample of a new stats stream
+STATS_STREAM_FIRST_TIMEOUT = 5
+
+# Maximum number of stats streams per Docker host. Every stream holds a
+# connection of the shared aiodocker session, whose pool is limited (100 by
+# default), so other API calls must keep connections available. Containers
+# above the limit poll their stats like before.
+MAX_STATS_STREAMS = 50
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -98,6 +108,8 @@ class DockerAPI:
         self._subscribers: list[Callable] = []
         self._version1904 = None
         self._api: aiodocker.Docker = None
+        # Containers holding a stats stream, shared to enforce MAX_STATS_STREAMS
+        self._stats_streams: "set[DockerContainerAPI]" = set()
 
         _LOGGER.debug("[%s]: Helper version: %s", self._instance, VERSION)
 
@@ -214,9 +226,15 @@ class DockerAPI:
                 self._api,
                 cname,
                 version1904=self._version1904,
+                stats_streams=self._stats_streams,
             )
             await self._containers[cname].init()
 
+        self._update_containers(containers or [])
+
+        # Start task to list all containers at once every interval
+        self._tasks["list"] = asyncio.create_task(self._run_docker_list())
+
         self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._monitor_stop)
 
         for component in COMPONENTS:
@@ -424,6 +442,19 @@ class DockerAPI:
                                 self._instance,
                                 oname,
                             )
+                    elif event["Action"] in ("start", "stop", "die"):
+                        # The start/finish times and exit code are only available
+                        # by inspecting the container, so only do that on a change
+                        cname = event["Actor"]["Attributes"]["name"]
+
+                        if cname in self._containers:
+                            _LOGGER.debug(
+                                "[%s] %s: Event %s container",
+                                self._instance,
+                                cname,
+                                event["Action"],
+                            )
+                            self._containers[cname].request_inspect()
 
         except Exception as err:
             _LOGGER.error(
@@ -472,7 +503,12 @@ class DockerAPI:
 
         # Create our Docker Container API
         self._containers[cname] = DockerContainerAPI(
-            self._config, self._api, cname, atInit=False, version1904=self._version1904
+            self._config,
+            self._api,
+            cname,
+            atInit=False,
+            version1904=self._version1904,
+            stats_streams=self._stats_streams,
         )
 
         # We should wait until container is attached
@@ -506,6 +542,45 @@ class DockerAPI:
         else:
             _LOGGER.error("[%s] %s: Container is NOT monitored", self._instance, cname)
 
+    #############################################################
+    async def _run_docker_list(self) -> None:
+        """Function to list all containers with one call per interval, instead of inspecting each container."""
+
+        while True:
+            # The containers were just listed during init
+            await asyncio.sleep(self._interval)
+
+            if self._dockerStopped:
+                _LOGGER.debug("[%s]: Stopping docker list thread", self._instance)
+                break
+
+            # Keep listing after an error, e.g. while the daemon restarts
+            try:
+                containers = await self._api.containers.list(all=True)
+                self._update_containers(containers or [])
+            except aiodocker.exceptions.DockerError as err:
+                _LOGGER.error(
+                    "[%s]: run_docker_list (%s)",
+                    self._instance,
+                    str(err),
+                )
+            except Exception as err:
+                _LOGGER.error(
+                    "[%s]: run_docker_list (%s)",
+                    self._instance,
+                    str(err),
+                    exc_info=True,
+                )
+
+    #############################################################
+    def _update_containers(self, containers: list) -> None:
+        """Pass the listed container fields to the monitored containers."""
+
+        for container in containers:
+            cname: str = container._container["Names"][0][1:]
+            if cname in self._containers:
+                self._containers[cname].set_list_info(container._container)
+
     #############################################################
     async def _run_docker_info(self) -> None:
         """Function to retrieve information like docker info."""
@@ -699,6 +774,7 @@ class DockerContainerAPI:
         cname: str,
         atInit=True,
         version1904: bool | None = None,
+        stats_streams: "set[DockerContainerAPI] | None" = None,
     ):
         self._config = config
         self._api = api
@@ -710,6 +786,11 @@ class DockerContainerAPI:
         self._busy = False
         self._atInit = atInit
         self._task: asyncio.Task | None = None
+        self._stats_task: asyncio.Task | None = None
+        self._stats_raw: dict[str, Any] | None = None
+        self._stats_raw_used: dict[str, Any] | None = None
+        self._stats_received = asyncio.Event()
+        self._stats_streams = stats_streams if stats_streams is not None else set()
         self._subscribers: list[Callable] = []
         self._cpu_old: dict[str, int] = {}
         self._network_old: dict[str, int | datetime] = {}
@@ -724,6 +805,12 @@ class DockerContainerAPI:
         self._info: dict[str, Any] = {}
         self._stats: dict[str, Any] = {}
 
+        # Last inspect of the container, refreshed on Docker events and
+        # when the bulk listing reports another state
+        self._raw: dict[str, Any] | None = None
+        self._inspect_requested = False
+        self._list_health: str | None = None
+
     async def init(self):
         # During start-up we will wait on container attachment,
         # preventing concurrency issues the main HA loop (we are
@@ -785,7 +872,15 @@ class DockerContainerAPI:
 
                     # Only run stats if container is running
                     if self._info[CONTAINER_INFO_STATE] in ("running", "paused"):
-                        await self._run_container_stats()
+                        await self._wait_stats_stream()
+
+                        # Only calculate if the stream delivered a new sample
+                        raw = self._stats_raw
+                        if raw is not None and raw is not self._stats_raw_used:
+                            self._stats_raw_used = raw
+                            self._run_container_stats(raw)
+                    else:
+                        self._stop_stats_stream()
 
                     self._notify()
                 else:
@@ -801,7 +896,7 @@ class DockerContainerAPI:
                     self._instance,
                     self._name,
                 )
-                pass
+                self._stop_stats_stream()
                 break
             except aiodocker.exceptions.DockerError as err:
                 _LOGGER.error(
@@ -824,14 +919,19 @@ class DockerContainerAPI:
 
     #############################################################
     async def _run_container_info(self) -> None:
-        """Get container information, but we can not get
-        the uptime of this container, that is only available
-        while listing all containers :-(.
+        """Get container information. The uptime and status need the
+        start/finish times, which are only available when inspecting the
+        container. Inspecting is only done at start-up and when requested
+        by a Docker event or the bulk listing of DockerAPI.
         """
 
+        if self._raw is None or self._inspect_requested:
+            self._inspect_requested = False
+            self._raw = await self._container.show()
+
         self._info = {}
 
-        raw: dict = await self._container.show()
+        raw: dict = self._raw
 
         self._info[CONTAINER_INFO_STATE] = raw["State"]["Status"]
         self._info[CONTAINER_INFO_IMAGE] = raw["Config"]["Image"]
@@ -846,10 +946,13 @@ class DockerContainerAPI:
         else:
             self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = False
 
-        try:
-            self._info[CONTAINER_INFO_HEALTH] = raw["State"]["Health"]["Status"]
-        except:
-            self._info[CONTAINER_INFO_HEALTH] = "unknown"
+        if self._list_health is not None:
+            self._info[CONTAINER_INFO_HEALTH] = self._list_health
+        else:
+            try:
+                self._info[CONTAINER_INFO_HEALTH] = raw["State"]["Health"]["Status"]
+            except:
+                self._info[CONTAINER_INFO_HEALTH] = "unknown"
 
         # We only do a calculation of startedAt, because we use it twice
         startedAt = parser.parse(raw["State"]["StartedAt"])
@@ -896,22 +999,100 @@ class DockerContainerAPI:
             )
 
     #############################################################
-    async def _run_container_stats(self) -> None:
-        # Initialize stats information
-        stats: dict[str, Any] = {}
-        stats["cpu"] = {}
-        stats["memory"] = {}
-        stats["network"] = {}
-        stats["read"] = {}
+    async def _wait_stats_stream(self) -> None:
+        """Start the stats stream if needed and wait for its first sample.
+
+        Without a free stream slot the stats are polled instead.
+        """
+
+        if self._stats_task is None or self._stats_task.done():
+            self._stats_streams.discard(self)
+            if len(self._stats_streams) >= MAX_STATS_STREAMS:
+                await self._poll_stats()
+                return
+
+            self._stats_streams.add(self)
+            self._stats_raw = None
+            self._stats_received.clear()
+            self._stats_task = asyncio.create_task(self._run_stats_stream())
+
+        if self._stats_raw is None:
+            try:
+                await asyncio.wait_for(
+                    self._stats_received.wait(), STATS_STREAM_FIRST_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.debug(
+                    "[%s] %s: No stats received from stream yet",
+                    self._instance,
+                    self._name,
+                )
+
+    #############################################################
+    async def _run_stats_stream(self) -> None:
+        """Keep the latest sample of the stats stream of the container.
+
+        Docker pushes a sample every second over one long-lived request,
+        instead of sampling for 1-2 seconds on every request. The stream
+        ends when the container stops, it is started again by _run.
+        """
+
+        try:
+            stream = self._container.stats(stream=True)
+            if inspect.isawaitable(stream):
+                stream = await stream
+
+            async for raw in stream:
+                self._stats_raw = raw
+                self._stats_received.set()
+
+            _LOGGER.debug("[%s] %s: Stats stream ended", self._instance, self._name)
+        except aiodocker.exceptions.DockerError as err:
+            _LOGGER.debug(
+                "[%s] %s: Stats stream stopped (%s)",
+                self._instance,
+                self._name,
+                str(err),
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            _LOGGER.error(
+                "[%s] %s: Stats stream failed (%s)",
+                self._instance,
+                self._name,
+                str(err),
+                exc_info=True,
+            )
+
+    #############################################################
+    async def _poll_stats(self) -> None:
+        """Get a single stats sample, used above MAX_STATS_STREAMS."""
 
-        # Get container stats, only interested in [0]
         rawarr = await self._container.stats(stream=False)
 
         # Could be out-of-range when stopping/renaming
         try:
-            raw: dict[str, Any] = rawarr[0]
+            self._stats_raw = rawarr[0]
         except IndexError:
-            return
+            self._stats_raw = None
+
+    #############################################################
+    def _stop_stats_stream(self) -> None:
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            self._stats_task = None
+        self._stats_streams.discard(self)
+        self._stats_raw = None
+
+    #############################################################
+    def _run_container_stats(self, raw: dict[str, Any]) -> None:
+        # Initialize stats information
+        stats: dict[str, Any] = {}
+        stats["cpu"] = {}
+        stats["memory"] = {}
+        stats["network"] = {}
+        stats["read"] = {}
 
         stats["read"] = parser.parse(raw["read"])
 
@@ -1205,8 +1386,45 @@ class DockerContainerAPI:
 
         self._stats = stats
 
+    #############################################################
+    def set_list_info(self, container: dict[str, Any]) -> None:
+        """Update from the bulk container listing of DockerAPI."""
+
+        # The health is only part of the status text, e.g. "Up 6 days (healthy)"
+        status: str = container.get("Status") or ""
+        if "(healthy)" in status:
+            self._list_health = "healthy"
+        elif "(unhealthy)" in status:
+            self._list_health = "unhealthy"
+        elif "(health: starting)" in status:
+            self._list_health = "starting"
+        else:
+            self._list_health = None
+
+        # Inspect again if we missed a state change
+        if (
+            self._raw is not None
+            and container.get("State") is not None
+            and container["State"] != self._raw["State"]["Status"]
+        ):
+            _LOGGER.debug(
+                "[%s] %s: Listed state '%s' differs from '%s'",
+                self._instance,
+                self._name,
+                container["State"],
+                self._raw["State"]["Status"],
+            )
+            self._inspect_requested = True
+
+    #############################################################
+    def request_inspect(self) -> None:
+        """Inspect the container on the next update, called on Docker events."""
+        self._inspect_requested = True
+
     #############################################################
     def cancel_task(self) -> None:
+        self._stop_stats_stream()
+
         if self._task is not None:
             _LOGGER.info(
                 "[%s] %s: Cancelling task for container info/stats",
@@ -1,7 +1,6 @@
 """Support for pfSense."""
 from __future__ import annotations
 
-import copy
 from datetime import timedelta
 import logging
 import math
@@ -51,6 +50,26 @@ from .services import ServiceRegistrar
 
 _LOGGER = logging.getLogger(__name__)
 
+# counters used to calculate rates between updates
+INTERFACE_COUNTERS = [
+    "inbytes",
+    "outbytes",
+    "inbytespass",
+    "outbytespass",
+    "inbytesblock",
+    "outbytesblock",
+    "inpkts",
+    "outpkts",
+    "inpktspass",
+    "outpktspass",
+    "inpktsblock",
+    "outpktsblock",
+]
+OPENVPN_COUNTERS = [
+    "total_bytes_recv",
+    "total_bytes_sent",
+]
+
 
 def dict_get(data: dict, path: str, default=None):
     pathList = re.split(r"\.", path, flags=re.IGNORECASE)
@@ -172,6 +191,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         listener()
 
     if unload_ok:
+        client = hass.data[DOMAIN][entry.entry_id][PFSENSE_CLIENT]
+        await hass.async_add_executor_job(client.close)
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
@@ -216,6 +237,9 @@ class PfSenseData:
         self._config_entry = config_entry
         self._hass = hass
         self._state = {}
+        self._config = {}
+        self._config_hashes = {}
+        self._rules = {"filter": {}, "nat_port_forward": {}, "nat_outbound": {}}
         self._firmware_update_info = None
         self._background_tasks = set()
 
@@ -236,8 +260,8 @@ class PfSenseData:
         return inner
 
     @_log_timing
-    def _get_system_info(self):
-        return self._client.get_system_info()
+    def _collect(self, sections):
+        return self._client.collect(sections)
 
     @_log_timing
     def _refresh_firmware_update_info(self):
@@ -255,66 +279,103 @@ class PfSenseData:
     def _get_firmware_update_info(self):
         return self._firmware_update_info
 
-    @_log_timing
-    def _get_telemetry(self):
-        return self._client.get_telemetry()
-
-    @_log_timing
-    def _get_host_firmware_version(self):
-        return self._client.get_host_firmware_version()
-
-    @_log_timing
-    def _get_config(self):
-        return self._client.get_config()
-
-    @_log_timing
-    def _get_interfaces(self):
-        return self._client.get_interfaces()
-
-    @_log_timing
-    def _get_services(self):
-        return self._client.get_services()
-
-    @_log_timing
-    def _get_carp_interfaces(self):
-        return self._client.get_carp_interfaces()
-
-    @_log_timing
-    def _get_carp_status(self):
-        return self._client.get_carp_status()
-
-    @_log_timing
-    def _get_dhcp_leases(self):
-        return self._client.get_dhcp_leases()
-
-    @_log_timing
-    def _are_notices_pending(self):
-        return self._client.are_notices_pending()
-
-    @_log_timing
-    def _get_notices(self):
-        return self._client.get_notices()
-
-    @_log_timing
-    def _get_arp_table(self):
-        return self._client.get_arp_table(True)
+    def _get_previous_state(self):
+        """Keep only what is needed to calculate rates on the next update."""
+        previous_state = {"update_time": self._state.get("update_time")}
+        telemetry = self._state.get("telemetry")
+        if telemetry is None:
+            return previous_state
+
+        previous_state["telemetry"] = {
+            "cpu": {
+                "ticks": dict(dict_get(telemetry, "cpu.ticks", {})),
+                "used_percent": dict_get(telemetry, "cpu.used_percent"),
+            },
+            "interfaces": {},
+            "openvpn": {"servers": {}},
+        }
+        for interface_name, interface in telemetry.get("interfaces", {}).items():
+            previous_state["telemetry"]["interfaces"][interface_name] = {
+                property: interface[property] for property in INTERFACE_COUNTERS
+            }
+        for server_name, server in dict_get(telemetry, "openvpn.servers", {}).items():
+            previous_state["telemetry"]["openvpn"]["servers"][server_name] = {
+                property: server[property] for property in OPENVPN_COUNTERS
+            }
+
+        return previous_state
+
+    def _apply_config_changes(self, changes):
+        """Merge changed config sections and return the names of those touched."""
+        touched = set(changes["changed"].keys())
+        for section in list(self._config.keys()):
+            if section not in changes["hashes"]:
+                del self._config[section]
+                touched.add(section)
+
+        self._config.update(changes["changed"])
+        self._config_hashes = changes["hashes"]
+        return touched
+
+    def _update_rules(self, sections):
+        """Index the filter and nat rules by their unique id."""
+        if "filter" in sections:
+            self._rules["filter"] = {}
+            rules = dict_get(self._config, "filter.rule")
+            if isinstance(rules, list):
+                for rule in rules:
+                    if rule.get("tracker"):
+                        self._rules["filter"].setdefault(rule["tracker"], rule)
+
+        if "nat" in sections:
+            self._rules["nat_port_forward"] = {}
+            self._rules["nat_outbound"] = {}
+            for rule_type, path in [
+                ("nat_port_forward", "nat.rule"),
+                ("nat_outbound", "nat.outbound.rule"),
+            ]:
+                rules = dict_get(self._config, path)
+                if not isinstance(rules, list):
+                    continue
+                for rule in rules:
+                    tracker = dict_get(rule, "created.time")
+                    if tracker:
+                        self._rules[rule_type].setdefault(tracker, rule)
 
     def update(self, opts={}):
         """Fetch the latest state from pfSense."""
         current_time = time.time()
 
-        # copy the old data to have around
-        previous_state = copy.deepcopy(self._state)
-        if "previous_state" in previous_state.keys():
-            del previous_state["previous_state"]
+        # keep the old counters to have around
+        previous_state = self._get_previous_state()
+
+        # everything is fetched with a single batched exec_php round-trip, the
+        # remaining xmlrpc calls run concurrently on pooled connections
+        sections = {"system_info": {}, "host_firmware_version": {}}
+        if "scope" in opts.keys() and opts["scope"] == "device_tracker":
+            sections["arp_table"] = {"resolve_hostnames": True}
+        else:
+            sections.update(
+                {
+                    "telemetry": {},
+                    "config_changes": {"hashes": self._config_hashes},
+                    "services": {},
+                    "carp_interfaces": {},
+                    "carp_status": {},
+                    "dhcp_leases": {},
+                    "notices_pending": {},
+                    "notices": {},
+                }
+            )
+        response = self._collect(sections)
 
-        self._state["system_info"] = self._get_system_info()
-        self._state["host_firmware_version"] = self._get_host_firmware_version()
+        self._state["system_info"] = response["system_info"]
+        self._state["host_firmware_version"] = response["host_firmware_version"]
         self._state["update_time"] = current_time
         self._state["previous_state"] = previous_state
 
         if "scope" in opts.keys() and opts["scope"] == "device_tracker":
-            self._state["arp_table"] = self._get_arp_table()
+            self._state["arp_table"] = response["arp_table"]
         else:
             # queue up the firmaware task
             # task = self._hass.loop.create_task(self._refresh_firmware_update_info())
@@ -323,19 +384,21 @@ class PfSenseData:
             self._hass.add_job(self._refresh_firmware_update_info)
 
             self._state["firmware_update_info"] = self._get_firmware_update_info()
-            self._state["telemetry"] = self._get_telemetry()
-            self._state["config"] = self._get_config()
-            self._state["interfaces"] = self._get_interfaces()
-            self._state["services"] = self._get_services()
-            self._state["carp_interfaces"] = self._get_carp_interfaces()
-            self._state["carp_status"] = self._get_carp_status()
-            self._state["dhcp_leases"] = self._get_dhcp_leases()
+            self._state["telemetry"] = response["telemetry"]
+            self._update_rules(self._apply_config_changes(response["config_changes"]))
+            self._state["config"] = self._config
+            self._state["interfaces"] = self._config.get("interfaces", {})
+            self._state["rules"] = self._rules
+            self._state["services"] = response["services"]
+            self._state["carp_interfaces"] = response["carp_interfaces"]
+            self._state["carp_status"] = response["carp_status"]
+            self._state["dhcp_leases"] = response["dhcp_leases"]
             self._state["dhcp_stats"] = {}
             self._state["notices"] = {}
-            self._state["notices"][
-                "pending_notices_present"
-            ] = self._are_notices_pending()
-            self._state["notices"]["pending_notices"] = self._get_notices()
+            self._state["notices"]["pending_notices_present"] = response[
+                "notices_pending"
+            ]
+            self._state["notices"]["pending_notices"] = response["notices"]
 
             lease_stats = {"total": 0, "online": 0, "offline": 0}
             for lease in self._state["dhcp_leases"]:
@@ -405,20 +468,7 @@ class PfSenseData:
                     if previous_interface is None:
                         break
 
-                    for property in [
-                        "inbytes",
-                        "outbytes",
-                        "inbytespass",
-                        "outbytespass",
-                        "inbytesblock",
-                        "outbytesblock",
-                        "inpkts",
-                        "outpkts",
-                        "inpktspass",
-                        "outpktspass",
-                        "inpktsblock",
-                        "outpktsblock",
-                    ]:
+                    for property in INTERFACE_COUNTERS:
 
                         current_parent_value = interface[property]
                         previous_parent_value = previous_interface[property]
@@ -483,10 +533,7 @@ class PfSenseData:
                         "openvpn"
                     ]["servers"][server_name]
 
-                    for property in [
-                        "total_bytes_recv",
-                        "total_bytes_sent",
-                    ]:
+                    for property in OPENVPN_COUNTERS:
 
                         current_parent_value = server[property]
                         previous_parent_value = previous_server[property]
@@ -1,6 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 import json
-import socket
 import ssl
+import threading
 from urllib.parse import quote_plus, urlparse
 from xml.parsers.expat import ExpatError
 import xmlrpc.client
@@ -8,10 +9,62 @@ import xmlrpc.client
 # value to set as the socket timeout
 DEFAULT_TIMEOUT = 10
 
+# idle keep-alive connections kept around per timeout value
+MAX_IDLE_CONNECTIONS = 4
+
+
+class _TimeoutTransportMixin:
+    """
+    xmlrpc transports keep their http connection open between requests, this
+    additionally applies the timeout to the connection itself instead of
+    relying on the (process wide) socket default timeout
+    """
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._timeout = timeout
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        # timout applies to each recv() call, not the whole request
+        connection.timeout = self._timeout
+        return connection
+
+
+class _Transport(_TimeoutTransportMixin, xmlrpc.client.Transport):
+    pass
+
+
+class _SafeTransport(_TimeoutTransportMixin, xmlrpc.client.SafeTransport):
+    pass
+
 
 class Client(object):
     """pfSense Client"""
 
+    # read-only data which can be fetched in a single exec_php round-trip
+    # name => (script builder, response parser)
+    _BATCH_SECTIONS = {
+        "system_info": ("_system_info_script", None),
+        "telemetry": ("_telemetry_script", "_parse_telemetry"),
+        "config": ("_config_script", "_parse_data"),
+        "config_changes": ("_config_changes_script", "_parse_config_changes"),
+        "interfaces": ("_interfaces_script", "_parse_data"),
+        "services": ("_services_script", "_parse_services"),
+        "carp_interfaces": ("_carp_interfaces_script", "_parse_data"),
+        "carp_status": ("_carp_status_script", "_parse_data"),
+        "dhcp_leases": ("_dhcp_leases_script", "_parse_dhcp_leases"),
+        "notices_pending": ("_notices_pending_script", "_parse_data"),
+        "notices": ("_notices_script", "_parse_notices"),
+        "arp_table": ("_arp_table_script", "_parse_data"),
+    }
+
+    # data which uses a dedicated xmlrpc method and is fetched concurrently
+    # with the batch
+    _RPC_SECTIONS = {
+        "host_firmware_version": "get_host_firmware_version",
+    }
+
     def __init__(self, url, username, password, opts=None):
         """pfSense Client initializer."""
 
@@ -29,9 +82,19 @@ class Client(object):
             host=parts.netloc,
         )
         self._url_parts = urlparse(self._url)
+        self._lock = threading.Lock()
+        self._idle_proxies = {}
+        self._executor = None
 
     # https://stackoverflow.com/questions/64983392/python-multiple-patch-gives-http-client-cannotsendrequest-request-sent
-    def _get_proxy(self):
+    def _get_proxy(self, timeout=DEFAULT_TIMEOUT):
+        # a ServerProxy (and its connection) must not be shared between threads
+        # so idle proxies are handed out from a small pool and returned after use
+        with self._lock:
+            idle = self._idle_proxies.get(timeout)
+            if idle:
+                return idle.pop()
+
         # https://docs.python.org/3/library/xmlrpc.client.html#module-xmlrpc.client
         # https://stackoverflow.com/questions/30461969/disable-default-certificate-verification-in-python-2-7-9
         context = None
@@ -39,43 +102,76 @@ class Client(object):
         if "verify_ssl" in self._opts.keys():
             verify_ssl = self._opts["verify_ssl"]
 
-        if self._url_parts.scheme == "https" and not verify_ssl:
-            context = ssl._create_unverified_context()
+        if self._url_parts.scheme == "https":
+            if not verify_ssl:
+                context = ssl._create_unverified_context()
+            transport = _SafeTransport(timeout=timeout, context=context)
+        else:
+            transport = _Transport(timeout=timeout)
 
         # set to True if necessary during development
         verbose = False
 
-        proxy = xmlrpc.client.ServerProxy(self._url, context=context, verbose=verbose)
+        proxy = xmlrpc.client.ServerProxy(
+            self._url, transport=transport, verbose=verbose
+        )
         return proxy
 
-    def _apply_timeout(func):
-        def inner(*args, **kwargs):
-            response = None
-            # timout applies to each recv() call, not the whole request
-            default_timeout = socket.getdefaulttimeout()
-            try:
-                socket.setdefaulttimeout(DEFAULT_TIMEOUT)
-                response = func(*args, **kwargs)
-            finally:
-                socket.setdefaulttimeout(default_timeout)
-            return response
-
-        return inner
-
-    @_apply_timeout
+    def _release_proxy(self, proxy, timeout):
+        with self._lock:
+            idle = self._idle_proxies.setdefault(timeout, [])
+            if len(idle) < MAX_IDLE_CONNECTIONS:
+                idle.append(proxy)
+                return
+
+        proxy("close")()
+
+    def _call(self, method, *args, timeout=DEFAULT_TIMEOUT):
+        proxy = self._get_proxy(timeout)
+        try:
+            response = getattr(proxy.pfsense, method)(*args)
+        except BaseException:
+            # do not hand out a connection in an unknown state
+            proxy("close")()
+            raise
+
+        self._release_proxy(proxy, timeout)
+        return response
+
+    def close(self):
+        """Close pooled connections and stop background workers."""
+        with self._lock:
+            proxies = [p for idle in self._idle_proxies.values() for p in idle]
+            self._idle_proxies = {}
+            executor = self._executor
+            self._executor = None
+
+        for proxy in proxies:
+            proxy("close")()
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self._RPC_SECTIONS),
+                    thread_name_prefix="pypfsense",
+                )
+            return self._executor
+
     def _get_config_section(self, section):
-        response = self._get_proxy().pfsense.backup_config_section([section])
+        response = self._call("backup_config_section", [section])
         return response[section]
 
-    @_apply_timeout
     def _restore_config_section(self, section_name, data):
         params = {section_name: data}
-        response = self._get_proxy().pfsense.restore_config_section(params, 60)
+        response = self._call("restore_config_section", params, 60)
         return response
 
-    @_apply_timeout
-    def _exec_php(self, script):
-        script = """
+    def _wrap_php(self, script):
+        return """
 ini_set('display_errors', 0);
 
 {}
@@ -88,27 +184,88 @@ $toreturn["real"] = json_encode($toreturn_real);
 """.format(
             script
         )
-        response = self._get_proxy().pfsense.exec_php(script)
+
+    def _exec_php(self, script):
+        response = self._call("exec_php", self._wrap_php(script))
         response = json.loads(response["real"])
         return response
 
     def _exec_php_no_timeout(self, script):
-        script = """
-ini_set('display_errors', 0);
+        response = self._call("exec_php", self._wrap_php(script), timeout=None)
+        response = json.loads(response["real"])
+        return response
 
+    def _exec_php_batch(self, scripts):
+        """
+        Run several scripts in a single exec_php call, each script is wrapped in
+        a closure so variables do not leak between them and the $toreturn of
+        each one is returned under its key.
+        """
+        requires = []
+        closures = []
+        for key, script in scripts.items():
+            body = []
+            for line in script.splitlines():
+                # includes may define globals, keep them at the top level
+                if line.startswith("require_once"):
+                    if line not in requires:
+                        requires.append(line)
+                    continue
+                body.append(line)
+
+            closures.append(
+                """
+$toreturn_batch[{}] = (function() {{
 {}
-
-// wrapping this in json_encode and then unwrapping in python prevents funny XMLRPC NULL encoding errors
-// https://github.com/travisghansen/hass-pfsense/issues/35
-$toreturn_real = $toreturn;
-$toreturn = [];
-$toreturn["real"] = json_encode($toreturn_real);
+return $toreturn;
+}})();
 """.format(
-            script
+                    json.dumps(key), "\n".join(body)
+                )
+            )
+
+        script = "{}\n$toreturn_batch = [];\n{}\n$toreturn = $toreturn_batch;".format(
+            "\n".join(requires), "".join(closures)
         )
-        response = self._get_proxy().pfsense.exec_php(script)
-        response = json.loads(response["real"])
-        return response
+        return self._exec_php(script)
+
+    def collect(self, sections):
+        """
+        Fetch several read-only sections at once.
+
+        sections is a dict of section name => dict of keyword arguments, sections
+        backed by php are fetched in a single round-trip while the remaining
+        xmlrpc calls run concurrently.
+        """
+        futures = {}
+        scripts = {}
+        for name, kwargs in sections.items():
+            if name in self._RPC_SECTIONS:
+                futures[name] = self._get_executor().submit(
+                    getattr(self, self._RPC_SECTIONS[name]), **kwargs
+                )
+            else:
+                script_builder = self._BATCH_SECTIONS[name][0]
+                scripts[name] = getattr(self, script_builder)(**kwargs)
+
+        results = {}
+        try:
+            if scripts:
+                response = self._exec_php_batch(scripts)
+                for name in scripts.keys():
+                    parser = self._BATCH_SECTIONS[name][1]
+                    if parser is None:
+                        results[name] = response[name]
+                    else:
+                        results[name] = getattr(self, parser)(response[name])
+        finally:
+            for name, future in futures.items():
+                results[name] = future.result()
+
+        return results
+
+    def _parse_data(self, response):
+        return response["data"]
 
     def _exec_command(self, command, background=False):
         script = """
@@ -152,9 +309,8 @@ $toreturn = [
             )
         )
 
-    @_apply_timeout
     def get_host_firmware_version(self):
-        return self._get_proxy().pfsense.host_firmware_version(1, 60)
+        return self._call("host_firmware_version", 1, 60)
 
     def get_firmware_update_info(self):
         """
@@ -223,9 +379,9 @@ $toreturn = [
         response = self._exec_php(script)
         return response["data"]
 
-    def get_system_info(self):
+    def _system_info_script(self):
         # TODO: add bios details here
-        script = """
+        return """
 global $config;
 
 $toreturn = [
@@ -236,20 +392,80 @@ $toreturn = [
   "platform" => system_identify_specific_platform(),
 ];
 """
-        response = self._exec_php(script)
+
+    def get_system_info(self):
+        response = self._exec_php(self._system_info_script())
         return response
 
-    def get_config(self):
-        script = """
+    def _config_script(self):
+        return """
 global $config;
 
 $toreturn = [
   "data" => $config,
 ];
 """
-        response = self._exec_php(script)
+
+    def get_config(self):
+        response = self._exec_php(self._config_script())
         return response["data"]
 
+    def _config_changes_script(self, hashes=None):
+        # every section is hashed on each poll and only the changed ones are
+        # sent back, the config revision time has a one second resolution so
+        # it can't tell whether a write happened since the last poll
+        script = """
+global $config;
+
+$data = json_decode('{}', true);
+
+$toreturn = [
+  "hashes" => [],
+  "changed" => [],
+];
+
+foreach ($config as $section => $value) {{
+  $hash = md5(json_encode($value));
+  $toreturn["hashes"][$section] = $hash;
+  if (!isset($data["hashes"][$section]) || $data["hashes"][$section] != $hash) {{
+    $toreturn["changed"][$section] = $value;
+  }}
+}}
+""".format(
+            json.dumps(
+                {
+                    "hashes": hashes or {},
+                }
+            )
+        )
+        return script
+
+    def _parse_config_changes(self, response):
+        # php encodes empty arrays as lists
+        response["hashes"] = response["hashes"] or {}
+        response["changed"] = response["changed"] or {}
+        return response
+
+    def get_config_changes(self, hashes=None):
+        """
+        Return the config sections which changed compared to the given
+        section hashes (as returned by a previous call)
+
+        {"hashes": {"<section>": "<md5>"}, "changed": {"<section>": ...}}
+        """
+        response = self._exec_php(self._config_changes_script(hashes))
+        return self._parse_config_changes(response)
+
+    def _interfaces_script(self):
+        # same data as backup_config_section(["interfaces"])
+        return """
+global $config;
+
+$toreturn = [
+  "data" => $config["interfaces"],
+];
+"""
+
     def get_interfaces(self):
         return self._get_config_section("interfaces")
 
@@ -374,8 +590,7 @@ $toreturn = [
             if g == gateway:
                 return gateways[g]
 
-    def get_arp_table(self, resolve_hostnames=False):
-        # [{'hostname': '?', 'ip-address': '<ip>', 'mac-address': '<mac>', 'interface': 'em0', 'expires': 1199, 'type': 'ethernet'}, ...]
+    def _arp_table_script(self, resolve_hostnames=False):
         script = """
 
 $data = json_decode('{}', true);
@@ -390,7 +605,11 @@ $toreturn = [
                 }
             )
         )
-        response = self._exec_php(script)
+        return script
+
+    def get_arp_table(self, resolve_hostnames=False):
+        # [{'hostname': '?', 'ip-address': '<ip>', 'mac-address': '<mac>', 'interface': 'em0', 'expires': 1199, 'type': 'ethernet'}, ...]
+        response = self._exec_php(self._arp_table_script(resolve_hostnames))
         return response["data"]
 
     def set_default_gateway(self, gateway, ip_version="4"):
@@ -438,7 +657,11 @@ $toreturn = [
     def get_services(self):
         # function get_services()
         # ["",{"name":"nut","rcfile":"nut.sh","executable":"upsmon","description":"UPS monitoring daemon"},{"name":"iperf","executable":"iperf3","description":"iperf Network Performance Testing Daemon/Client","stopcmd":"mwexec(\"/usr/bin/killall iperf3\");"},{"name":"telegraf","rcfile":"telegraf.sh","executable":"telegraf","description":"Telegraf daemon"},{"name":"vnstatd","rcfile":"vnstatd.sh","executable":"vnstatd","description":"Status Traffic Totals data collection daemon"},{"name":"wireguard","rcfile":"wireguardd","executable":"php_wg","description":"WireGuard"},{"name":"FRR zebra","rcfile":"frr.sh","executable":"zebra","description":"FRR core/abstraction daemon"},{"name":"FRR staticd","rcfile":"frr.sh","executable":"staticd","description":"FRR static route daemon"},{"name":"FRR bfdd","rcfile":"frr.sh","executable":"bfdd","description":"FRR BFD daemon"},{"name":"FRR bgpd","rcfile":"frr.sh","executable":"bgpd","description":"FRR BGP routing daemon"},{"name":"FRR ospfd","rcfile":"frr.sh","executable":"ospfd","description":"FRR OSPF routing daemon"},{"name":"FRR ospf6d","rcfile":"frr.sh","executable":"ospf6d","description":"FRR OSPF6 routing daemon"},{"name":"FRR watchfrr","rcfile":"frr.sh","executable":"watchfrr","description":"FRR watchfrr watchdog daemon"},{"name":"haproxy","rcfile":"haproxy.sh","executable":"haproxy","description":"TCP/HTTP(S) Load Balancer"},{"name":"unbound","description":"DNS Resolver","enabled":true,"status":true},{"name":"pcscd","description":"PC/SC Smart Card Daemon","enabled":true,"status":true},{"name":"ntpd","description":"NTP clock sync","enabled":true,"status":true},{"name":"syslogd","description":"System Logger Daemon","enabled":true,"status":true},{"name":"dhcpd","description":"DHCP Service","enabled":true,"status":true},{"name":"dpinger","description":"Gateway Monitoring Daemon","enabled":true,"status":true},{"name":"miniupnpd","description":"UPnP Service","enabled":true,"status":true},{"name":"ipsec","description":"IPsec VPN","enabled":true,"status":true},{"name":"sshd","description":"Secure Shell Daemon","enabled":true,"status":true},{"name":"openvpn","mode":"server","id":0,"vpnid":"1","description":"OpenVPN server: primary vpn","enabled":true,"status":true}]
-        script = """
+        response = self._exec_php(self._services_script())
+        return self._parse_services(response)
+
+    def _services_script(self):
+        return """
 require_once '/etc/inc/service-utils.inc';
 // only returns enabled services currently
 $s = get_services();
@@ -448,6 +671,10 @@ foreach($s as $service) {
       continue;
   }
   if (!empty($service)) {
+    // resolve the status here instead of a round-trip per service
+    if (!isset($service["status"])) {
+      $service["status"] = (bool) is_service_running($service["name"]);
+    }
     $services[] = $service;
   }
 }
@@ -457,8 +684,8 @@ $toreturn = [
   "data" => $services,
 ];
 """
-        response = self._exec_php(script)
 
+    def _parse_services(self, response):
         for service in response["data"]:
             if "status" not in service:
                 service["status"] = self.get_service_is_running(service["name"])
@@ -599,18 +826,23 @@ $toreturn = [
         )
         self._exec_php(script)
 
-    def get_dhcp_leases(self):
-        # function system_get_dhcpleases()
-        # {'lease': [], 'failover': []}
-        # {"lease":[{"ip":"<ip>","type":"static","mac":"<mac>","if":"lan","starts":"","ends":"","hostname":"<hostname>","descr":"","act":"static","online":"online","staticmap_array_index":48} ...
-        script = """
+    def _dhcp_leases_script(self):
+        return """
 $toreturn = [
   "data" => system_get_dhcpleases(),
 ];
 """
-        response = self._exec_php(script)
+
+    def _parse_dhcp_leases(self, response):
         return response["data"]["lease"]
 
+    def get_dhcp_leases(self):
+        # function system_get_dhcpleases()
+        # {'lease': [], 'failover': []}
+        # {"lease":[{"ip":"<ip>","type":"static","mac":"<mac>","if":"lan","starts":"","ends":"","hostname":"<hostname>","descr":"","act":"static","online":"online","staticmap_array_index":48} ...
+        response = self._exec_php(self._dhcp_leases_script())
+        return self._parse_dhcp_leases(response)
+
     def get_virtual_ips(self):
         script = """
 global $config;
@@ -627,16 +859,18 @@ $toreturn = [
         response = self._exec_php(script)
         return response["data"]
 
-    def get_carp_status(self):
-        # carp enabled or not
-        # readonly attribute, cannot be set directly
-        # function get_carp_status()
-        script = """
+    def _carp_status_script(self):
+        return """
 $toreturn = [
   "data" => get_carp_status(),
 ];
 """
-        response = self._exec_php(script)
+
+    def get_carp_status(self):
+        # carp enabled or not
+        # readonly attribute, cannot be set directly
+        # function get_carp_status()
+        response = self._exec_php(self._carp_status_script())
         return response["data"]
 
     def get_carp_interface_status(self, uniqueid):
@@ -659,8 +893,8 @@ $toreturn = [
         response = self._exec_php(script)
         return response["data"]
 
-    def get_carp_interfaces(self):
-        script = """
+    def _carp_interfaces_script(self):
+        return """
 global $config;
 
 $vips = [];
@@ -680,7 +914,9 @@ $toreturn = [
   "data" => $vips,
 ];
 """
-        response = self._exec_php(script)
+
+    def get_carp_interfaces(self):
+        response = self._exec_php(self._carp_interfaces_script())
         return response["data"]
 
     def delete_arp_entry(self, ip):
@@ -819,8 +1055,8 @@ $toreturn = [
     # TODO: function find_service_by_name($name)
     # TODO: function get_service_status($service) # seems to be higher-level logic than is_service_running, passes in the full service object
 
-    def get_telemetry(self):
-        script = """
+    def _telemetry_script(self):
+        return """
 require_once '/usr/local/www/includes/functions.inc.php';
 require_once '/etc/inc/config.inc';
 require_once '/etc/inc/pfsense-utils.inc';
@@ -965,8 +1201,11 @@ foreach ($ovpn_servers as $server) {
 }
 
 """
-        data = self._exec_php(script)
 
+    def get_telemetry(self):
+        return self._parse_telemetry(self._exec_php(self._telemetry_script()))
+
+    def _parse_telemetry(self, data):
         for fs in data["filesystems"]:
             fs["percent_used"] = int(fs["percent_used"])
 
@@ -975,11 +1214,7 @@ foreach ($ovpn_servers as $server) {
 
         return data
 
-    def are_notices_pending(self, category="all"):
-        """
-        are_notices_pending($category = "all")
-        $category appears to be ignored currently
-        """
+    def _notices_pending_script(self, category="all"):
         script = """
 $data = json_decode('{}', true);
 $category = $data["category"];
@@ -993,11 +1228,17 @@ $toreturn = [
                 }
             )
         )
+        return script
 
-        response = self._exec_php(script)
+    def are_notices_pending(self, category="all"):
+        """
+        are_notices_pending($category = "all")
+        $category appears to be ignored currently
+        """
+        response = self._exec_php(self._notices_pending_script(category))
         return response["data"]
 
-    def get_notices(self, category="all"):
+    def _notices_script(self, category="all"):
         script = """
 $data = json_decode('{}', true);
 $category = $data["category"];
@@ -1015,8 +1256,13 @@ $toreturn = [
                 }
             )
         )
+        return script
 
-        response = self._exec_php(script)
+    def get_notices(self, category="all"):
+        response = self._exec_php(self._notices_script(category))
+        return self._parse_notices(response)
+
+    def _parse_notices(self, response):
         value = response["data"]
         if value is False:
             return []
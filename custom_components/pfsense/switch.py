@@ -215,15 +215,8 @@ class PfSenseFilterSwitch(PfSenseSwitch):
 
     def _pfsense_get_rule(self):
         state = self.coordinator.data
-        found = None
         tracker = self._pfsense_get_tracker()
-        for rule in state["config"]["filter"]["rule"]:
-            if "tracker" not in rule.keys():
-                continue
-            if rule["tracker"] == tracker:
-                found = rule
-                break
-        return found
+        return state["rules"]["filter"].get(tracker)
 
     @property
     def available(self) -> bool:
@@ -277,20 +270,9 @@ class PfSenseNatSwitch(PfSenseSwitch):
 
     def _pfsense_get_rule(self):
         state = self.coordinator.data
-        found = None
         tracker = self._pfsense_get_tracker()
         rule_type = self._pfsense_get_rule_type()
-        rules = []
-        if rule_type == "nat_port_forward":
-            rules = state["config"]["nat"]["rule"]
-        if rule_type == "nat_outbound":
-            rules = state["config"]["nat"]["outbound"]["rule"]
-
-        for rule in rules:
-            if dict_get(rule, "created.time") == tracker:
-                found = rule
-                break
-        return found
+        return state["rules"][rule_type].get(tracker)
 
     @property
     def available(self) -> bool:
@@ -4,20 +4,17 @@ Connect two Home Assistant instances via the Websocket API.
 For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/remote_homeassistant/
 """
-import fnmatch
 import logging
-import copy
 import asyncio
 from contextlib import suppress
 
 import aiohttp
-import re
 
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, callback, Context
 import homeassistant.components.websocket_api.auth as api
-from homeassistant.core import EventOrigin, split_entity_id
+from homeassistant.core import EventOrigin
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.helpers.typing import HomeAssistantType, ConfigType
 from homeassistant.const import (
@@ -58,8 +55,11 @@ from .const import (
     CONF_OPTIONS,
     CONF_REMOTE_INFO,
     CONF_LOAD_COMPONENTS,
+    CONF_SUBSCRIBE_ENTITIES,
     DOMAIN,
 )
+from .entity_filter import EntityFilter
+from .outbound import ServiceCallScheduler
 from .rest_api import UnsupportedVersion, async_get_discovery_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -124,6 +124,7 @@ INSTANCES_SCHEMA = vol.Schema(
         ): cv.ensure_list,
         vol.Optional(CONF_ENTITY_PREFIX, default=DEFAULT_ENTITY_PREFIX): cv.string,
         vol.Optional(CONF_LOAD_COMPONENTS): cv.ensure_list,
+        vol.Optional(CONF_SUBSCRIBE_ENTITIES, default=False): cv.boolean,
     }
 )
 
@@ -168,6 +169,7 @@ def async_yaml_to_config_entry(instance_conf):
         CONF_SUBSCRIBE_EVENTS,
         CONF_ENTITY_PREFIX,
         CONF_LOAD_COMPONENTS,
+        CONF_SUBSCRIBE_ENTITIES,
     ]:
         if option in conf:
             options[option] = conf.pop(option)
@@ -302,48 +304,29 @@ class RemoteConnection(object):
         self._verify_ssl = config_entry.data.get(CONF_VERIFY_SSL, False)
         self._access_token = config_entry.data.get(CONF_ACCESS_TOKEN)
 
-        # see homeassistant/components/influxdb/__init__.py
-        # for include/exclude logic
-        self._whitelist_e = set(config_entry.options.get(CONF_INCLUDE_ENTITIES, []))
-        self._whitelist_d = set(config_entry.options.get(CONF_INCLUDE_DOMAINS, []))
-        self._blacklist_e = set(config_entry.options.get(CONF_EXCLUDE_ENTITIES, []))
-        self._blacklist_d = set(config_entry.options.get(CONF_EXCLUDE_DOMAINS, []))
-
-        self._filter = [
-            {
-                CONF_ENTITY_ID: re.compile(fnmatch.translate(f.get(CONF_ENTITY_ID)))
-                if f.get(CONF_ENTITY_ID)
-                else None,
-                CONF_UNIT_OF_MEASUREMENT: f.get(CONF_UNIT_OF_MEASUREMENT),
-                CONF_ABOVE: f.get(CONF_ABOVE),
-                CONF_BELOW: f.get(CONF_BELOW),
-            }
-            for f in config_entry.options.get(CONF_FILTER, [])
-        ]
+        self._filter = EntityFilter(config_entry.options)
 
         self._subscribe_events = config_entry.options.get(CONF_SUBSCRIBE_EVENTS, [])
-        self._entity_prefix = config_entry.options.get(CONF_ENTITY_PREFIX, "")
+        self._subscribe_entities = config_entry.options.get(
+            CONF_SUBSCRIBE_ENTITIES, False
+        )
 
         self._connection = None
         self._heartbeat_task = None
         self._is_stopping = False
         self._entities = set()
         self._all_entity_names = set()
+        # Last known state and attributes of each remote entity, used to
+        # apply the diffs sent by subscribe_entities
+        self._shadow = {}
         self._handlers = {}
         self._remove_listener = None
+        self._outbound = ServiceCallScheduler(hass, self._send_service_call)
 
         self.set_connection_state(STATE_CONNECTING)
 
         self.__id = 1
 
-    def _prefixed_entity_id(self, entity_id):
-        if self._entity_prefix:
-            domain, object_id = split_entity_id(entity_id)
-            object_id = self._entity_prefix + object_id
-            entity_id = domain + "." + object_id
-            return entity_id
-        return entity_id
-
     def set_connection_state(self, state):
         """Change current connection state."""
         signal = f"remote_homeassistant_{self._entry.unique_id}"
@@ -483,7 +466,26 @@ class RemoteConnection(object):
             _LOGGER.error("remote websocket connection closed: %s", err)
             await self._disconnected()
 
+    async def _send_service_call(self, message_type, data):
+        data = {"id": self._next_id(), "type": message_type, **data}
+
+        _LOGGER.debug("forward event: %s", data)
+
+        try:
+            await self._connection.send_json(data)
+        except Exception as err:
+            _LOGGER.error("could not send data to remote connection: %s", err)
+            await self._disconnected()
+            return False
+        return True
+
+    @property
+    def outbound_diagnostics(self):
+        """Return statistics of the service calls forwarded to the remote."""
+        return self._outbound.diagnostics
+
     async def _disconnected(self):
+        self._outbound.async_clear()
         # Remove all published entries
         for entity in self._entities:
             self._hass.states.async_remove(entity)
@@ -501,6 +503,8 @@ class RemoteConnection(object):
         self._remove_listener = None
         self._entities = set()
         self._all_entity_names = set()
+        self._shadow = {}
+        self._filter.clear_mirrored()
         if not self._is_stopping:
             asyncio.ensure_future(self.async_connect())
 
@@ -569,7 +573,8 @@ class RemoteConnection(object):
         await self._disconnected()
 
     async def _init(self):
-        async def forward_event(event):
+        @callback
+        def forward_event(event):
             """Send local event to remote instance.
 
             The affected entity_id has to origin from that remote instance,
@@ -586,96 +591,58 @@ class RemoteConnection(object):
             if not entity_ids:
                 return
 
-            if isinstance(entity_ids, str):
-                entity_ids = (entity_ids.lower(),)
-
-            entities = {entity_id.lower() for entity_id in self._entities}
-
-            entity_ids = entities.intersection(entity_ids)
+            entity_ids = self._filter.remote_entity_ids(entity_ids)
 
             if not entity_ids:
                 return
 
-            if self._entity_prefix:
-
-                def _remove_prefix(entity_id):
-                    domain, object_id = split_entity_id(entity_id)
-                    object_id = object_id.replace(self._entity_prefix.lower(), "", 1)
-                    return domain + "." + object_id
-
-                entity_ids = {_remove_prefix(entity_id) for entity_id in entity_ids}
-
-            event_data = copy.deepcopy(event_data)
-            event_data["service_data"]["entity_id"] = list(entity_ids)
-
             # Remove service_call_id parameter - websocket API
             # doesn't accept that one
-            event_data.pop("service_call_id", None)
-
-            _id = self._next_id()
-            data = {"id": _id, "type": event.event_type, **event_data}
-
-            _LOGGER.debug("forward event: %s", data)
+            event_data = {
+                key: value
+                for key, value in event_data.items()
+                if key != "service_call_id"
+            }
+            event_data["service_data"] = {
+                key: value
+                for key, value in service_data.items()
+                if key != "entity_id"
+            }
 
-            try:
-                await self._connection.send_json(data)
-            except Exception as err:
-                _LOGGER.error("could not send data to remote connection: %s", err)
-                await self._disconnected()
+            self._outbound.async_enqueue(event.event_type, event_data, entity_ids)
 
         def state_changed(entity_id, state, attr):
             """Publish remote state change on local instance."""
-            domain, object_id = split_entity_id(entity_id)
-
             self._all_entity_names.add(entity_id)
 
-            if entity_id in self._blacklist_e or domain in self._blacklist_d:
-                return
-
-            if (
-                (self._whitelist_e or self._whitelist_d)
-                and entity_id not in self._whitelist_e
-                and domain not in self._whitelist_d
-            ):
+            decision = self._filter.decide(entity_id)
+            if decision is None or not decision.accepts_state(state, attr):
                 return
 
-            for f in self._filter:
-                if f[CONF_ENTITY_ID] and not f[CONF_ENTITY_ID].match(entity_id):
-                    continue
-                if f[CONF_UNIT_OF_MEASUREMENT]:
-                    if CONF_UNIT_OF_MEASUREMENT not in attr:
-                        continue
-                    if f[CONF_UNIT_OF_MEASUREMENT] != attr[CONF_UNIT_OF_MEASUREMENT]:
-                        continue
-                try:
-                    if f[CONF_BELOW] and float(state) < f[CONF_BELOW]:
-                        _LOGGER.info(
-                            "%s: ignoring state '%s', because " "below '%s'",
-                            entity_id,
-                            state,
-                            f[CONF_BELOW],
-                        )
-                        return
-                    if f[CONF_ABOVE] and float(state) > f[CONF_ABOVE]:
-                        _LOGGER.info(
-                            "%s: ignoring state '%s', because " "above '%s'",
-                            entity_id,
-                            state,
-                            f[CONF_ABOVE],
-                        )
-                        return
-                except ValueError:
-                    pass
-
-            entity_id = self._prefixed_entity_id(entity_id)
+            entity_id = decision.local_entity_id
 
             # Add local customization data
             if DATA_CUSTOMIZE in self._hass.data:
-                attr.update(self._hass.data[DATA_CUSTOMIZE].get(entity_id))
+                customization = decision.customization(
+                    self._hass.data[DATA_CUSTOMIZE]
+                )
+                if customization:
+                    attr.update(customization)
 
             self._entities.add(entity_id)
+            self._filter.add_mirrored(decision)
             self._hass.states.async_set(entity_id, state, attr)
 
+        def entity_removed(entity_id):
+            """Remove an entity that was removed in the remote instance."""
+            entity_id = self._filter.prefixed_entity_id(entity_id)
+            self._filter.remove_mirrored(entity_id)
+            with suppress(ValueError, AttributeError, KeyError):
+                self._entities.remove(entity_id)
+            with suppress(ValueError, AttributeError, KeyError):
+                self._all_entity_names.remove(entity_id)
+            self._hass.states.async_remove(entity_id)
+
         def fire_event(message):
             """Publish remove event on local instance."""
             if message["type"] == "result":
@@ -688,13 +655,8 @@ class RemoteConnection(object):
                 data = message["event"]["data"]
                 entity_id = data["entity_id"]
                 if not data["new_state"]:
-                    entity_id = self._prefixed_entity_id(entity_id)
                     # entity was removed in the remote instance
-                    with suppress(ValueError, AttributeError, KeyError):
-                        self._entities.remove(entity_id)
-                    with suppress(ValueError, AttributeError, KeyError):
-                        self._all_entity_names.remove(entity_id)
-                    self._hass.states.async_remove(entity_id)
+                    entity_removed(entity_id)
                     return
 
                 state = data["new_state"]["state"]
@@ -722,11 +684,79 @@ class RemoteConnection(object):
 
                 state_changed(entity_id, state, attributes)
 
+        def entities_changed(message):
+            """Apply compressed entity diffs from subscribe_entities.
+
+            The first event holds every remote entity under "a", later events
+            only hold what changed: "c" maps entity_id to added/changed ("+")
+            and removed ("-") fields, "r" lists removed entities. Diffs are
+            applied to the shadow copy and the local state is only written if
+            state or attributes changed, not for context or timestamps only.
+            """
+            if message["type"] == "result":
+                if not message["success"]:
+                    _LOGGER.warning(
+                        "remote instance does not support subscribe_entities, "
+                        "falling back to state_changed events: %s",
+                        message.get("error"),
+                    )
+                    asyncio.ensure_future(subscribe_states())
+                return
+
+            if message["type"] != "event":
+                return
+
+            event = message["event"]
+
+            for entity_id, compressed in event.get("a", {}).items():
+                shadow = {"s": compressed["s"], "a": compressed.get("a", {})}
+                self._shadow[entity_id] = shadow
+                state_changed(entity_id, shadow["s"], dict(shadow["a"]))
+
+            for entity_id, diff in event.get("c", {}).items():
+                shadow = self._shadow.get(entity_id)
+                if shadow is None:
+                    continue
+
+                changed = False
+                additions = diff.get("+", {})
+                if "s" in additions and additions["s"] != shadow["s"]:
+                    shadow["s"] = additions["s"]
+                    changed = True
+                for key, value in additions.get("a", {}).items():
+                    if key not in shadow["a"] or shadow["a"][key] != value:
+                        shadow["a"][key] = value
+                        changed = True
+                for key in diff.get("-", {}).get("a", []):
+                    if key in shadow["a"]:
+                        del shadow["a"][key]
+                        changed = True
+
+                if changed:
+                    state_changed(entity_id, shadow["s"], dict(shadow["a"]))
+
+            for entity_id in event.get("r", []):
+                self._shadow.pop(entity_id, None)
+                entity_removed(entity_id)
+
+        async def subscribe_states():
+            """Subscribe to full state_changed events and fetch all states."""
+            if EVENT_STATE_CHANGED in self._subscribe_events:
+                await self._call(
+                    fire_event, "subscribe_events", event_type=EVENT_STATE_CHANGED
+                )
+            await self._call(got_states, "get_states")
+
         self._remove_listener = self._hass.bus.async_listen(
             EVENT_CALL_SERVICE, forward_event
         )
 
         for event in self._subscribe_events:
+            if self._subscribe_entities and event == EVENT_STATE_CHANGED:
+                continue
             await self._call(fire_event, "subscribe_events", event_type=event)
 
-        await self._call(got_states, "get_states")
+        if self._subscribe_entities:
+            await self._call(entities_changed, "subscribe_entities")
+        else:
+            await self._call(got_states, "get_states")
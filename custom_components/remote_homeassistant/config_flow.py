@@ -38,6 +38,7 @@ from .const import (
     CONF_LOAD_COMPONENTS,
     CONF_FILTER,
     CONF_SUBSCRIBE_EVENTS,
+    CONF_SUBSCRIBE_ENTITIES,
     CONF_ENTITY_PREFIX,
     CONF_INCLUDE_DOMAINS,
     CONF_INCLUDE_ENTITIES,
@@ -215,6 +216,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_LOAD_COMPONENTS,
                         default=self._default(CONF_LOAD_COMPONENTS),
                     ): cv.multi_select(sorted(domains)),
+                    vol.Optional(
+                        CONF_SUBSCRIBE_ENTITIES,
+                        default=self.config_entry.options.get(
+                            CONF_SUBSCRIBE_ENTITIES, False
+                        ),
+                    ): bool,
                 }
             ),
         )
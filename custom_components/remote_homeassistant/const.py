@@ -10,6 +10,7 @@ CONF_FILTER = "filter"
 CONF_SECURE = "secure"
 CONF_API_PASSWORD = "api_password"
 CONF_SUBSCRIBE_EVENTS = "subscribe_events"
+CONF_SUBSCRIBE_ENTITIES = "subscribe_entities"
 CONF_ENTITY_PREFIX = "entity_prefix"
 
 CONF_INCLUDE_DOMAINS = "include_domains"
@@ -0,0 +1,25 @@
+"""Diagnostics support for Remote Home-Assistant."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ACCESS_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_PASSWORD, CONF_REMOTE_CONNECTION, DOMAIN
+
+TO_REDACT = {CONF_ACCESS_TOKEN, CONF_API_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    remote = hass.data[DOMAIN][entry.entry_id][CONF_REMOTE_CONNECTION]
+    return {
+        "data": async_redact_data(entry.data, TO_REDACT),
+        "options": dict(entry.options),
+        "outbound": remote.outbound_diagnostics,
+    }
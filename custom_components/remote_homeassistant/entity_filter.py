@@ -0,0 +1,181 @@
+"""Compiled entity filters for states received from a remote instance."""
+import fnmatch
+import logging
+import re
+
+from homeassistant.const import (
+    CONF_ABOVE,
+    CONF_BELOW,
+    CONF_ENTITY_ID,
+    CONF_UNIT_OF_MEASUREMENT,
+)
+from homeassistant.core import split_entity_id
+
+from .const import (
+    CONF_ENTITY_PREFIX,
+    CONF_EXCLUDE_DOMAINS,
+    CONF_EXCLUDE_ENTITIES,
+    CONF_FILTER,
+    CONF_INCLUDE_DOMAINS,
+    CONF_INCLUDE_ENTITIES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EntityDecision:
+    """Filter decision for a remote entity that is mirrored locally."""
+
+    __slots__ = (
+        "entity_id",
+        "local_entity_id",
+        "bounds",
+        "_customize",
+        "_customize_source",
+    )
+
+    def __init__(self, entity_id, local_entity_id, bounds):
+        """Initialize the decision."""
+        self.entity_id = entity_id
+        self.local_entity_id = local_entity_id
+        # (unit_of_measurement, above, below) of the filters matching entity_id
+        self.bounds = bounds
+        self._customize = None
+        self._customize_source = None
+
+    def customization(self, customize):
+        """Return the local customization of the entity.
+
+        Reloading the core config replaces the customize lookup, so the
+        cached value is tied to the lookup it came from.
+        """
+        if self._customize_source is not customize:
+            self._customize = customize.get(self.local_entity_id)
+            self._customize_source = customize
+        return self._customize
+
+    def accepts_state(self, state, attr):
+        """Return True if the state passes the above/below filters."""
+        for unit, above, below in self.bounds:
+            if unit and attr.get(CONF_UNIT_OF_MEASUREMENT) != unit:
+                continue
+            try:
+                if below and float(state) < below:
+                    _LOGGER.info(
+                        "%s: ignoring state '%s', because below '%s'",
+                        self.entity_id,
+                        state,
+                        below,
+                    )
+                    return False
+                if above and float(state) > above:
+                    _LOGGER.info(
+                        "%s: ignoring state '%s', because above '%s'",
+                        self.entity_id,
+                        state,
+                        above,
+                    )
+                    return False
+            except ValueError:
+                pass
+        return True
+
+
+class EntityFilter:
+    """Include/exclude lists and state filters compiled from entry options.
+
+    Whether an entity is mirrored only depends on its entity_id, so the
+    decision is made once per entity and cached. Options changes reload the
+    config entry, which creates a new filter and thereby drops the cache.
+    """
+
+    def __init__(self, options):
+        """Initialize the filter from config entry options."""
+        # see homeassistant/components/influxdb/__init__.py
+        # for include/exclude logic
+        self._whitelist_e = set(options.get(CONF_INCLUDE_ENTITIES, []))
+        self._whitelist_d = set(options.get(CONF_INCLUDE_DOMAINS, []))
+        self._blacklist_e = set(options.get(CONF_EXCLUDE_ENTITIES, []))
+        self._blacklist_d = set(options.get(CONF_EXCLUDE_DOMAINS, []))
+
+        # Filters without above/below never reject a state, so they are
+        # left out entirely
+        self._filters = [
+            (
+                re.compile(fnmatch.translate(f[CONF_ENTITY_ID]))
+                if f.get(CONF_ENTITY_ID)
+                else None,
+                f.get(CONF_UNIT_OF_MEASUREMENT),
+                f.get(CONF_ABOVE),
+                f.get(CONF_BELOW),
+            )
+            for f in options.get(CONF_FILTER, [])
+            if f.get(CONF_ABOVE) or f.get(CONF_BELOW)
+        ]
+
+        self.entity_prefix = options.get(CONF_ENTITY_PREFIX, "")
+
+        self._decisions = {}
+        # Lowercased local entity_id -> remote entity_id of mirrored entities
+        self._mirrored = {}
+
+    def prefixed_entity_id(self, entity_id):
+        """Return the local entity_id of a remote entity."""
+        if self.entity_prefix:
+            domain, object_id = split_entity_id(entity_id)
+            return domain + "." + self.entity_prefix + object_id
+        return entity_id
+
+    def decide(self, entity_id):
+        """Return the decision for a remote entity, None if it is excluded."""
+        try:
+            return self._decisions[entity_id]
+        except KeyError:
+            pass
+
+        decision = self._compile(entity_id)
+        self._decisions[entity_id] = decision
+        return decision
+
+    def _compile(self, entity_id):
+        domain, _ = split_entity_id(entity_id)
+
+        if entity_id in self._blacklist_e or domain in self._blacklist_d:
+            return None
+
+        if (
+            (self._whitelist_e or self._whitelist_d)
+            and entity_id not in self._whitelist_e
+            and domain not in self._whitelist_d
+        ):
+            return None
+
+        bounds = tuple(
+            (unit, above, below)
+            for pattern, unit, above, below in self._filters
+            if pattern is None or pattern.match(entity_id)
+        )
+        return EntityDecision(entity_id, self.prefixed_entity_id(entity_id), bounds)
+
+    def add_mirrored(self, decision):
+        """Remember that an entity is mirrored locally."""
+        self._mirrored[decision.local_entity_id.lower()] = decision.entity_id
+
+    def remove_mirrored(self, local_entity_id):
+        """Forget a mirrored entity."""
+        self._mirrored.pop(local_entity_id.lower(), None)
+
+    def clear_mirrored(self):
+        """Forget all mirrored entities."""
+        self._mirrored = {}
+
+    def remote_entity_ids(self, local_entity_ids):
+        """Return the remote entity_ids of the mirrored local entities."""
+        if isinstance(local_entity_ids, str):
+            local_entity_ids = (local_entity_ids,)
+        remote_entity_ids = {}
+        for entity_id in local_entity_ids:
+            remote_entity_id = self._mirrored.get(entity_id.lower())
+            if remote_entity_id is not None:
+                remote_entity_ids[remote_entity_id] = None
+        return list(remote_entity_ids)
@@ -0,0 +1,123 @@
+"""Coalescing scheduler for service calls forwarded to a remote instance."""
+import asyncio
+from collections import deque
+
+from homeassistant.core import callback
+
+# Calls for the same service and data queued within this time are merged
+COALESCE_DELAY = 0.005
+
+
+class _PendingCall:
+    """Service call waiting to be sent."""
+
+    __slots__ = ("message_type", "data", "entity_ids", "queued_at")
+
+    def __init__(self, message_type, data, entity_ids, queued_at):
+        """Initialize the pending call."""
+        self.message_type = message_type
+        self.data = data
+        self.entity_ids = dict.fromkeys(entity_ids)
+        self.queued_at = queued_at
+
+
+class ServiceCallScheduler:
+    """Sends forwarded service calls in order, one frame per burst.
+
+    Scenes and scripts fire a call_service event per entity. Calls queued
+    within COALESCE_DELAY for the same domain, service and service data
+    (except entity_id) are merged into one call with all entity_ids. Only
+    the last queued call is merged into, so calls are never reordered, and
+    only when it doesn't target the same entities yet, so repeated calls of
+    services like toggle or increment are all sent.
+    """
+
+    def __init__(self, hass, send, delay=COALESCE_DELAY):
+        """Initialize the scheduler.
+
+        send is a coroutine function taking the message type and data of a
+        call, returning False if the connection failed.
+        """
+        self._hass = hass
+        self._send = send
+        self._delay = delay
+        self._queue = deque()
+        self._task = None
+
+        self._calls = 0
+        self._frames = 0
+        self._last_latency = None
+        self._max_latency = 0.0
+        self._total_latency = 0.0
+
+    @callback
+    def async_enqueue(self, message_type, data, entity_ids):
+        """Queue a service call for entity_ids.
+
+        data holds the call without service_data.entity_id and must not be
+        modified afterwards.
+        """
+        self._calls += 1
+
+        if self._queue:
+            tail = self._queue[-1]
+            if (
+                tail.message_type == message_type
+                and tail.data == data
+                and tail.entity_ids.keys().isdisjoint(entity_ids)
+            ):
+                tail.entity_ids.update(dict.fromkeys(entity_ids))
+                return
+
+        self._queue.append(
+            _PendingCall(message_type, data, entity_ids, self._hass.loop.time())
+        )
+        if self._task is None:
+            self._task = self._hass.loop.create_task(self._async_run())
+
+    @callback
+    def async_clear(self):
+        """Drop all queued calls, e.g. when the connection was lost."""
+        self._queue.clear()
+
+    async def _async_run(self):
+        try:
+            while self._queue:
+                # Give the rest of the burst time to arrive
+                await asyncio.sleep(self._delay)
+
+                while self._queue:
+                    call = self._queue.popleft()
+                    data = dict(call.data)
+                    data["service_data"] = {
+                        **call.data["service_data"],
+                        "entity_id": list(call.entity_ids),
+                    }
+                    if not await self._send(call.message_type, data):
+                        self._queue.clear()
+                        break
+
+                    latency = self._hass.loop.time() - call.queued_at
+                    self._frames += 1
+                    self._last_latency = latency
+                    self._max_latency = max(self._max_latency, latency)
+                    self._total_latency += latency
+        finally:
+            self._task = None
+
+    @property
+    def diagnostics(self):
+        """Return queue depth and latency statistics."""
+        return {
+            "queue_depth": len(self._queue),
+            "queued_entities": sum(len(call.entity_ids) for call in self._queue),
+            "calls": self._calls,
+            "frames": self._frames,
+            "last_latency_ms": round(self._last_latency * 1000, 1)
+            if self._last_latency is not None
+            else None,
+            "max_latency_ms": round(self._max_latency * 1000, 1),
+            "avg_latency_ms": round(self._total_latency / self._frames * 1000, 1)
+            if self._frames
+            else None,
+        }
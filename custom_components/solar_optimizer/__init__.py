@@ -54,6 +54,7 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Required(
                             "max_iteration_number", default=1000
                         ): cv.positive_int,
+                        vol.Optional("restarts", default=1): cv.positive_int,
                     }
                 ),
             }
@@ -78,15 +78,17 @@ class SolarOptimizerCoordinator(DataUpdateCoordinator):
         min_temp = 0.05
         cooling_factor = 0.95
         max_iteration_number = 1000
+        restarts = 1
 
         if config and (algo_config := config.get("algorithm")):
             init_temp = float(algo_config.get("initial_temp", 1000))
             min_temp = float(algo_config.get("min_temp", 0.05))
             cooling_factor = float(algo_config.get("cooling_factor", 0.95))
             max_iteration_number = int(algo_config.get("max_iteration_number", 1000))
+            restarts = int(algo_config.get("restarts", 1))
 
         self._algo = SimulatedAnnealingAlgorithm(
-            init_temp, min_temp, cooling_factor, max_iteration_number
+            init_temp, min_temp, cooling_factor, max_iteration_number, restarts
         )
         self.config = config
 
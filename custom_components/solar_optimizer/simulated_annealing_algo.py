@@ -2,7 +2,6 @@
 import logging
 import random
 import math
-import copy
 
 from .managed_device import ManagedDevice
 
@@ -19,6 +18,7 @@ class SimulatedAnnealingAlgorithm:
     _temperature_minimale: float = 0.1
     _facteur_refroidissement: float = 0.95
     _nombre_iterations: float = 1000
+    _nombre_redemarrages: int = 1
     _equipements: list[ManagedDevice]
     _puissance_totale_eqt_initiale: float
     _cout_achat: float = 15  # centimes
@@ -33,18 +33,21 @@ class SimulatedAnnealingAlgorithm:
         min_temp: float,
         cooling_factor: float,
         max_iteration_number: int,
+        restarts: int = 1,
     ):
         """Initialize the algorithm with values"""
         self._temperature_initiale = initial_temp
         self._temperature_minimale = min_temp
         self._facteur_refroidissement = cooling_factor
         self._nombre_iterations = max_iteration_number
+        self._nombre_redemarrages = max(1, restarts)
         _LOGGER.info(
-            "Initializing the SimulatedAnnealingAlgorithm with initial_temp=%.2f min_temp=%.2f cooling_factor=%.2f max_iterations_number=%d",
+            "Initializing the SimulatedAnnealingAlgorithm with initial_temp=%.2f min_temp=%.2f cooling_factor=%.2f max_iterations_number=%d restarts=%d",
             self._temperature_initiale,
             self._temperature_minimale,
             self._facteur_refroidissement,
             self._nombre_iterations,
+            self._nombre_redemarrages,
         )
 
     def recuit_simule(
@@ -147,49 +150,127 @@ class SimulatedAnnealingAlgorithm:
         if DEBUG:
             _LOGGER.debug("enabled _equipements are: %s", self._equipements)
 
-        # Générer une solution initiale
-        solution_actuelle = self.generer_solution_initiale(self._equipements)
-        meilleure_solution = solution_actuelle
-        meilleure_objectif = self.calculer_objectif(solution_actuelle)
+        self._preparer_etat(self._equipements)
+        meilleur = self._executer_recuit(random)
+        for _ in range(1, self._nombre_redemarrages):
+            candidat = self._executer_recuit(random.Random(random.random()))
+            if candidat[1] < meilleur[1]:
+                meilleur = candidat
+
+        etats, puissances, meilleure_objectif, puissance_totale = meilleur
+        meilleure_solution = [
+            dict(equipement, state=etats[i], requested_power=puissances[i])
+            for i, equipement in enumerate(self._equipements)
+        ]
+        return meilleure_solution, meilleure_objectif, puissance_totale
+
+    def _preparer_etat(self, equipements: list[dict]):
+        """Build the compact state of the algorithm: one list per attribute of the equipments"""
+        self._etats = [eqt["state"] for eqt in equipements]
+        self._puissances = [eqt["requested_power"] for eqt in equipements]
+        self._priorites = [eqt["priority"] for eqt in equipements]
+        self._pas = [eqt["power_step"] for eqt in equipements]
+        self._puissances_max = [eqt["power_max"] for eqt in equipements]
+        # If power is not manageable, min = max
+        self._puissances_min = [
+            eqt["power_min"] if eqt["can_change_power"] else eqt["power_max"]
+            for eqt in equipements
+        ]
+        self._variables = [eqt["can_change_power"] for eqt in equipements]
+        self._en_attente = [eqt["is_waiting"] for eqt in equipements]
+        self._utilisables = [i for i, eqt in enumerate(equipements) if eqt["is_usable"]]
+
+        self._puissance_totale_eqt_initiale = self.consommation_equipements(equipements)
+        cout_revente_impose = self._cout_revente * (1.0 - self._taxe_revente / 100.0)
+        self._coef_import = (self._cout_achat) / (
+            self._cout_achat + cout_revente_impose
+        )
+        self._coef_rejets = (cout_revente_impose) / (
+            self._cout_achat + cout_revente_impose
+        )
+
+    def _executer_recuit(self, rng) -> tuple[list[bool], list[float], float, float]:
+        """Run one simulated annealing from the initial state, using rng as random source.
+        Only the moved equipment is updated at each iteration so that the objective is computed in O(1).
+        Returns the best states, the best requested powers, the best objective and its total power
+        """
+        etats = list(self._etats)
+        puissances = list(self._puissances)
+        priorites = self._priorites
+        utilisables = self._utilisables
+
+        puissance_totale = self._puissance_totale_eqt_initiale
+        priorite_ponderee = sum(
+            priorites[i] * puissances[i] for i in range(len(etats)) if etats[i]
+        )
+        objectif_actuel = self._objectif(puissance_totale, priorite_ponderee)
+
+        meilleurs_etats = list(etats)
+        meilleures_puissances = list(puissances)
+        meilleure_objectif = objectif_actuel
+        meilleure_puissance_totale = puissance_totale
         temperature = self._temperature_initiale
 
         for _ in range(self._nombre_iterations):
-            # Générer un voisin
-            objectif_actuel = self.calculer_objectif(solution_actuelle)
             if DEBUG:
                 _LOGGER.debug("Objectif actuel : %.2f", objectif_actuel)
 
-            voisin = self.permuter_equipement(solution_actuelle)
-
-            # Calculer les objectifs pour la solution actuelle et le voisin
-            objectif_voisin = self.calculer_objectif(voisin)
+            # Générer un voisin
+            mouvement = (
+                self._permuter(rng.choice(utilisables), etats, puissances, rng)
+                if utilisables
+                else None
+            )
+            if mouvement is None:
+                # No change: the neighbour is the current solution
+                index = None
+                puissance_voisin = puissance_totale
+                priorite_voisin = priorite_ponderee
+                objectif_voisin = objectif_actuel
+            else:
+                index, nouvel_etat, nouvelle_puissance = mouvement
+                ancienne = puissances[index] if etats[index] else 0
+                nouvelle = nouvelle_puissance if nouvel_etat else 0
+                puissance_voisin = puissance_totale + nouvelle - ancienne
+                priorite_voisin = priorite_ponderee + priorites[index] * (
+                    nouvelle - ancienne
+                )
+                objectif_voisin = self._objectif(puissance_voisin, priorite_voisin)
             if DEBUG:
                 _LOGGER.debug("Objectif voisin : %2.f", objectif_voisin)
 
-            # Accepter le voisin si son objectif est meilleur ou si la consommation totale n'excède pas la production solaire
-            if objectif_voisin < objectif_actuel:
-                _LOGGER.debug("---> On garde l'objectif voisin")
-                solution_actuelle = voisin
-                if objectif_voisin < meilleure_objectif:
-                    _LOGGER.debug("---> C'est la meilleure jusque là")
-                    meilleure_solution = voisin
-                    meilleure_objectif = objectif_voisin
-            else:
-                # Accepter le voisin avec une certaine probabilité
+            # Accepter le voisin si son objectif est meilleur, sinon avec une certaine probabilité
+            accepte = objectif_voisin < objectif_actuel
+            if not accepte:
                 probabilite = math.exp(
                     (objectif_actuel - objectif_voisin) / temperature
                 )
-                if (seuil := random.random()) < probabilite:
-                    solution_actuelle = voisin
+                accepte = (seuil := rng.random()) < probabilite
+                if DEBUG:
+                    _LOGGER.debug(
+                        "---> seuil (%.2f) / proba (%.2f) : %s",
+                        seuil,
+                        probabilite,
+                        accepte,
+                    )
+
+            if accepte:
+                if index is not None:
+                    etats[index] = nouvel_etat
+                    puissances[index] = nouvelle_puissance
+                puissance_totale = puissance_voisin
+                priorite_ponderee = priorite_voisin
+                if (
+                    objectif_voisin < objectif_actuel
+                    and objectif_voisin < meilleure_objectif
+                ):
                     if DEBUG:
-                        _LOGGER.debug(
-                            "---> On garde l'objectif voisin car seuil (%.2f) inférieur à proba (%.2f)",
-                            seuil,
-                            probabilite,
-                        )
-                else:
-                    if DEBUG:
-                        _LOGGER.debug("--> On ne prend pas")
+                        _LOGGER.debug("---> C'est la meilleure jusque là")
+                    meilleurs_etats = list(etats)
+                    meilleures_puissances = list(puissances)
+                    meilleure_objectif = objectif_voisin
+                    meilleure_puissance_totale = puissance_totale
+                objectif_actuel = objectif_voisin
 
             # Réduire la température
             temperature *= self._facteur_refroidissement
@@ -199,19 +280,17 @@ class SimulatedAnnealingAlgorithm:
                 break
 
         return (
-            meilleure_solution,
+            meilleurs_etats,
+            meilleures_puissances,
             meilleure_objectif,
-            self.consommation_equipements(meilleure_solution),
+            meilleure_puissance_totale,
         )
 
-    def calculer_objectif(self, solution) -> float:
-        """Calcul de l'objectif : minimiser le surplus de production solaire
-        rejets = 0 if consommation_net >=0 else -consommation_net
-        consommation_solaire = min(production_solaire, production_solaire - rejets)
-        consommation_totale = consommation_net + consommation_solaire
+    def _objectif(self, puissance_totale_eqt: float, priorite_ponderee: float) -> float:
+        """Calcul de l'objectif à partir de la puissance totale des équipements actifs
+        et de la somme de leurs priorités pondérées par leur puissance demandée.
+        See calculer_objectif
         """
-
-        puissance_totale_eqt = self.consommation_equipements(solution)
         diff_puissance_totale_eqt = (
             puissance_totale_eqt - self._puissance_totale_eqt_initiale
         )
@@ -219,41 +298,35 @@ class SimulatedAnnealingAlgorithm:
         new_consommation_net = self._consommation_net + diff_puissance_totale_eqt
         new_rejets = 0 if new_consommation_net >= 0 else -new_consommation_net
         new_import = 0 if new_consommation_net < 0 else new_consommation_net
-        new_consommation_solaire = min(
-            self._production_solaire, self._production_solaire - new_rejets
-        )
-        new_consommation_totale = (
-            new_consommation_net + new_rejets
-        ) + new_consommation_solaire
-        if DEBUG:
-            _LOGGER.debug(
-                "Objectif : cette solution ajoute %.3fW a la consommation initial. Nouvelle consommation nette=%.3fW. Nouveaux rejets=%.3fW. Nouvelle conso totale=%.3fW",
-                diff_puissance_totale_eqt,
-                new_consommation_net,
-                new_rejets,
-                new_consommation_totale,
-            )
-
-        cout_revente_impose = self._cout_revente * (1.0 - self._taxe_revente / 100.0)
-        coef_import = (self._cout_achat) / (self._cout_achat + cout_revente_impose)
-        coef_rejets = (cout_revente_impose) / (self._cout_achat + cout_revente_impose)
 
-        consumption_coef = coef_import * new_import + coef_rejets * new_rejets
-        # calculate the priority coef as the sum of the priority of all devices
-        # in the solution
+        consumption_coef = (
+            self._coef_import * new_import + self._coef_rejets * new_rejets
+        )
+        # the priority coef is the mean of the priority of all active devices
+        # weighted by their requested power
         if puissance_totale_eqt > 0:
-            priority_coef = sum((equip["priority"] * equip["requested_power"] / puissance_totale_eqt) for i, equip in enumerate(solution) if equip["state"])
+            priority_coef = priorite_ponderee / puissance_totale_eqt
         else:
             priority_coef = 0
         priority_weight = self._priority_weight
 
-        ret = consumption_coef * (1.0 - priority_weight) + priority_coef * priority_weight
-        return ret
+        return (
+            consumption_coef * (1.0 - priority_weight) + priority_coef * priority_weight
+        )
 
-    def generer_solution_initiale(self, solution):
-        """Generate the initial solution (which is the solution given in argument) and calculate the total initial power"""
-        self._puissance_totale_eqt_initiale = self.consommation_equipements(solution)
-        return copy.deepcopy(solution)
+    def calculer_objectif(self, solution) -> float:
+        """Calcul de l'objectif : minimiser le surplus de production solaire
+        rejets = 0 if consommation_net >=0 else -consommation_net
+        consommation_solaire = min(production_solaire, production_solaire - rejets)
+        consommation_totale = consommation_net + consommation_solaire
+        """
+        puissance_totale_eqt = self.consommation_equipements(solution)
+        priorite_ponderee = sum(
+            equip["priority"] * equip["requested_power"]
+            for equip in solution
+            if equip["state"]
+        )
+        return self._objectif(puissance_totale_eqt, priorite_ponderee)
 
     def consommation_equipements(self, solution):
         """The total power consumption for all active equipement"""
@@ -264,68 +337,50 @@ class SimulatedAnnealingAlgorithm:
         )
 
     def calculer_new_power(
-        self, current_power, power_step, power_min, power_max, can_switch_off
+        self,
+        current_power,
+        power_step,
+        power_min,
+        power_max,
+        can_switch_off,
+        rng=random,
     ):
         """Calcul une nouvelle puissance"""
-        choices = []
-        power_min_to_use = max(0, power_min - power_step) if can_switch_off else power_min
-
-        # add all choices from current_power to power_min_to_use descending
-        cp = current_power
-        choice = -1
-        while cp > power_min_to_use:
-            cp -= power_step
-            choices.append(choice)
-            choice -= 1
-
-        # if current_power > power_min_to_use:
-        #    choices.append(-1)
-
-        # add all choices from current_power to power_max ascending
-        cp = current_power
-        choice = 1
-        while cp < power_max:
-            cp += power_step
-            choices.append(choice)
-            choice += 1
-        # if current_power < power_max:
-        #     choices.append(1)
-
-        if len(choices) <= 0:
+        power_min_to_use = (
+            max(0, power_min - power_step) if can_switch_off else power_min
+        )
+
+        # number of choices from current_power to power_min_to_use descending
+        # and from current_power to power_max ascending
+        nb_down = max(0, math.ceil((current_power - power_min_to_use) / power_step))
+        nb_up = max(0, math.ceil((power_max - current_power) / power_step))
+
+        if nb_down + nb_up <= 0:
             # No changes
             return current_power
 
-        power_add = random.choice(choices) * power_step
-        _LOGGER.debug("Adding %d power to current_power (%d)", power_add, current_power)
-        requested_power = current_power + power_add
-        _LOGGER.debug("New requested_power is %s", requested_power)
+        choice = rng.randrange(nb_down + nb_up)
+        choice = -(choice + 1) if choice < nb_down else choice - nb_down + 1
+        requested_power = current_power + choice * power_step
+        if DEBUG:
+            _LOGGER.debug(
+                "New requested_power is %s (was %s)", requested_power, current_power
+            )
         return requested_power
 
-    def permuter_equipement(self, solution):
-        """Permuter le state d'un equipement eau hasard"""
-        voisin = copy.deepcopy(solution)
-
-        usable = [eqt for eqt in voisin if eqt["is_usable"]]
-
-        if len(usable) <= 0:
-            return voisin
-
-        eqt = random.choice(usable)
-
-        # name = eqt["name"]
-        state = eqt["state"]
-        can_change_power = eqt["can_change_power"]
-        is_waiting = eqt["is_waiting"]
+    def _permuter(self, index: int, etats: list, puissances: list, rng):
+        """Permuter le state d'un equipement au hasard
+        Returns (index, new state, new requested power) or None if the equipment cannot change
+        """
+        state = etats[index]
+        can_change_power = self._variables[index]
+        is_waiting = self._en_attente[index]
 
         # Current power is the last requested_power
-        current_power = eqt.get("requested_power")
-        power_max = eqt.get("power_max")
-        power_step = eqt.get("power_step")
-        if can_change_power:
-            power_min = eqt.get("power_min")
-        else:
-            # If power is not manageable, min = max
-            power_min = power_max
+        current_power = puissances[index]
+        power_max = self._puissances_max[index]
+        power_step = self._pas[index]
+        power_min = self._puissances_min[index]
 
         # On veut gérer le is_waiting qui interdit d'allumer ou éteindre un eqt usable.
         # On veut pouvoir changer la puissance si l'eqt est déjà allumé malgré qu'il soit waiting.
@@ -349,13 +404,14 @@ class SimulatedAnnealingAlgorithm:
         if (not can_change_power and is_waiting) or (
             not state and can_change_power and is_waiting
         ):
-            _LOGGER.debug("not can_change_power and is_waiting -> do nothing")
-            return voisin
+            if DEBUG:
+                _LOGGER.debug("not can_change_power and is_waiting -> do nothing")
+            return None
 
         if state and can_change_power and is_waiting:
             # calculated a new power but do not switch off (because waiting)
             requested_power = self.calculer_new_power(
-                current_power, power_step, power_min, power_max, can_switch_off=False
+                current_power, power_step, power_min, power_max, False, rng
             )
             assert (
                 requested_power > 0
@@ -364,34 +420,28 @@ class SimulatedAnnealingAlgorithm:
         elif state and can_change_power and not is_waiting:
             # change power and accept switching off
             requested_power = self.calculer_new_power(
-                current_power, power_step, power_min, power_max, can_switch_off=True
+                current_power, power_step, power_min, power_max, True, rng
             )
             if requested_power < power_min:
                 # deactivate the equipment
-                eqt["state"] = False
+                state = False
                 requested_power = 0
 
         elif not state and not is_waiting:
             # Allumage
-            eqt["state"] = not state
+            state = True
             requested_power = power_min
 
-        elif state and not is_waiting:
+        else:
             # Extinction
-            eqt["state"] = not state
+            state = False
             requested_power = 0
 
-        elif "requested_power" not in locals():
-            _LOGGER.error("We should not be there. eqt=%s", eqt)
-            assert False, "Requested power n'a pas été calculé. Ce n'est pas normal"
-
-        eqt["requested_power"] = requested_power
-
         if DEBUG:
             _LOGGER.debug(
                 "      -- On permute %s puissance max de %.2f. Il passe à %s",
-                eqt["name"],
-                eqt["requested_power"],
-                eqt["state"],
+                self._equipements[index]["name"],
+                requested_power,
+                state,
             )
-        return voisin
+        return index, state, requested_power
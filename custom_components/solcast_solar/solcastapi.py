@@ -11,6 +11,7 @@ import copy
 from dataclasses import dataclass
 import datetime
 from datetime import date, datetime as dt, timedelta, tzinfo
+from itertools import accumulate
 import json
 import logging
 import math
@@ -29,7 +30,7 @@ from aiohttp import ClientConnectionError, ClientResponseError, ClientSession
 from aiohttp.client_reqrep import ClientResponse
 
 from homeassistant.components.recorder import get_instance
-from homeassistant.components.recorder.history import state_changes_during_period
+from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_UNIT_OF_MEASUREMENT, CONF_API_KEY
 from homeassistant.core import HomeAssistant, State
@@ -187,16 +188,18 @@ from .const import (
 )
 from .util import (
     AutoUpdate,
+    CacheSerialiser,
     DataCallStatus,
     DateTimeEncoder,
+    EnergySamples,
+    ForecastColumns,
     HistoryType,
     JSONDecoder,
     NoIndentEncoder,
     SitesStatus,
     SolcastApiStatus,
     UsageStatus,
-    cubic_interp,
-    diff,
+    cubic_interp_batch,
     forecast_entry_update,
     http_status_translate,
     interquartile_bounds,
@@ -335,6 +338,7 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         self._filename_dampening = f"{file_path.parent / file_path.stem}-dampening{file_path.suffix}"
         self._filename_generation = f"{file_path.parent / file_path.stem}-generation{file_path.suffix}"
         self._filename_undampened = f"{file_path.parent / file_path.stem}-undampened{file_path.suffix}"
+        self._forecast_columns: dict[int, ForecastColumns] = {}
         self._forecasts_moment: dict[str, dict[str, list[float]]] = {}
         self._forecasts_remaining: dict[str, dict[str, list[float]]] = {}
         self._granular_allow_reset = True
@@ -351,6 +355,7 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         self._sites_actual_hard_limit_undampened: defaultdict[str, Any] = defaultdict(dict)
         self._spline_period = list(range(0, 90000, 1800))
         self._serialise_lock = asyncio.Lock()
+        self._serialiser = CacheSerialiser()
         self._tally: dict[str, float | None] = {}
         self._tz = options.tz
         self._use_forecast_confidence = f"pv_{options.key_estimate}"
@@ -815,9 +820,6 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
             bool: Success or failure.
         """
         if self._loaded_data and data[LAST_UPDATED] != dt.fromtimestamp(0, datetime.UTC):
-            payload = json.dumps(data, ensure_ascii=False, cls=DateTimeEncoder)
-            async with self._serialise_lock, aiofiles.open(filename, "w") as file:
-                await file.write(payload)
             log_file = {
                 self._filename: "dampened",
                 self._filename_undampened: "undampened",
@@ -825,6 +827,16 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
                 self._filename_actuals_dampened: "dampened estimated actual",
                 self._filename_generation: "generation",
             }
+            async with self._serialise_lock:
+                # Snapshot on the event loop, encode the changed days in the executor.
+                snapshot = self._serialiser.snapshot(filename, data)
+                payload, segments = await self.hass.async_add_executor_job(CacheSerialiser.encode, snapshot)
+                if self._serialiser.is_unchanged(filename, payload) and await self.hass.async_add_executor_job(Path(filename).is_file):
+                    _LOGGER.debug("Skipped saving unchanged %s cache", log_file.get(filename, UNKNOWN))
+                    return True
+                async with aiofiles.open(filename, "w") as file:
+                    await file.write(payload)
+                self._serialiser.saved(filename, payload, segments)
             _LOGGER.debug(
                 "Saved %s cache",
                 log_file.get(filename, UNKNOWN),
@@ -1974,6 +1986,7 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         """
         _LOGGER.debug("Action to delete old solcast json files")
         for filename in [self._filename, self._filename_undampened, self._filename_actuals, self._filename_actuals_dampened]:
+            self._serialiser.forget(filename)
             if Path(filename).is_file():
                 Path(filename).unlink()
             else:
@@ -2482,6 +2495,8 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         """
         if end_utc is None:
             end_utc = start_utc + timedelta(seconds=1800)
+        if (columns := self.__get_columns(data)) is not None:
+            return columns.slice(start_utc, end_utc, 0 if search_past else columns.start_index(self.get_day_start_utc()))
         start_index = -1
         end_index = len(data)
         for test_index in range(0 if search_past else self.__calc_forecast_start_index(data), end_index):
@@ -2518,20 +2533,31 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
             confidences (list): The forecast types to build, pv_estimate, pv_estimate10 or pv_estimate90.
             reducing (bool): A flag to indicate whether a momentary power spline should be built, or a reducing energy spline, default momentary.
         """
-        for forecast_confidence in confidences:
-            try:
-                spline_period_length = len(xx) // 6
-                y = [data[start + index][forecast_confidence] for index in range(spline_period_length)]
-                if reducing:
-                    # Build a decreasing set of forecasted values instead.
-                    y = [0.5 * sum(y[index:]) for index in range(spline_period_length)]
-                spline[forecast_confidence] = cubic_interp(xx, self._spline_period[-spline_period_length:], y)
-                spline[forecast_confidence] = [0] * (len(self._spline_period) - len(xx)) + spline[forecast_confidence]
+        spline_period_length = len(xx) // 6
+        try:
+            columns = self.__get_columns(data)
+            if columns is not None:
+                if start + spline_period_length > len(data):
+                    raise IndexError
+                ys = [
+                    list(columns.columns[forecast_confidence][start : start + spline_period_length])
+                    for forecast_confidence in confidences
+                ]
+            else:
+                ys = [
+                    [data[start + index][forecast_confidence] for index in range(spline_period_length)]
+                    for forecast_confidence in confidences
+                ]
+            if reducing:
+                # Build a decreasing set of forecasted values instead.
+                ys = [[0.5 * remaining for remaining in reversed(list(accumulate(reversed(y))))] for y in ys]
+            splines = cubic_interp_batch(xx, self._spline_period[-spline_period_length:], ys)
+            for forecast_confidence, y, values in zip(confidences, ys, splines, strict=True):
+                spline[forecast_confidence] = [0] * (len(self._spline_period) - len(xx)) + values
                 self.__sanitise_spline(spline, forecast_confidence, xx, y, reducing=reducing)
-                continue
-            except IndexError:
-                pass
-            spline[forecast_confidence] = [0] * (len(self._spline_period) * 6)
+        except IndexError:
+            for forecast_confidence in confidences:
+                spline[forecast_confidence] = [0] * (len(self._spline_period) * 6)
 
     def __sanitise_spline(
         self,
@@ -2640,7 +2666,7 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         start_time = time.time()
         await self.__spline_moments()
         await self.__spline_remaining()
-        _LOGGER.debug("Task recalculate_splines took %.3f seconds", time.time() - start_time)
+        _LOGGER.debug("Task recalculate_splines took %.3f seconds for %d sites", time.time() - start_time, len(self.sites))
 
     def __get_moment(self, site: str | None, forecast_confidence: str | None, n_min: float) -> float | None:
         """Get a time value from a moment spline.
@@ -2723,6 +2749,14 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
                     data,
                     day_start + timedelta(seconds=1800 * len(self._spline_period)),
                 )
+                if (columns := self.__get_columns(data)) is not None:
+                    # Whole intervals, then the part of intervals that extend beyond the end.
+                    partial_index = columns.first_after(end_utc - timedelta(seconds=1800), start_index_post_spline, end_index)
+                    result += 0.5 * columns.sum(forecast_confidence, start_index_post_spline, partial_index)
+                    for index in range(partial_index, end_index):
+                        seconds = end_utc.timestamp() - columns.epochs[index]
+                        result += 0.5 * columns.columns[forecast_confidence][index] * seconds / 1800
+                    return max(0, result)
                 for forecast in data[start_index_post_spline:end_index]:
                     forecast_period_next = forecast[PERIOD_START] + timedelta(seconds=1800)
                     seconds = 1800
@@ -2760,6 +2794,8 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         )
         if start_index == 0 and end_index == 0:
             return None
+        if (columns := self.__get_columns(data)) is not None:
+            return columns.sum(forecast_confidence, start_index, end_index)
         for forecast_slice in data[start_index:end_index]:
             result += forecast_slice[forecast_confidence]
         return result
@@ -2809,6 +2845,8 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         start_index, end_index = self.__get_list_slice(data, start_utc, end_utc)
         if start_index == 0 and end_index == 0:
             return None  # Set sensor to unavailable
+        if (columns := self.__get_columns(data)) is not None:
+            return data[columns.peak_index(forecast_confidence, start_index, end_index)]
         result = data[start_index]
         for forecast_slice in data[start_index:end_index]:
             if result[forecast_confidence] < forecast_slice[forecast_confidence]:
@@ -2823,7 +2861,7 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         """
         return self._data_energy_dashboard
 
-    def __get_conversion_factor(self, entity: str, entity_history: list[State] | None = None, is_export: bool = False) -> float:
+    def __get_conversion_factor(self, entity: str, entity_unit: str | None = None, is_export: bool = False) -> float:
         """Get the conversion factor for an electricity energy entity to convert to kWh."""
 
         energy_unit_factors = {
@@ -2833,13 +2871,6 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
             "MWh": 1000.0,
         }
         entity_type = "Export entity" if is_export else "Entity"
-        entity_unit = None
-
-        if entity_history:
-            # Check the entity history for the unit of measurement.
-            latest_state = entity_history[-1]
-            if hasattr(latest_state, "attributes") and latest_state.attributes:
-                entity_unit = latest_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
 
         if not entity_unit:
             # If not found, get the unit of measurement from the entity registry.
@@ -2862,6 +2893,43 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
 
         return conversion_factor
 
+    def __get_history_day(
+        self, start: dt, end: dt, energy_entities: list[str], suppression_entity: str
+    ) -> tuple[dict[str, EnergySamples], list[State]]:
+        """Get a day of history for the energy entities and the suppression entity in a single recorder query.
+
+        Runs in the recorder executor, where the energy entity states are also parsed into samples.
+
+        Arguments:
+            start (datetime): The start of the day.
+            end (datetime): The end of the day.
+            energy_entities (list[str]): The generation and site export entities.
+            suppression_entity (str): The suppression entity, or an empty string.
+
+        Returns:
+            tuple(dict[str, EnergySamples], list[State]): Samples by energy entity, and the suppression entity states.
+        """
+        entities = list(dict.fromkeys([*energy_entities, suppression_entity] if suppression_entity else energy_entities))
+        history: dict[str, list[State]] = (
+            get_significant_states(
+                self.hass,
+                start,
+                end,
+                entities,
+                None,  # Filters
+                True,  # Include start time state
+                True,  # Significant changes only, i.e. state changes as for state_changes_during_period()
+                False,  # Minimal response
+                False,  # No attributes
+            )
+            if entities
+            else {}
+        )
+        return (
+            {entity: EnergySamples(history.get(entity, [])) for entity in energy_entities},
+            history.get(suppression_entity, []) if suppression_entity else [],
+        )
+
     async def get_pv_generation(self) -> None:  # noqa: C901
         """Get PV generation from external entity/entities.
 
@@ -2874,6 +2942,7 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
 
         _ON = ("on", "1", "true", "True")
         _ALL = ("on", "off", "1", "0", "true", "false", "True", "False")
+        _INTERVAL = 5  # The time window in minutes to detect export limiting
 
         # Load the generation history.
         generation: dict[dt, dict[str, Any]] = {generated[PERIOD_START]: generated for generated in self._data_generation[GENERATION]}
@@ -2881,61 +2950,71 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
 
         entity_registry = er.async_get(self.hass)
 
-        for day in range(days):
-            # PV generation
-            generation_intervals: dict[dt, float] = {
-                self.get_day_start_utc(future=(-1 * day)) - timedelta(days=1) + timedelta(minutes=minute): 0
-                for minute in range(0, 1440, 30)
-            }
-            for entity in self.options.generation_entities:
-                r_entity = entity_registry.async_get(entity)
-                if r_entity is None:
-                    _LOGGER.error("Generation entity %s is not a valid entity", entity)
-                    continue
-                if r_entity.disabled_by is not None:
-                    _LOGGER.error("Generation entity %s is disabled, please enable it", entity)
-                    continue
-                entity_history = await get_instance(self.hass).async_add_executor_job(
-                    state_changes_during_period,
-                    self.hass,
-                    self.get_day_start_utc(future=(-1 * day)) - timedelta(days=1),
-                    self.get_day_start_utc(future=(-1 * day)),
-                    entity,
+        generation_entities: list[str] = []
+        for entity in self.options.generation_entities:
+            r_entity = entity_registry.async_get(entity)
+            if r_entity is None:
+                _LOGGER.error("Generation entity %s is not a valid entity", entity)
+                continue
+            if r_entity.disabled_by is not None:
+                _LOGGER.error("Generation entity %s is disabled, please enable it", entity)
+                continue
+            generation_entities.append(entity)
+
+        # Identify intervals intentionally disabled by the user.
+        platforms = [PLATFORM_BINARY_SENSOR, PLATFORM_SENSOR, PLATFORM_SWITCH]
+        find_entity = self.advanced_options[ADVANCED_AUTOMATED_DAMPENING_SUPPRESSION_ENTITY]
+        suppression_entity = ""
+        for p in platforms:
+            entity = f"{p}.{find_entity}"
+            r_entity = entity_registry.async_get(entity)
+            if r_entity is not None and r_entity.disabled_by is None:
+                suppression_entity = entity
+                _LOGGER.debug("Suppression entity %s exists", suppression_entity)
+                break
+
+        # Detect site export limiting
+        export_entity = ""
+        if self.options.site_export_limit > 0 and self.options.site_export_entity != "":
+            export_entity = self.options.site_export_entity
+            r_entity = entity_registry.async_get(export_entity)
+            if r_entity is None:
+                _LOGGER.error("Site export entity %s is not a valid entity", export_entity)
+                export_entity = ""
+            elif r_entity.disabled_by is not None:
+                _LOGGER.error("Site export entity %s is disabled, please enable it", export_entity)
+                export_entity = ""
+        energy_entities = [*generation_entities, export_entity] if export_entity else generation_entities
+
+        # Query the recorder for all days concurrently, one query per day covering all entities.
+        day_starts = [self.get_day_start_utc(future=(-1 * day)) - timedelta(days=1) for day in range(days)]
+        recorder = get_instance(self.hass)
+        day_histories = await asyncio.gather(
+            *[
+                recorder.async_add_executor_job(
+                    self.__get_history_day, day_start, day_start + timedelta(days=1), energy_entities, suppression_entity
                 )
-                if entity_history.get(entity) and len(entity_history[entity]) > 4:
+                for day_start in day_starts
+            ]
+        )
+
+        for day, (day_start, (samples, suppression_history)) in enumerate(zip(day_starts, day_histories, strict=True)):
+            day_start_epoch = int(day_start.timestamp())
+            intervals: list[dt] = [day_start + timedelta(minutes=minute) for minute in range(0, 1440, 30)]
+
+            # PV generation
+            generation_intervals: list[float] = [0.0] * len(intervals)
+            for entity in generation_entities:
+                entity_samples = samples[entity]
+                if entity_samples.count > 4:
                     _LOGGER.debug("Retrieved day %d PV generation data from entity: %s", -1 + day * -1, entity)
 
                     # Get the conversion factor for the entity to convert to kWh.
-                    conversion_factor = self.__get_conversion_factor(entity, entity_history[entity], is_export=False)
-                    # Arrange the generation samples into half-hour intervals.
-                    sample_time: list[dt] = [
-                        e.last_updated.astimezone(datetime.UTC).replace(
-                            minute=e.last_updated.astimezone(datetime.UTC).minute // 30 * 30, second=0, microsecond=0
-                        )
-                        for e in entity_history[entity]
-                        if e.state.replace(".", "").isnumeric()
-                    ]
-                    # Build a list of generation delta values.
-                    sample_generation: list[float] = [
-                        0.0,
-                        *diff([float(e.state) * conversion_factor for e in entity_history[entity] if e.state.replace(".", "").isnumeric()]),
-                    ]
-                    sample_generation_time: list[dt] = [
-                        e.last_updated.astimezone(datetime.UTC) for e in entity_history[entity] if e.state.replace(".", "").isnumeric()
-                    ]
-                    sample_timedelta: list[int] = [
-                        0,
-                        *diff(
-                            [
-                                (
-                                    e.last_updated.astimezone(datetime.UTC)
-                                    - (self.get_day_start_utc(future=(-1 * day)) - timedelta(days=1))
-                                ).total_seconds()
-                                for e in entity_history[entity]
-                                if e.state.replace(".", "").isnumeric()
-                            ]
-                        ),
-                    ]
+                    conversion_factor = self.__get_conversion_factor(entity, entity_samples.unit, is_export=False)
+                    # Arrange the generation samples into half-hour intervals, and build lists of generation and time delta values.
+                    sample_interval = entity_samples.interval_indexes(day_start_epoch, 1800)
+                    sample_generation = entity_samples.deltas(conversion_factor)
+                    sample_timedelta = entity_samples.time_deltas()
 
                     # Detemine generation-consistent or time-consistent increments, and the inter-quartile upper bound for ignoring excessive jumps.
                     uniform_increment = False
@@ -2954,192 +3033,125 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
                     )
 
                     # Build generation values for each interval, ignoring any excessive jumps.
-                    ignored: dict[dt, bool] = {}
-                    last_interval: dt | None = None
-                    if (
-                        len(sample_time) == len(sample_generation)
-                        and len(sample_time) == len(sample_generation_time)
-                        and len(sample_time) == len(sample_timedelta)
+                    ignored: set[int] = set()
+                    last_interval: int | None = None
+                    for interval, kWh, report_epoch, time_delta in zip(
+                        sample_interval, sample_generation, entity_samples.epochs, sample_timedelta, strict=True
                     ):
-                        for interval, kWh, report_time, time_delta in zip(
-                            sample_time, sample_generation, sample_generation_time, sample_timedelta, strict=True
-                        ):
-                            if interval != last_interval:
-                                # Only check the first sample of each interval for an excessive jump
-                                last_interval = interval
-                                if uniform_increment:
-                                    if round(kWh, 4) > upper:  # Ignore excessive jumps.
-                                        ignored[interval] = True
-                                    else:
-                                        generation_intervals[interval] += kWh
-                                elif time_delta > upper and kWh > 0.0003:  # Ignore excessive jumps.
-                                    if kWh <= 0.14:  # Small increments are probably valid
-                                        generation_intervals[interval] += kWh
-                                    else:
-                                        ignored[interval] = True
+                        if not 0 <= interval < len(intervals):
+                            continue
+                        if interval != last_interval:
+                            # Only check the first sample of each interval for an excessive jump
+                            last_interval = interval
+                            if uniform_increment:
+                                if round(kWh, 4) > upper:  # Ignore excessive jumps.
+                                    ignored.add(interval)
                                 else:
                                     generation_intervals[interval] += kWh
-                                if ignored.get(interval):
-                                    # Invalidate both this interval and the previous one because errant sample straddles the half-hour boundary.
-                                    ignored[interval - timedelta(minutes=30)] = True
-                                    _LOGGER.debug(
-                                        "Ignoring excessive PV generation jump of %.3f kWh, time delta %d seconds, at %s from entity: %s; Invalidating intervals %s and %s",
-                                        kWh,
-                                        time_delta,
-                                        report_time.astimezone(self._tz).strftime("%Y-%m-%d %H:%M:%S"),
-                                        entity,
-                                        (interval - timedelta(minutes=30)).astimezone(self._tz).strftime("%H:%M"),
-                                        interval.astimezone(self._tz).strftime("%H:%M"),
-                                    )
+                            elif time_delta > upper and kWh > 0.0003:  # Ignore excessive jumps.
+                                if kWh <= 0.14:  # Small increments are probably valid
+                                    generation_intervals[interval] += kWh
+                                else:
+                                    ignored.add(interval)
                             else:
                                 generation_intervals[interval] += kWh
-                        for interval in ignored:
-                            generation_intervals[interval] = 0.0
+                            if interval in ignored:
+                                # Invalidate both this interval and the previous one because errant sample straddles the half-hour boundary.
+                                if interval > 0:
+                                    ignored.add(interval - 1)
+                                _LOGGER.debug(
+                                    "Ignoring excessive PV generation jump of %.3f kWh, time delta %d seconds, at %s from entity: %s; Invalidating intervals %s and %s",
+                                    kWh,
+                                    time_delta,
+                                    dt.fromtimestamp(report_epoch, self._tz).strftime("%Y-%m-%d %H:%M:%S"),
+                                    entity,
+                                    (intervals[interval] - timedelta(minutes=30)).astimezone(self._tz).strftime("%H:%M"),
+                                    intervals[interval].astimezone(self._tz).strftime("%H:%M"),
+                                )
+                        else:
+                            generation_intervals[interval] += kWh
+                    for interval in ignored:
+                        generation_intervals[interval] = 0.0
                 else:
                     _LOGGER.debug(
-                        "No day %d PV generation data (or barely any) from entity: %s (%s)",
+                        "No day %d PV generation data (or barely any) from entity: %s (%d states)",
                         -1 + day * -1,
                         entity,
-                        entity_history.get(entity),
+                        entity_samples.count,
                     )
-            for i, gen in generation_intervals.items():
-                generation_intervals[i] = round(gen, 3)
+            generation_intervals = [round(gen, 3) for gen in generation_intervals]
 
-            export_limiting: dict[dt, bool] = {
-                self.get_day_start_utc(future=(-1 * day)) - timedelta(days=1) + timedelta(minutes=minute): False
-                for minute in range(0, 1440, 30)
-            }
-
-            # Identify intervals intentionally disabled by the user.
-            platforms = [PLATFORM_BINARY_SENSOR, PLATFORM_SENSOR, PLATFORM_SWITCH]
-            find_entity = self.advanced_options[ADVANCED_AUTOMATED_DAMPENING_SUPPRESSION_ENTITY]
-            entity = ""
-            found = False
-            for p in platforms:
-                entity = f"{p}.{find_entity}"
-                r_entity = entity_registry.async_get(entity)
-                if r_entity is not None and r_entity.disabled_by is None:
-                    found = True
-                    break
-            if found:
-                _LOGGER.debug("Suppression entity %s exists", entity)
-                query_start_time = self.get_day_start_utc(future=(-1 * day)) - timedelta(days=1)
-                query_end_time = self.get_day_start_utc(future=(-1 * day))
-
-                # Get state changes during the period
-                entity_history = await get_instance(self.hass).async_add_executor_job(
-                    state_changes_during_period,
-                    self.hass,
-                    query_start_time,
-                    query_end_time,
-                    entity,
-                    True,  # No attributes
-                    False,  # Descending order
-                    None,  # Limit
-                    True,  # Include start time state
-                )
+            export_limiting: dict[dt, bool] = dict.fromkeys(intervals, False)
 
-                if entity_history.get(entity) and len(entity_history[entity]):
-                    entity_state: dict[dt, bool] = {}
-                    state = False
+            if suppression_history:
+                entity_state: dict[dt, bool] = {}
+                state = False
 
-                    for e in entity_history[entity]:
-                        if e.state not in _ALL:
-                            continue
-                        interval = e.last_updated.astimezone(datetime.UTC).replace(
-                            minute=e.last_updated.astimezone(datetime.UTC).minute // 30 * 30, second=0, microsecond=0
-                        )
-                        if e.state in _ON:
-                            state = True
-                            if not entity_state.get(interval):
-                                entity_state[interval] = state
-                                if state and entity_state.get(interval + timedelta(minutes=30)) is not None:
-                                    entity_state.pop(interval + timedelta(minutes=30))
-                            _LOGGER.debug(
-                                "Interval %s state change %s at %s",
-                                interval.astimezone(self._tz).strftime("%Y-%m-%d %H:%M"),
-                                entity_state[interval],
-                                e.last_updated.astimezone(self._tz).strftime("%Y-%m-%d %H:%M"),
-                            )
-                        elif state:
-                            state = False
-                            entity_state[interval + timedelta(minutes=30)] = False
-                            _LOGGER.debug(
-                                "Interval %s state change %s at %s",
-                                (interval + timedelta(minutes=30)).astimezone(self._tz).strftime("%Y-%m-%d %H:%M"),
-                                entity_state[interval + timedelta(minutes=30)],
-                                e.last_updated.astimezone(self._tz).strftime("%Y-%m-%d %H:%M"),
-                            )
-                    state = False
-                    for interval in export_limiting:
-                        if entity_state.get(interval) is not None:
-                            state = entity_state[interval]
-                        export_limiting[interval] = state
-                        if state:
-                            _LOGGER.debug(
-                                "Auto-dampen suppressed for interval %s", interval.astimezone(self._tz).strftime("%Y-%m-%d %H:%M")
-                            )
-
-            # Detect site export limiting
-            if self.options.site_export_limit > 0 and self.options.site_export_entity != "":
-                _INTERVAL = 5  # The time window in minutes to detect export limiting
-
-                entity = self.options.site_export_entity
-                r_entity = entity_registry.async_get(entity)
-                if r_entity is None:
-                    _LOGGER.error("Site export entity %s is not a valid entity", entity)
-                    entity = ""
-                elif r_entity.disabled_by is not None:
-                    _LOGGER.error("Site export entity %s is disabled, please enable it", entity)
-                    entity = ""
-                export_intervals: dict[dt, float] = {
-                    self.get_day_start_utc(future=(-1 * day)) - timedelta(days=1) + timedelta(minutes=minute): 0
-                    for minute in range(0, 1440, _INTERVAL)
-                }
-                if entity:
-                    entity_history = await get_instance(self.hass).async_add_executor_job(
-                        state_changes_during_period,
-                        self.hass,
-                        self.get_day_start_utc(future=(-1 * day)) - timedelta(days=1),
-                        self.get_day_start_utc(future=(-1 * day)),
-                        entity,
+                for e in suppression_history:
+                    if e.state not in _ALL:
+                        continue
+                    interval = e.last_updated.astimezone(datetime.UTC).replace(
+                        minute=e.last_updated.astimezone(datetime.UTC).minute // 30 * 30, second=0, microsecond=0
                     )
-                    if entity_history.get(entity) and len(entity_history[entity]):
-                        # Get the conversion factor for the entity to convert to kWh.
-                        conversion_factor = self.__get_conversion_factor(entity, entity_history[entity], is_export=False)
-                        # Arrange the site export samples into intervals.
-                        sample_time: list[dt] = [
-                            e.last_updated.astimezone(datetime.UTC).replace(
-                                minute=e.last_updated.astimezone(datetime.UTC).minute // _INTERVAL * _INTERVAL, second=0, microsecond=0
-                            )
-                            for e in entity_history[entity]
-                            if e.state.replace(".", "").isnumeric()
-                        ]
-                        # Build a list of export delta values.
-                        sample_export: list[float] = [
-                            0.0,
-                            *diff(
-                                [float(e.state) * conversion_factor for e in entity_history[entity] if e.state.replace(".", "").isnumeric()]
-                            ),
-                        ]
-                        for interval, kWh in zip(sample_time, sample_export, strict=True):
+                    if e.state in _ON:
+                        state = True
+                        if not entity_state.get(interval):
+                            entity_state[interval] = state
+                            if state and entity_state.get(interval + timedelta(minutes=30)) is not None:
+                                entity_state.pop(interval + timedelta(minutes=30))
+                        _LOGGER.debug(
+                            "Interval %s state change %s at %s",
+                            interval.astimezone(self._tz).strftime("%Y-%m-%d %H:%M"),
+                            entity_state[interval],
+                            e.last_updated.astimezone(self._tz).strftime("%Y-%m-%d %H:%M"),
+                        )
+                    elif state:
+                        state = False
+                        entity_state[interval + timedelta(minutes=30)] = False
+                        _LOGGER.debug(
+                            "Interval %s state change %s at %s",
+                            (interval + timedelta(minutes=30)).astimezone(self._tz).strftime("%Y-%m-%d %H:%M"),
+                            entity_state[interval + timedelta(minutes=30)],
+                            e.last_updated.astimezone(self._tz).strftime("%Y-%m-%d %H:%M"),
+                        )
+                state = False
+                for interval in export_limiting:
+                    if entity_state.get(interval) is not None:
+                        state = entity_state[interval]
+                    export_limiting[interval] = state
+                    if state:
+                        _LOGGER.debug("Auto-dampen suppressed for interval %s", interval.astimezone(self._tz).strftime("%Y-%m-%d %H:%M"))
+
+            if export_entity:
+                entity_samples = samples[export_entity]
+                if entity_samples.count:
+                    # Get the conversion factor for the entity to convert to kWh.
+                    conversion_factor = self.__get_conversion_factor(export_entity, entity_samples.unit, is_export=False)
+                    # Arrange the site export deltas into intervals.
+                    export_intervals: list[float] = [0.0] * (1440 // _INTERVAL)
+                    for interval, kWh in zip(
+                        entity_samples.interval_indexes(day_start_epoch, _INTERVAL * 60),
+                        entity_samples.deltas(conversion_factor),
+                        strict=True,
+                    ):
+                        if 0 <= interval < len(export_intervals):
                             export_intervals[interval] += kWh
-                        # Convert to export per interval in kW.
-                        for i, export in export_intervals.items():
-                            export_intervals[i] = round(export * (60 / _INTERVAL), 3)
-
-                        for i, export in export_intervals.items():
-                            export_interval = i.replace(minute=i.minute // 30 * 30)
-                            if export >= self.options.site_export_limit and generation_intervals[export_interval] > 0:
-                                export_limiting[export_interval] = True
-                    else:
-                        _LOGGER.debug("No site export history found for %s", entity)
+                    # Convert to export per interval in kW.
+                    for interval, export in enumerate(export_intervals):
+                        generation_interval = interval * _INTERVAL // 30
+                        if (
+                            round(export * (60 / _INTERVAL), 3) >= self.options.site_export_limit
+                            and generation_intervals[generation_interval] > 0
+                        ):
+                            export_limiting[intervals[generation_interval]] = True
+                else:
+                    _LOGGER.debug("No site export history found for %s", export_entity)
 
             # Add recent generation intervals to the history.
             generation.update(
                 {
                     i: {PERIOD_START: i, GENERATION: generated, EXPORT_LIMITING: export_limiting[i]}
-                    for i, generated in generation_intervals.items()
+                    for i, generated in zip(intervals, generation_intervals, strict=True)
                 }
             )
 
@@ -4508,6 +4520,7 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
             self._data_actuals_dampened, commencing, actuals_dampened, self._sites_actual_hard_limit, dampened=True
         )
         _LOGGER.debug("Task build_data_actuals took %.3f seconds", time.time() - start_time)
+        self.__index_forecasts()
         self._data_energy_dashboard = self.__make_energy_dict()
 
         return build_success
@@ -4651,12 +4664,43 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
                 self._sites_hard_limit_undampened,
             )
         _LOGGER.debug("Task build_data took %.3f seconds", time.time() - start_time)
+        self.__index_forecasts()
         self._data_energy_dashboard = self.__make_energy_dict()
 
         await self.check_data_records()
         await self.recalculate_splines()
         return build_success
 
+    def __index_forecasts(self) -> None:
+        """Build columnar indexes for the forecast and estimated actual lists used by sensors and services."""
+        lists = [
+            self._data_forecasts,
+            self._data_forecasts_undampened,
+            self._data_estimated_actuals,
+            self._data_estimated_actuals_dampened,
+            *self._site_data_forecasts.values(),
+            *self._site_data_forecasts_undampened.values(),
+        ]
+        indexed: dict[int, ForecastColumns] = {}
+        for data in lists:
+            columns = self.__get_columns(data)
+            indexed[id(data)] = columns if columns is not None else ForecastColumns(data)
+        self._forecast_columns = indexed
+
+    def __get_columns(self, data: list[dict[str, Any]]) -> ForecastColumns | None:
+        """Return the columnar index of a list, or None if the list is not indexed or has changed since.
+
+        Arguments:
+            data (list): The data structure, either actual or forecast total data or site breakdown data.
+
+        Returns:
+            ForecastColumns | None: The index of the list.
+        """
+        columns = self._forecast_columns.get(id(data))
+        if columns is not None and columns.data is data and len(columns.epochs) == len(data):
+            return columns
+        return None
+
     def __calc_forecast_start_index(self, data: list[dict[str, Any]]) -> int:
         """Get the start of forecasts as-at just before midnight.
 
@@ -4671,6 +4715,8 @@ class SolcastApi:  # pylint: disable=too-many-public-methods
         """
         index = 0
         midnight_utc = self.get_day_start_utc()
+        if (columns := self.__get_columns(data)) is not None:
+            return columns.start_index(midnight_utc)
         for index in range(len(data) - 1, -1, -1):
             if data[index][PERIOD_START] < midnight_utc:
                 break
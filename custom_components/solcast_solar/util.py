@@ -2,17 +2,22 @@
 
 # pylint: disable=consider-using-enumerate
 
+from array import array
+from bisect import bisect_left, bisect_right
 from collections.abc import Iterator
+import copy
 from dataclasses import dataclass
 from datetime import datetime as dt
 from enum import Enum
+from itertools import groupby
 import json
 import logging
 import math
 import re
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import IntegrationError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -28,6 +33,7 @@ from .const import (
     LEARN_MORE_ADVANCED,
     NEW_OPTION,
     OPTION,
+    PERIOD_START,
     PRIOR_CRASH_EXCEPTION,
     PRIOR_CRASH_PLACEHOLDERS,
     PRIOR_CRASH_TRANSLATION_KEY,
@@ -35,6 +41,11 @@ from .const import (
     STOPS_WORKING,
 )
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 if TYPE_CHECKING:
     from . import coordinator
 
@@ -139,6 +150,112 @@ class DateTimeEncoder(json.JSONEncoder):
         return o.isoformat() if isinstance(o, dt) else super().default(o)
 
 
+def encode_datetime(o: Any) -> str:
+    """Convert datetime values to ISO format for json.dumps(default=...)."""
+    if isinstance(o, dt):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class CacheSerialiser:
+    """Incremental serialiser for the forecast, estimated actual and generation cache files.
+
+    The files keep the same JSON content as json.dumps(data, cls=DateTimeEncoder). Lists of intervals are split
+    into per-day segments, and the encoded JSON of each segment is kept with its content. A save only encodes the
+    days that changed since the previous save of the file, and a file whose content is unchanged is not written at
+    all. Content is compared with the type of each value, as values comparing equal may encode differently (0 and
+    0.0).
+
+    Segment content is snapshotted on the event loop, which is cheap compared to encoding, so that encoding and
+    assembly can run in the executor without the data changing underneath.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the serialiser."""
+        # filename -> {(path, day, occurrence): (content hash, content, JSON)}
+        self._segments: dict[str, dict[tuple[Any, ...], tuple[int, tuple[Any, ...], str]]] = {}
+        self._payload_hash: dict[str, int] = {}
+
+    def snapshot(self, filename: str, data: dict[str, Any]) -> tuple[Any, ...]:
+        """Take a snapshot of data for encoding, run on the event loop.
+
+        Arguments:
+            filename (str): The cache file the data is saved to.
+            data (dict): The data to save.
+
+        Returns:
+            tuple: An immutable description of the data, referring to cached segments where possible.
+        """
+        return self.__snapshot(self._segments.get(filename, {}), data, ())
+
+    def __snapshot(
+        self, cached: dict[tuple[Any, ...], tuple[int, tuple[Any, ...], str]], value: Any, path: tuple[Any, ...]
+    ) -> tuple[Any, ...]:
+        if isinstance(value, dict):
+            return ("dict", tuple((key, self.__snapshot(cached, item, (*path, key))) for key, item in value.items()))
+        if isinstance(value, list) and value and isinstance(value[0], dict) and PERIOD_START in value[0]:
+            segments: list[tuple[Any, ...]] = []
+            occurrences: dict[Any, int] = {}
+            for day, intervals in groupby(value, key=lambda interval: interval[PERIOD_START].date()):
+                content = tuple(tuple((name, type(item), item) for name, item in interval.items()) for interval in intervals)
+                key = (path, day, occurrences.get(day, 0))
+                occurrences[day] = key[2] + 1
+                try:
+                    content_hash = hash(content)
+                except TypeError:  # Not plain intervals, so not segmented.
+                    return ("value", copy.deepcopy(value))
+                extant = cached.get(key)
+                if extant is not None and extant[0] == content_hash and extant[1] == content:
+                    segments.append((key, content_hash, content, extant[2]))
+                else:
+                    segments.append((key, content_hash, content, None))
+            return ("segments", tuple(segments))
+        return ("value", copy.deepcopy(value))
+
+    @staticmethod
+    def encode(snapshot: tuple[Any, ...]) -> tuple[str, dict[tuple[Any, ...], tuple[int, tuple[Any, ...], str]]]:
+        """Encode a snapshot, run in the executor.
+
+        Returns:
+            tuple: The JSON payload, and the encoded segments.
+        """
+        segments: dict[tuple[Any, ...], tuple[int, tuple[Any, ...], str]] = {}
+
+        def render(item: tuple[Any, ...]) -> str:
+            kind, content = item
+            if kind == "dict":
+                return "{" + ", ".join(f"{json.dumps(key, ensure_ascii=False)}: {render(value)}" for key, value in content) + "}"
+            if kind == "segments":
+                parts: list[str] = []
+                for key, content_hash, intervals, segment in content:
+                    if segment is None:
+                        segment = json.dumps(
+                            [{name: item for name, _, item in interval} for interval in intervals],
+                            ensure_ascii=False,
+                            default=encode_datetime,
+                        )[1:-1]
+                    segments[key] = (content_hash, intervals, segment)
+                    parts.append(segment)
+                return "[" + ", ".join(parts) + "]"
+            return json.dumps(content, ensure_ascii=False, default=encode_datetime)
+
+        return render(snapshot), segments
+
+    def is_unchanged(self, filename: str, payload: str) -> bool:
+        """Return whether payload is what was last saved to filename."""
+        return self._payload_hash.get(filename) == hash(payload)
+
+    def saved(self, filename: str, payload: str, segments: dict[tuple[Any, ...], tuple[int, tuple[Any, ...], str]]) -> None:
+        """Record a successful save, dropping segments no longer present."""
+        self._segments[filename] = segments
+        self._payload_hash[filename] = hash(payload)
+
+    def forget(self, filename: str) -> None:
+        """Forget what was saved to filename, e.g. after the file was deleted."""
+        self._segments.pop(filename, None)
+        self._payload_hash.pop(filename, None)
+
+
 class NoIndentEncoder(json.JSONEncoder):
     """Helper to output semi-indented json."""
 
@@ -179,6 +296,105 @@ class JSONDecoder(json.JSONDecoder):
         return result
 
 
+class ForecastColumns:
+    """Columnar view of a sorted list of forecast intervals.
+
+    Holds epoch seconds of each period start, and a float array per forecast confidence, so that interval ranges
+    are found by binary search and sums and peaks are calculated over array slices instead of per-interval dicts.
+    The list of dicts that the columns were built from is kept, and remains the data that is cached to disk.
+    """
+
+    def __init__(self, data: list[dict[str, Any]]) -> None:
+        """Build the columns.
+
+        Arguments:
+            data (list): Intervals sorted by period start, each having the same forecast confidences.
+        """
+        self.data = data
+        self.epochs = array("q", [int(interval[PERIOD_START].timestamp()) for interval in data])
+        self.columns: dict[str, array] = {}
+        for estimate in (ESTIMATE, ESTIMATE10, ESTIMATE90):
+            if data and estimate in data[0]:
+                self.columns[estimate] = array("d", [interval[estimate] for interval in data])
+
+    def start_index(self, midnight_utc: dt) -> int:
+        """Return the index of the last interval before midnight, or zero."""
+        return max(0, bisect_left(self.epochs, midnight_utc.timestamp()) - 1)
+
+    def slice(self, start_utc: dt, end_utc: dt, search_from: int = 0) -> tuple[int, int]:
+        """Return start and end indexes of the intervals overlapping a period.
+
+        Arguments:
+            start_utc (datetime): Start of the period.
+            end_utc (datetime): End of the period.
+            search_from (int): The first index to consider.
+
+        Returns:
+            tuple(int, int): Start and end index, or (0, 0) if no interval overlaps.
+        """
+        end_index = bisect_left(self.epochs, end_utc.timestamp(), search_from)
+        start_index = bisect_right(self.epochs, start_utc.timestamp() - 1800, search_from, end_index)
+        if start_index >= end_index:
+            return 0, 0
+        return start_index, end_index
+
+    def first_after(self, when_utc: dt, start_index: int, end_index: int) -> int:
+        """Return the first index of an index range with a period start after a time, or end_index."""
+        return bisect_right(self.epochs, when_utc.timestamp(), start_index, end_index)
+
+    def sum(self, forecast_confidence: str, start_index: int, end_index: int) -> float:
+        """Return the sum of a forecast confidence over an index range."""
+        return sum(self.columns[forecast_confidence][start_index:end_index])
+
+    def peak_index(self, forecast_confidence: str, start_index: int, end_index: int) -> int:
+        """Return the index of the first largest value of a forecast confidence over an index range."""
+        values = self.columns[forecast_confidence][start_index:end_index]
+        return start_index + values.index(max(values))
+
+
+class EnergySamples:
+    """Numeric samples of an energy entity parsed from its recorder state history.
+
+    The states are walked once, dropping non-numeric states and converting each last updated time to epoch seconds,
+    so that intervals and time deltas are derived with integer arithmetic instead of per-sample datetime conversion.
+    """
+
+    __slots__ = ("count", "epochs", "unit", "values")
+
+    def __init__(self, states: list[State]) -> None:
+        """Parse the states.
+
+        Arguments:
+            states (list): The state history of the entity, oldest first.
+        """
+        self.count = len(states)
+        self.epochs = array("d")
+        self.values = array("d")
+        for state in states:
+            if state.state.replace(".", "").isnumeric():
+                self.epochs.append(state.last_updated.timestamp())
+                self.values.append(float(state.state))
+        self.unit: str | None = None
+        if states and states[-1].attributes:
+            self.unit = states[-1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+
+    def __len__(self) -> int:
+        """Return the number of numeric samples."""
+        return len(self.epochs)
+
+    def interval_indexes(self, start_epoch: int, period: int) -> list[int]:
+        """Return the index of the interval containing each sample, for intervals of period seconds from start_epoch."""
+        return [(int(epoch) - start_epoch) // period for epoch in self.epochs]
+
+    def time_deltas(self) -> list[float]:
+        """Return the seconds elapsed since the previous sample, the first being zero."""
+        return [0, *diff(self.epochs)]
+
+    def deltas(self, conversion_factor: float) -> list[float]:
+        """Return the energy increase since the previous sample in kWh, the first being zero."""
+        return [0.0, *diff([value * conversion_factor for value in self.values])]
+
+
 def http_status_translate(status: int) -> str | Any:
     """Translate HTTP status code to a human-readable translation."""
 
@@ -370,92 +586,117 @@ def diff(lst: list[Any], non_negative: bool = True) -> list[Any]:
     return r
 
 
-def cubic_interp(x0: list[Any], x: list[Any], y: list[Any]) -> list[Any]:
-    """Build a cubic spline.
-
-    Arguments:
-        x0 (list): List of numbers to interpolate at
-        x (list): List of numbers in increasing order
-        y (list): List of floats to interpolate
-
-    Returns:
-        list: Array of interpolated values.
-
-    """
-
-    def clip(lst: list[Any], min_val: float, max_val: float, in_place: bool = False) -> list[Any]:  # numpy-like clip
-        if not in_place:
-            lst = lst[:]
-        for i in range(len(lst)):
-            if lst[i] < min_val:
-                lst[i] = min_val
-            elif lst[i] > max_val:
-                lst[i] = max_val
-        return lst
-
-    def search_sorted(list_to_insert: list[Any], insert_into: list[Any]) -> list[Any]:  # numpy-like search_sorted
-        def float_search_sorted(float_to_insert: Any, insert_into: list[Any]) -> int:
-            for i in range(len(insert_into)):
-                if float_to_insert <= insert_into[i]:
-                    return i
-            return len(insert_into)
-
-        return [float_search_sorted(i, insert_into) for i in list_to_insert]
-
-    def subtract(a: float, b: float) -> float:
-        return a - b
-
-    size: int = len(x)
-    x_diff: list[Any] = diff(x, non_negative=False)
-    y_diff: list[Any] = diff(y, non_negative=False)
+def _spline_factors(x_diff: list[Any]) -> tuple[list[float], list[float]]:
+    """Factor the natural cubic spline system, which only depends on the x intervals."""
 
+    size: int = len(x_diff) + 1
     li: list[Any] = [0] * size
     li_1: list[Any] = [0] * (size - 1)
-    z: list[Any] = [0] * (size)
 
     li[0] = math.sqrt(2 * x_diff[0])
     li_1[0] = 0.0
-    b0: float = 0.0
-    z[0] = b0 / li[0]
-
-    bi: float = 0.0
 
     for i in range(1, size - 1, 1):
         li_1[i] = x_diff[i - 1] / li[i - 1]
         li[i] = math.sqrt(2 * (x_diff[i - 1] + x_diff[i]) - li_1[i - 1] * li_1[i - 1])
-        bi = 6 * (y_diff[i] / x_diff[i] - y_diff[i - 1] / x_diff[i - 1])
-        z[i] = (bi - li_1[i - 1] * z[i - 1]) / li[i]
 
     i = size - 1
     li_1[i - 1] = x_diff[-1] / li[i - 1]
     li[i] = math.sqrt(2 * x_diff[-1] - li_1[i - 1] * li_1[i - 1])
-    bi = 0.0
-    z[i] = (bi - li_1[i - 1] * z[i - 1]) / li[i]
+    return li, li_1
+
+
+def _spline_z(x_diff: list[Any], li: list[float], li_1: list[float], y_diff: Any, z: Any) -> Any:
+    """Solve the factored system for the second derivatives.
+
+    Works on floats, or on numpy arrays of one value per curve so that all curves are solved in one pass.
+    """
+
+    size: int = len(li)
+    for i in range(1, size - 1, 1):
+        bi = 6 * (y_diff[i] / x_diff[i] - y_diff[i - 1] / x_diff[i - 1])
+        z[i] = (bi - li_1[i - 1] * z[i - 1]) / li[i]
 
     i = size - 1
+    z[i] = (0.0 - li_1[i - 1] * z[i - 1]) / li[i]
     z[i] = z[i] / li[i]
     for i in range(size - 2, -1, -1):
         z[i] = (z[i] - li_1[i - 1] * z[i + 1]) / li[i]
+    return z
 
-    index = search_sorted(x0, x)
-    index = clip(index, 1, size - 1)
 
-    xi1: list[Any] = [x[num] for num in index]
-    xi0: list[Any] = [x[num - 1] for num in index]
-    yi1: list[Any] = [y[num] for num in index]
-    yi0: list[Any] = [y[num - 1] for num in index]
-    zi1: list[Any] = [z[num] for num in index]
-    zi0: list[Any] = [z[num - 1] for num in index]
-    hi1 = list(map(subtract, xi1, xi0))
-
-    f0: list[Any] = [0] * len(hi1)
-    for j in range(len(f0)):
-        f0[j] = round(
-            zi0[j] / (6 * hi1[j]) * (xi1[j] - x0[j]) ** 3
-            + zi1[j] / (6 * hi1[j]) * (x0[j] - xi0[j]) ** 3
-            + (yi1[j] / hi1[j] - zi1[j] * hi1[j] / 6) * (x0[j] - xi0[j])
-            + (yi0[j] / hi1[j] - zi0[j] * hi1[j] / 6) * (xi1[j] - x0[j]),
-            4,
+def cubic_interp(x0: list[Any], x: list[Any], y: list[Any]) -> list[Any]:
+    """Build a cubic spline.
+
+    Arguments:
+        x0 (list): List of numbers to interpolate at
+        x (list): List of numbers in increasing order
+        y (list): List of floats to interpolate
+
+    Returns:
+        list: Array of interpolated values.
+
+    """
+
+    return cubic_interp_batch(x0, x, [y])[0]
+
+
+def cubic_interp_batch(x0: list[Any], x: list[Any], ys: list[list[Any]]) -> list[list[Any]]:
+    """Build cubic splines for several curves sharing the same x values.
+
+    The spline system is factored once for all curves. When numpy is available the curves are solved and
+    evaluated together as arrays, otherwise in pure Python.
+
+    Arguments:
+        x0 (list): List of numbers to interpolate at
+        x (list): List of numbers in increasing order
+        ys (list): Lists of floats to interpolate, one per curve
+
+    Returns:
+        list: Interpolated values for each curve.
+
+    """
+
+    size: int = len(x)
+    x_diff: list[Any] = diff(x, non_negative=False)
+    li, li_1 = _spline_factors(x_diff)
+
+    if np is not None:
+        y_arr = np.array(ys, dtype=float).T  # One row per x, one column per curve.
+        z_arr = _spline_z(x_diff, li, li_1, np.diff(y_arr, axis=0), np.zeros_like(y_arr))
+
+        x_arr = np.array(x, dtype=float)
+        x0_arr = np.array(x0, dtype=float)[:, None]
+        idx = np.clip(np.searchsorted(x_arr, x0_arr[:, 0]), 1, size - 1)
+        xi1_arr, xi0_arr = x_arr[idx][:, None], x_arr[idx - 1][:, None]
+        hi1_arr = xi1_arr - xi0_arr
+        yi1, yi0, zi1, zi0 = y_arr[idx], y_arr[idx - 1], z_arr[idx], z_arr[idx - 1]
+        f0 = (
+            zi0 / (6 * hi1_arr) * (xi1_arr - x0_arr) ** 3
+            + zi1 / (6 * hi1_arr) * (x0_arr - xi0_arr) ** 3
+            + (yi1 / hi1_arr - zi1 * hi1_arr / 6) * (x0_arr - xi0_arr)
+            + (yi0 / hi1_arr - zi0 * hi1_arr / 6) * (xi1_arr - x0_arr)
         )
+        return np.round(f0, 4).T.tolist()
 
-    return f0
+    # Search sorted, clipped to 1..size - 1.
+    index = [min(max(bisect_left(x, value), 1), size - 1) for value in x0]
+    xi1: list[Any] = [x[num] for num in index]
+    xi0: list[Any] = [x[num - 1] for num in index]
+    hi1: list[Any] = [b - a for a, b in zip(xi0, xi1, strict=True)]
+
+    results: list[list[Any]] = []
+    for y in ys:
+        z = _spline_z(x_diff, li, li_1, diff(y, non_negative=False), [0.0] * size)
+        f0: list[Any] = [0] * len(x0)
+        for j in range(len(f0)):
+            i1 = index[j]
+            f0[j] = round(
+                z[i1 - 1] / (6 * hi1[j]) * (xi1[j] - x0[j]) ** 3
+                + z[i1] / (6 * hi1[j]) * (x0[j] - xi0[j]) ** 3
+                + (y[i1] / hi1[j] - z[i1] * hi1[j] / 6) * (x0[j] - xi0[j])
+                + (y[i1 - 1] / hi1[j] - z[i1 - 1] * hi1[j] / 6) * (xi1[j] - x0[j]),
+                4,
+            )
+        results.append(f0)
+    return results
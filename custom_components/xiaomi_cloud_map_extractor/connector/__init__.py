@@ -109,9 +109,10 @@ class XiaomiCloudMapExtractorConnector:
         _LOGGER.debug("Downloaded map.")
         if map_data is None:
             raise FailedMapDownloadException()
+        if map_data is not self._map_cache.map_data or self._map_cache.map_image is None:
+            self._map_cache.map_image = to_image(map_data)
         self._map_cache.map_data = map_data
         self._map_cache.map_saved = map_saved
-        self._map_cache.map_image = to_image(map_data)
         self._map_cache.map_data_raw = map_raw_data
 
     def _is_authenticated(self: Self) -> bool:
@@ -0,0 +1,144 @@
+import copy
+from typing import Any, Self
+
+from vacuum_map_parser_base.config.drawable import Drawable
+from vacuum_map_parser_base.image_generator import ImageGenerator
+from vacuum_map_parser_base.map_data import MapData
+from vacuum_map_parser_base.map_data_parser import MapDataParser
+
+from .model import VacuumConfig
+
+# Drawables that don't change while the vacuum is cleaning, with the ImageGenerator methods drawing them
+STATIC_DRAWABLES: dict[Drawable, str] = {
+    Drawable.CHARGER: "_draw_charger",
+    Drawable.OBSTACLES: "_draw_obstacles",
+    Drawable.IGNORED_OBSTACLES: "_draw_ignored_obstacles",
+    Drawable.OBSTACLES_WITH_PHOTO: "_draw_obstacles_with_photo",
+    Drawable.IGNORED_OBSTACLES_WITH_PHOTO: "_draw_ignored_obstacles_with_photo",
+    Drawable.NO_CARPET_AREAS: "_draw_no_carpet_areas",
+    Drawable.NO_GO_AREAS: "_draw_no_go_areas",
+    Drawable.NO_MOPPING_AREAS: "_draw_no_mopping_areas",
+    Drawable.VIRTUAL_WALLS: "_draw_walls",
+    Drawable.ZONES: "_draw_zones",
+    Drawable.ROOM_NAMES: "_draw_room_names",
+}
+# CLEANED_AREA is drawn by _draw_layer
+DYNAMIC_DRAWABLES: dict[Drawable, str | None] = {
+    Drawable.VACUUM_POSITION: "_draw_vacuum_position",
+    Drawable.MOP_PATH: "_draw_mop_path",
+    Drawable.PATH: "_draw_vacuum_path",
+    Drawable.GOTO_PATH: "_draw_goto_path",
+    Drawable.PREDICTED_PATH: "_draw_predicted_path",
+    Drawable.CLEANED_AREA: None,
+}
+# MapData attributes the static drawables are drawn from
+STATIC_MAP_ATTRIBUTES = (
+    "charger",
+    "obstacles",
+    "ignored_obstacles",
+    "obstacles_with_photo",
+    "ignored_obstacles_with_photo",
+    "no_carpet_areas",
+    "no_go_areas",
+    "no_mopping_areas",
+    "walls",
+    "zones",
+    "rooms",
+)
+
+
+class CachingImageParser:
+    """
+    Wraps the image parser of a vendor, reusing the last parsed image while the raw image is unchanged. Only for
+    parsers taking plain values (bytes, numbers, sets and lists of numbers).
+    """
+
+    def __init__(self: Self, image_parser: Any) -> None:
+        self._image_parser = image_parser
+        self._key: tuple[Any, ...] | None = None
+        self._result: tuple[Any, dict] | None = None
+
+    def parse(self: Self, *args: Any) -> tuple[Any, dict]:
+        key = tuple(
+            frozenset(arg) if isinstance(arg, set) else tuple(arg) if isinstance(arg, list) else arg
+            for arg in args
+        )
+        if self._result is None or key != self._key:
+            self._key = None
+            self._result = self._image_parser.parse(*args)
+            self._key = key
+        image, rooms = self._result
+        # The map is drawn on the returned image
+        return (image.copy() if image is not None else None), dict(rooms)
+
+    def __getattr__(self: Self, name: str) -> Any:
+        return getattr(self._image_parser, name)
+
+
+class CachingImageGenerator(ImageGenerator):
+    """
+    Keeps the map image with the leading static drawables (charger, walls, zones, obstacles, room names...) drawn, as
+    long as the base image and those elements are unchanged. A new frame only draws the remaining drawables (paths,
+    vacuum position) on a copy of it. Drawables after the first dynamic one are drawn in their configured order, so
+    the image is the same as without the cache.
+    """
+
+    def __init__(self: Self, *args: Any) -> None:
+        super().__init__(*args)
+        self._static_key: tuple[Any, ...] | None = None
+        self._static_image: Any = None
+
+    def draw_map(self: Self, map_data: MapData) -> None:
+        if map_data.image is None:
+            return
+        static_count = 0
+        for drawable in self._drawables:
+            if drawable not in STATIC_DRAWABLES:
+                break
+            static_count += 1
+
+        if static_count > 0:
+            image = map_data.image
+            dimensions = image.dimensions
+            key = (
+                image.data.mode,
+                image.data.size,
+                image.data.tobytes(),
+                (dimensions.top, dimensions.left, dimensions.height, dimensions.width, dimensions.scale),
+                [getattr(map_data, name) for name in STATIC_MAP_ATTRIBUTES],
+            )
+            if key == self._static_key:
+                image.data = self._static_image.copy()
+            else:
+                self._draw_drawables(map_data, self._drawables[:static_count])
+                self._static_key = copy.deepcopy(key)
+                self._static_image = image.data.copy()
+
+        self._draw_drawables(map_data, self._drawables[static_count:])
+        self._rotate(map_data.image)
+        self._draw_texts(map_data.image, self._texts)
+
+    def _draw_drawables(self: Self, map_data: MapData, drawables: list[Drawable]) -> None:
+        for drawable in drawables:
+            if drawable == Drawable.CLEANED_AREA:
+                self._draw_layer(map_data, drawable)
+                continue
+            method = STATIC_DRAWABLES.get(drawable) or DYNAMIC_DRAWABLES.get(drawable)
+            if method is not None:
+                getattr(self, method)(map_data)
+
+
+def enable_render_cache(parser: MapDataParser, vacuum_config: VacuumConfig, cache_image: bool) -> None:
+    """
+    Makes the parser reuse the static parts of the map image between renders. cache_image also reuses the parsed
+    base image, for parsers whose image parser takes plain values.
+    """
+    parser._image_generator = CachingImageGenerator(
+        vacuum_config.palette,
+        vacuum_config.sizes,
+        vacuum_config.drawables,
+        vacuum_config.image_config,
+        vacuum_config.texts,
+    )
+    if cache_image:
+        parser._image_parser = CachingImageParser(parser._image_parser)
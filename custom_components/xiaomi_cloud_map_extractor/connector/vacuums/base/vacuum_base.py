@@ -29,6 +29,8 @@ class BaseXiaomiCloudVacuum(ABC):
     _sizes: Sizes
     _texts: list[Text]
     _store_map_path: str | None
+    _last_raw_map_data: bytes | None
+    _last_map_data: MapData | None
 
     def __init__(self: Self, vacuum_config: VacuumConfig) -> None:
         self.model = vacuum_config.model
@@ -42,6 +44,8 @@ class BaseXiaomiCloudVacuum(ABC):
         self._sizes = vacuum_config.sizes
         self._texts = vacuum_config.texts
         self._store_map_path = vacuum_config.store_map_path
+        self._last_raw_map_data = None
+        self._last_map_data = None
 
     @staticmethod
     @abstractmethod
@@ -87,14 +91,20 @@ class BaseXiaomiCloudVacuum(ABC):
         if self._store_map_path is not None:
             self.store_map(raw_map_data)
             map_stored = True
-        _LOGGER.debug("Parsing map...")
-        map_data = self.decode_and_parse(raw_map_data)
-        _LOGGER.debug("Parsed map: (%d x %d)", map_data.image.dimensions.height, map_data.image.dimensions.width)
-        if map_data is not None:
-            map_data.map_name = map_name
+        if raw_map_data == self._last_raw_map_data and self._last_map_data is not None:
+            # Idle vacuums keep uploading the same map, parsing and rendering it again gives the same result.
+            _LOGGER.debug("Map unchanged, reusing parsed map.")
+            map_data = self._last_map_data
         else:
-            _LOGGER.error("FailedMapParseException")
-            raise FailedMapParseException()
+            _LOGGER.debug("Parsing map...")
+            map_data = self.decode_and_parse(raw_map_data)
+            if map_data is None:
+                _LOGGER.error("FailedMapParseException")
+                raise FailedMapParseException()
+            _LOGGER.debug("Parsed map: (%d x %d)", map_data.image.dimensions.height, map_data.image.dimensions.width)
+            self._last_raw_map_data = raw_map_data
+            self._last_map_data = map_data
+        map_data.map_name = map_name
         return map_data, map_stored, raw_map_data
 
     async def get_raw_map_data(self: Self, map_name: str | None) -> bytes | None:
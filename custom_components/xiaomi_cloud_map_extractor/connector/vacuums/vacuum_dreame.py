@@ -7,6 +7,7 @@ from vacuum_map_parser_base.map_data import MapData
 
 from vacuum_map_parser_dreame.map_data_parser import DreameMapDataParser
 from .base.model import VacuumConfig, VacuumApi
+from .base.render_cache import enable_render_cache
 from .base.vacuum_v2 import BaseXiaomiCloudVacuumV2
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,6 +28,7 @@ class DreameCloudVacuum(BaseXiaomiCloudVacuumV2):
             vacuum_config.texts,
             vacuum_config.model,
         )
+        enable_render_cache(self._dreame_map_data_parser, vacuum_config, False)
         self._robot_stamp = 0
         self._enc_key = None
         self._dreame_vacuum = DreameVacuum(vacuum_config.host, vacuum_config.token, model=vacuum_config.model)
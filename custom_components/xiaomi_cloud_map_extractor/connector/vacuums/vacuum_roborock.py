@@ -5,6 +5,7 @@ from miio import RoborockVacuum, DeviceException
 
 from vacuum_map_parser_roborock.map_data_parser import RoborockMapDataParser
 from .base.model import VacuumConfig, VacuumApi
+from .base.render_cache import enable_render_cache
 from .base.vacuum_base import BaseXiaomiCloudVacuum
 from ..utils.backoff import Backoff
 from ..utils.exceptions import InvalidDeviceTokenException
@@ -30,6 +31,7 @@ class RoborockCloudVacuum(BaseXiaomiCloudVacuum):
             vacuum_config.image_config,
             vacuum_config.texts
         )
+        enable_render_cache(self._roborock_map_data_parser, vacuum_config, True)
         self._vacuum = RoborockVacuum(vacuum_config.host, vacuum_config.token)
         self._backoff = Backoff(0.2, 15)
         self._off_counter = 0
@@ -2,6 +2,7 @@ from typing import Self
 
 from vacuum_map_parser_roidmi.map_data_parser import RoidmiMapDataParser
 from .base.model import VacuumConfig, VacuumApi
+from .base.render_cache import enable_render_cache
 from .base.vacuum_v2 import BaseXiaomiCloudVacuumV2
 
 
@@ -17,6 +18,7 @@ class RoidmiCloudVacuum(BaseXiaomiCloudVacuumV2):
             vacuum_config.image_config,
             vacuum_config.texts
         )
+        enable_render_cache(self._roidmi_map_data_parser, vacuum_config, True)
 
     @staticmethod
     def vacuum_platform() -> VacuumApi:
@@ -2,6 +2,7 @@ from typing import Self
 
 from vacuum_map_parser_viomi.map_data_parser import ViomiMapDataParser
 from .base.model import VacuumConfig, VacuumApi
+from .base.render_cache import enable_render_cache
 from .base.vacuum_v2 import BaseXiaomiCloudVacuumV2
 
 
@@ -17,6 +18,7 @@ class ViomiCloudVacuum(BaseXiaomiCloudVacuumV2):
             vacuum_config.image_config,
             vacuum_config.texts
         )
+        enable_render_cache(self._viomi_map_data_parser, vacuum_config, False)
 
     @staticmethod
     def vacuum_platform() -> VacuumApi: